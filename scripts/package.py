@@ -28,6 +28,8 @@ from typing import Optional
 
 PATHS_DEPENDENCIES = [
     'project.dependencies',
+    # NOTE: the optional parsers are installed, so that the tests cover these.
+    'project.optional-dependencies.io',
     'project.optional-dependencies.test',
     'project.optional-dependencies.dev',
 ]
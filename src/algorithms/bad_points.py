@@ -6,10 +6,13 @@
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 from ..thirdparty.maths import *
+from ..thirdparty.nn import *
+from ..thirdparty.sync import *
+from ..thirdparty.types import *
 
 from ..core.utils import *
+from ..models.internal import *
 from .cycles import *
-from .peaks import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
@@ -27,25 +30,79 @@ __all__ = [
 
 def mark_pinched_points_on_cycles(
     x: np.ndarray,
-    cycles: list[int],
+    cycles: list[int] | CycleIndex,
     sig_t: float = 0.05,
-) -> list[bool]:
+    sig_x: float = 0.1,
+    workers: int = 1,
+) -> np.ndarray:
     '''
-    Cleans 'bad' parts of each cycle.
+    Cleans 'bad' parts of each cycle (cf. `mark_pinched_points_on_cycle`).
+
+    @inputs
+    - `x` - an `N x d` array of the points of all cycles.
+    - `cycles` - the cycles partitioning the points.
+    - `workers` - number of processes over which the cycles are distributed.
+
+    @returns
+    A boolean mask of length `N` marking the points to be removed.
+
+    NOTE: For `workers > 1` the (per cycle normalised) points are placed in shared memory once,
+    and each worker marks a chunk of cycles directly in a shared, preallocated mask.
     '''
-    # determine start and end of each cycle
+    N = x.shape[0]
+    x = x if x.ndim == 2 else x[:, np.newaxis]
     windows = cycles_to_windows(cycles)
-    # mark 'bad' parts of each cycle
-    marked = np.concatenate(
-        [mark_pinched_points_on_cycle(x=x[i1:i2, :], sig_t=sig_t) for i1, i2 in windows]
-    ).tolist()
+    if workers <= 1 or len(windows) < 2:
+        marked = np.zeros((N,), dtype=bool)
+        for i1, i2 in windows:
+            mark_pinched_points_normalised(
+                normalise_cycle(x[i1:i2, :]), sig_t=sig_t, sig_x=sig_x, out=marked[i1:i2]
+            )
+        return marked
+
+    shm_x = SharedMemory(create=True, size=max(x.size, 1) * np.dtype(float).itemsize)
+    shm_marked = SharedMemory(create=True, size=max(N, 1))
+    try:
+        x_shared = np.ndarray(x.shape, dtype=float, buffer=shm_x.buf)
+        marked_shared = np.ndarray((N,), dtype=bool, buffer=shm_marked.buf)
+        marked_shared[:] = False
+        for i1, i2 in windows:
+            x_shared[i1:i2, :] = normalise_cycle(x[i1:i2, :])
+
+        chunks = [
+            chunk for chunk in np.array_split(np.asarray(windows), workers) if len(chunk) > 0
+        ]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [
+                pool.submit(
+                    mark_pinched_points_in_shared_memory,
+                    shm_x.name,
+                    shm_marked.name,
+                    x.shape,
+                    chunk.tolist(),
+                    sig_t,
+                    sig_x,
+                )
+                for chunk in chunks
+            ]
+            for future in futures:
+                future.result()
+        marked = marked_shared.copy()
+        # NOTE: release the views before the buffers are closed.
+        del x_shared, marked_shared
+    finally:
+        for shm in [shm_x, shm_marked]:
+            shm.close()
+            shm.unlink()
+
     return marked
 
 
 def mark_pinched_points_on_cycle(
     x: np.ndarray,
     sig_t: float = 0.05,
-) -> list[bool]:
+    sig_x: float = 0.1,
+) -> np.ndarray:
     '''
     Removes spatial 'pinches' at start/end of parameterised curves.
 
@@ -55,56 +112,104 @@ def mark_pinched_points_on_cycle(
     - `x` - an `n x d` array. The (implicitly) parameterised set of points in the curve.
     - `sig_t` - a value in `[0, 1]`.
       Two points on a curve at times `t1`, `t2` are considered 'adjacent',
-      just in case `0 < |t1 - t2| < sig_t`.
+      just in case `0 < |t1 - t2| < sig_t` (modulo `1`).
+    - `sig_x` - a positive value.
+      Two points are considered 'close', just in case their distance is at most `sig_x`
+      (after normalisation of each coordinate, cf. `normalised_order_statistics`).
 
     @returns
-    A boolean list which marks which points belong to the 'pinch' (and thereby can be removed).
+    A boolean mask which marks which points belong to the 'pinch' (and thereby can be removed).
 
     What it does:
     Determines two intervals: `[0, t1]` and `[t2, 1]` such that
 
     1. For each `t[i] ∈ [0, t1] ∪ [t2, 1]` the point `x[i]`
-       is sufficiently close to a non-adjacent point on the curve.
+       is close to a non-adjacent point on the curve.
     2. For the first times `t[i]` respectively outside these time intervals,
-       the point `x[i]` is not sufficiently close to a non-adjacent point.
+       the point `x[i]` is not close to a non-adjacent point.
 
-    NOTE: Pinches that occur mid-cycle are *not* marked!
+    NOTE: Close points are found via radius queries on a KD-tree,
+    i.e. in `O(n log n)` time and without `n x n` distance matrices.
+    Pinches that occur mid-cycle are *not* marked!
     '''
+    return mark_pinched_points_normalised(normalise_cycle(x), sig_t=sig_t, sig_x=sig_x)
 
-    N = x.shape[0]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def normalise_cycle(x: np.ndarray) -> np.ndarray:
+    '''
+    @returns
+    a copy of the points of a cycle with each coordinate normalised
+    (cf. `normalised_order_statistics`) and scaled by `1/√d`.
+    '''
     m = x.shape[1]
-    marked = [False] * N
-    d_min = round(1 / sig_t)
+    if x.shape[0] == 0:
+        return np.zeros(x.shape, dtype=float)
+    x = np.column_stack([normalised_order_statistics(x[:, j]) for j in range(m)])
+    return x / math.sqrt(m)
 
-    # normalise quantities
-    t = np.linspace(start=0, stop=1, num=N, endpoint=False)
-    for j in range(m):
-        x[:, j] = normalised_order_statistics(x[:, j])
 
-    # compute distance matrices
-    dt = np.abs(t[:, np.newaxis] - t)
+def mark_pinched_points_normalised(
+    x: np.ndarray,
+    sig_t: float,
+    sig_x: float,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    '''
+    Marks the pinch of a normalised cycle (cf. `mark_pinched_points_on_cycle`),
+    writing into `out` if provided.
+    '''
+    N = x.shape[0]
+    marked = np.zeros((N,), dtype=bool) if out is None else out
+    marked[:] = False
+    if N < 3:
+        return marked
+
+    # determine points which are close to non-adjacent points
+    neighbours = radius_neighbours(x, r=sig_x)
+    counts = np.asarray([len(indices) for indices in neighbours], dtype=int)
+    i = np.repeat(np.arange(N), counts)
+    j = np.concatenate(neighbours)
+    dt = np.abs(i - j) / N
     dt = np.minimum(dt, 1 - dt)
-    dx = np.linalg.norm(x[:, np.newaxis] - x, axis=2) / math.sqrt(m)
+    pinched = np.bincount(i, weights=dt >= sig_t, minlength=N) > 0
 
-    # NOTE: artificially increase curve-distance values of adjacent-points
-    # to avoid these being candidates for detecting pinches.
-    C = np.max(dx) + 1.0
-    dx[(0 < dt) & (dt < sig_t)] = 2 * C
-
-    # NOTE: Search in window from start for points that are
+    # NOTE: Search in window from start resp. end for points that are
     # 'close' to non-adjacent points on curve.
-    for i in range(N):
-        peaks = get_peaks_simple(C - dx[i, :], add_end=False, distance=d_min, prominence=0.5)
-        if peaks == [i] or len(peaks) == 0:
-            break
-        marked[i] = True
+    n1 = N if np.all(pinched) else int(np.argmin(pinched))
+    n2 = N if np.all(pinched) else int(np.argmin(pinched[::-1]))
+    marked[:n1] = True
+    marked[N - n2 :] = True
+    return marked
 
-    # NOTE: Search in window from end for points that are
-    # 'close' to non-adjacent points on curve.
-    for i in range(N)[::-1]:
-        peaks = get_peaks_simple(C - dx[i, :], add_end=False, distance=d_min, prominence=0.5)
-        if peaks == [i] or len(peaks) == 0:
-            break
-        marked[i] = True
 
-    return marked
+def mark_pinched_points_in_shared_memory(
+    name_x: str,
+    name_marked: str,
+    shape: tuple[int, int],
+    windows: list[tuple[int, int]],
+    sig_t: float,
+    sig_x: float,
+):
+    '''
+    Worker task: marks the pinches of the cycles `windows`
+    of the normalised points in shared memory.
+    '''
+    shm_x = SharedMemory(name=name_x)
+    shm_marked = SharedMemory(name=name_marked)
+    try:
+        x = np.ndarray(shape, dtype=float, buffer=shm_x.buf)
+        marked = np.ndarray(shape[:1], dtype=bool, buffer=shm_marked.buf)
+        for i1, i2 in windows:
+            mark_pinched_points_normalised(
+                x[i1:i2, :], sig_t=sig_t, sig_x=sig_x, out=marked[i1:i2]
+            )
+        del x, marked
+    finally:
+        shm_x.close()
+        shm_marked.close()
+    return
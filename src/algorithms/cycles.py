@@ -8,6 +8,7 @@
 from ..thirdparty.maths import *
 
 from ..core.utils import *
+from ..models.internal import *
 from .peaks import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -17,6 +18,7 @@ from .peaks import *
 __all__ = [
     'cycles_to_windows',
     'get_cycles',
+    'get_rotation_indices',
 ]
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -24,20 +26,17 @@ __all__ = [
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
-def cycles_to_windows(cycles: list[int]) -> list[tuple[int, int]]:
+def cycles_to_windows(cycles: list[int] | np.ndarray | CycleIndex) -> list[tuple[int, int]]:
     '''
-    Turns a list indicating cycle indexes into a list
+    Turns a list indicating cycle indexes (or a cycle index) into a list
     of pairs of endpoints of the cycles.
 
     E.g. if the input is `[0, 0, 0, 1, 1, 2, 2, 2]`,
     the output is `[(0, 3), (3, 5), (5, 8)]`.
     '''
-    c_min = min(cycles + [0])
-    c_max = max(cycles + [0])
-    cycles = [c_min - 1] + cycles + [c_max + 1]
-    peaks = characteristic_to_where(np.diff(cycles) != 0)
-    windows = list(zip(peaks, peaks[1:]))
-    return windows
+    if not isinstance(cycles, CycleIndex):
+        cycles = CycleIndex.from_labels(cycles)
+    return cycles.windows()
 
 
 def get_cycles(
@@ -45,7 +44,11 @@ def get_cycles(
     N: int,
     remove_gaps: bool,
     sig: float = 2.0,
-) -> list[int]:
+) -> np.ndarray:
+    '''
+    @returns
+    the cycle id of each point, where points not belonging to a cycle are marked by `-1`.
+    '''
     cycles = -1 * np.ones(shape=(N,), dtype=int)
 
     # if there is are least 2 extreme points, sift out 'bad' cycles
@@ -67,4 +70,34 @@ def get_cycles(
     if max(cycles) < 0:
         cycles = np.zeros(shape=(N,), dtype=int)
 
-    return cycles.tolist()
+    return cycles
+
+
+def get_rotation_indices(
+    N: int,
+    windows: list[tuple[int, int]],
+    shifts: list[int],
+) -> np.ndarray:
+    '''
+    Computes the gather index, which rotates the rows within each window `(i1, i2)`,
+    so that row `i1 + shift` becomes the first of the window.
+    Rows outside the windows are not moved.
+
+    E.g. for `N = 6`, `windows = [(0, 3), (3, 6)]` and `shifts = [1, 0]`,
+    the output is `[1, 2, 0, 3, 4, 5]`.
+    '''
+    indices = np.arange(N)
+    windows = np.asarray(windows, dtype=int).reshape((-1, 2))
+    starts = windows[:, 0]
+    lengths = windows[:, 1] - starts
+    if np.sum(lengths) == 0:
+        return indices
+    shifts = np.asarray(shifts, dtype=int)
+    # position of every row of the windows relative to the start of its window
+    offsets = np.cumsum(lengths) - lengths
+    j = np.arange(np.sum(lengths)) - np.repeat(offsets, lengths)
+    starts = np.repeat(starts, lengths)
+    indices[starts + j] = starts + (j + np.repeat(shifts, lengths)) % np.repeat(
+        lengths, lengths
+    )
+    return indices
@@ -22,6 +22,8 @@ from ..models.internal import *
 __all__ = [
     'fit_poly_cycle',
     'fit_poly_cycles',
+    'get_cycle_conditions',
+    'normalise_cycle',
 ]
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -32,7 +34,7 @@ __all__ = [
 def fit_poly_cycles(
     t: np.ndarray,
     x: np.ndarray,
-    cycles: list[int],
+    cycles: list[int] | CycleIndex,
     conds: list[PolyCritCondition | PolyDerCondition | PolyIntCondition],
 ) -> list[tuple[tuple[int, int], FittedInfo]]:
     '''
@@ -43,27 +45,35 @@ def fit_poly_cycles(
     # determine start and end of each cycle
     windows = cycles_to_windows(cycles)
 
-    # due to normalisation (drift-removal), force extra boundary conditions
-    conds = conds[:]
-    conds.append(PolyDerCondition(derivative=0, time=0.0))
-    conds.append(PolyDerCondition(derivative=0, time=1.0))
-    # conds.append(PolyIntCondition(times=[TimeInterval(a=0., b=1.)]))
-
     # refine conditions + determine degree of polynomial needed
-    conds, deg = refine_conditions_determine_degree(conds)
+    conds, deg = get_cycle_conditions(conds)
 
-    # fit each cycle
-    fitinfos = []
+    # normalise each cycle
+    params = []
+    tt_all = []
+    xx_all = []
     for i1, i2 in windows:
-        # scale time
-        tt, T = normalise_to_unit_interval(t[i1:i2])
-        # remove drift
-        c, m, s, xx = normalise_interpolated_drift(tt, x[i1:i2], T=1, periodic=True)
-        # compute fitted curve
-        coeff = fit_poly_cycle(t=tt, x=xx, deg=deg, conds=conds)
-        params = FittedInfoNormalisation(period=T, intercept=c, gradient=m, scale=s)
-        info = FittedInfo(coefficients=coeff, normalisation=params)
-        fitinfos.append(((i1, i2), info))
+        params_, tt, xx = normalise_cycle(t[i1:i2], x[i1:i2])
+        params.append(params_)
+        tt_all.append(tt)
+        xx_all.append(xx)
+
+    # compute fitted curves of all cycles at once
+    # NOTE: deg + conds are the same for every cycle, so the ONB is cached
+    Q = onb_conditions_cached(deg=deg, conds=conds)
+    offsets = np.cumsum([0] + [i2 - i1 for i1, i2 in windows])
+    coeffs = onb_spectrum_batch(
+        Q=Q,
+        t=np.concatenate(tt_all or [[]]),
+        x=np.concatenate(xx_all or [[]]),
+        offsets=offsets,
+        T=1.0,
+        in_standard_basis=True,
+    )
+    fitinfos = [
+        ((i1, i2), FittedInfo(coefficients=coeff.tolist(), normalisation=params_))
+        for (i1, i2), coeff, params_ in zip(windows, coeffs, params)
+    ]
 
     # --------------------------------
     # NOTE:
@@ -105,6 +115,8 @@ def fit_poly_cycles(
     info = FittedInfo(coefficients=coeff, normalisation=params)
     fitinfos.append(((-1, -1), info))
 
+    log_debug(f'ONB cache: {get_onb_cache_info()}.')
+
     return fitinfos
 
 
@@ -129,11 +141,47 @@ def fit_poly_cycle(
       over time uniformly on `[0, T]`.
     - the fit polynomial
     '''
-    Q = onb_conditions(deg=deg, conds=conds)
+    # NOTE: deg + conds are the same for every cycle, so the ONB is cached
+    Q = onb_conditions_cached(deg=deg, conds=conds)
     coeff = onb_spectrum(t=t, x=x, Q=Q, T=1, in_standard_basis=True)
     return coeff
 
 
+def get_cycle_conditions(
+    conds: list[PolyCritCondition | PolyDerCondition | PolyIntCondition],
+) -> tuple[list[PolyDerCondition | PolyIntCondition], int]:
+    '''
+    Prepares the conditions for fitting (normalised) cycles
+    and determines the degree of polynomial needed.
+    '''
+    # due to normalisation (drift-removal), force extra boundary conditions
+    conds = conds[:]
+    conds.append(PolyDerCondition(derivative=0, time=0.0))
+    conds.append(PolyDerCondition(derivative=0, time=1.0))
+    # conds.append(PolyIntCondition(times=[TimeInterval(a=0., b=1.)]))
+    return refine_conditions_determine_degree(conds)
+
+
+def normalise_cycle(
+    t: np.ndarray,
+    x: np.ndarray,
+) -> tuple[FittedInfoNormalisation, np.ndarray, np.ndarray]:
+    '''
+    Scales the time of a cycle to `[0, 1]` and removes the drift of the values.
+
+    @returns
+    - the normalisation parameters
+    - the normalised times
+    - the normalised values
+    '''
+    # scale time
+    tt, T = normalise_to_unit_interval(t)
+    # remove drift
+    c, m, s, xx = normalise_interpolated_drift(tt, x, T=1, periodic=True)
+    params = FittedInfoNormalisation(period=T, intercept=c, gradient=m, scale=s)
+    return params, tt, xx
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # AUXILIARY METHODS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
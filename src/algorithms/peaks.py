@@ -5,7 +5,9 @@
 # IMPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+from ..thirdparty.code import *
 from ..thirdparty.maths import *
+from ..thirdparty.sync import *
 from ..thirdparty.types import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -13,30 +15,310 @@ from ..thirdparty.types import *
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'ExtremaDetector',
+    'estimate_cycle_duration_acf',
+    'estimate_cycle_durations_acf',
+    'estimate_peak_width',
     'get_extremes',
+    'get_extremes_in_blocks',
     'get_peaks_simple',
 ]
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# NOTE: minimal period (in decimated samples) to be resolved by the autocorrelation.
+MIN_PERIOD_ACF = 16
+# NOTE: secondary peaks of the autocorrelation (e.g. multiples of the period)
+# are preferred, if they are at least this fraction of the main peak.
+SIG_PEAK_ACF = 0.8
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CLASSES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@dataclass
+class ExtremaDetector:
+    '''
+    Online detector of peaks and troughs, which processes each sample in `O(1)`
+    and emits the (absolute) indices of extrema as samples arrive (cf. `push`).
+
+    Extrema are detected as in `get_extremes`, replacing
+    - the normalisation of values by a running robust location + scale
+      (median + median absolute deviation), initialised on the first `warmup` samples
+      and subsequently adapted via stochastic (sign) updates of rate `adapt`;
+    - the prominence criterion by hysteresis: a peak (trough) is confirmed,
+      once the values have fallen (risen) by `sig_prominence · scale` below (above) it;
+    - the distance criterion by a pending extremum, which is replaced by
+      a more extreme one within `width` samples, and emitted once `width` samples have passed.
+
+    The peak width is estimated on the warmup samples (cf. `estimate_peak_width`).
+
+    NOTE: On stationary offline data (with the warmup covering several cycles)
+    the extrema agree with `get_extremes` apart from those within `width` samples
+    of the end of the signal, provided the noise is small compared to the scale.
+    Measured on synthetic cycles with white noise (cf. tests), they agree exactly
+    for noise (standard deviation) of up to 5% of the scale (median absolute deviation).
+    Beyond this, noise creates nested extrema (e.g. at notches) of borderline prominence,
+    which the methods judge differently, as the running scale deviates by a few percent
+    from that of the entire series: up to about 1 in 8 extrema differ at 10%
+    and up to about 2 in 5 at 20% of the scale.
+    The agreement also requires a meaningful estimate of the width (`width ≫ 1`).
+    Unlike `get_extremes` there is no fallback to the global maximum if no peaks are found.
+    '''
+
+    warmup: int = field(default=4096)
+    sig_width: float = field(default=1 / math.sqrt(2))
+    sig_prominence: float = field(default=1.0)
+    adapt: float = field(default=1e-3)
+    # internal state
+    num_samples: int = field(default=0, init=False)
+    width: Optional[int] = field(default=None, init=False)
+    loc: float = field(default=0.0, init=False, repr=False)
+    scale: float = field(default=1.0, init=False, repr=False)
+    buffer: list[np.ndarray] = field(default_factory=list, init=False, repr=False)
+    searching: int = field(default=0, init=False, repr=False)
+    candidates: list[tuple[int, float]] = field(default_factory=list, init=False, repr=False)
+    left: list[float] = field(default_factory=list, init=False, repr=False)
+    pending: list[Optional[tuple[int, float]]] = field(default_factory=list, init=False, repr=False)  # fmt: skip
+
+    def __post_init__(self):
+        # NOTE: candidates + pending extrema for peaks (index 0) and troughs (index 1)
+        self.candidates = [(-1, -math.inf), (-1, math.inf)]
+        self.left = [math.inf, -math.inf]
+        self.pending = [None, None]
+        return
+
+    def push(self, values: Iterable[float]) -> tuple[list[int], list[int]]:
+        '''
+        Ingests a chunk of samples.
+
+        @returns
+        the indices of peaks resp. troughs confirmed by these samples.
+        '''
+        values = np.asarray(values, dtype=float).reshape((-1,))
+        if self.width is None:
+            self.buffer.append(values)
+            if sum(len(chunk) for chunk in self.buffer) < self.warmup:
+                return [], []
+            values = np.concatenate(self.buffer)
+            self.buffer = []
+            self.estimate(values)
+
+        extrema = ([], [])
+        for x in values.tolist():
+            self.update(x, extrema)
+        return extrema
+
+    def flush(self) -> tuple[list[int], list[int]]:
+        '''
+        Signals the end of the signal.
+
+        @returns
+        the indices of the remaining peaks resp. troughs.
+        '''
+        extrema = ([], [])
+        if self.width is None:
+            values = np.concatenate([np.zeros((0,)), *self.buffer])
+            self.buffer = []
+            if len(values) == 0:
+                return extrema
+            self.estimate(values)
+            for x in values.tolist():
+                self.update(x, extrema)
+        for k, pending in enumerate(self.pending):
+            if pending is not None:
+                extrema[k].append(pending[0])
+            self.pending[k] = None
+        return extrema
+
+    def estimate(self, values: np.ndarray):
+        '''
+        Initialises the normalisation and the peak width as in `get_extremes`.
+        '''
+        self.loc = float(np.median(values))
+        self.scale = float(np.median(np.abs(values - self.loc))) or 1.0
+        values = (values - self.loc) / self.scale
+        self.width = estimate_peak_width(values, sig_width=self.sig_width)
+        return
+
+    def update(self, x: float, extrema: tuple[list[int], list[int]]):
+        '''
+        Processes a single sample, appending confirmed extrema.
+        '''
+        i = self.num_samples
+        self.num_samples += 1
+
+        # emit pending extrema, which can no longer be replaced
+        for k, pending in enumerate(self.pending):
+            if pending is not None and i - pending[0] >= self.width:
+                extrema[k].append(pending[0])
+                self.pending[k] = None
+
+        # update candidates
+        (i_max, x_max), (i_min, x_min) = self.candidates
+        if x > x_max:
+            i_max, x_max = i, x
+            self.left[0] = x_min
+        if x < x_min:
+            i_min, x_min = i, x
+            self.left[1] = x_max
+        self.candidates = [(i_max, x_max), (i_min, x_min)]
+
+        # hysteresis (NOTE: `searching` = 0 if undetermined, +1 for peaks, -1 for troughs)
+        # NOTE: while undetermined, the first extremum also requires prominence to the left.
+        delta = self.sig_prominence * self.scale
+        if self.searching >= 0 and x <= x_max - delta:
+            if self.searching > 0 or x_max - self.left[0] >= delta:
+                self.confirm(0, i_max, x_max)
+            self.searching = -1
+            self.candidates[1] = (i, x)
+        elif self.searching <= 0 and x >= x_min + delta:
+            if self.searching < 0 or self.left[1] - x_min >= delta:
+                self.confirm(1, i_min, x_min)
+            self.searching = 1
+            self.candidates[0] = (i, x)
+
+        # adapt normalisation
+        dx = x - self.loc
+        self.loc += self.adapt * self.scale * ((dx > 0) - (dx < 0))
+        dev = abs(dx) - self.scale
+        self.scale += self.adapt * self.scale * ((dev > 0) - (dev < 0))
+        return
+
+    def confirm(self, k: int, i: int, x: float):
+        '''
+        Registers a peak (`k = 0`) resp. trough (`k = 1`),
+        which replaces a less extreme pending one within `width` samples.
+        '''
+        # NOTE: as for `sps.find_peaks` extrema at the boundary are excluded.
+        if i == 0:
+            return
+        sign = 1 if k == 0 else -1
+        pending = self.pending[k]
+        if pending is None or sign * x > sign * pending[1]:
+            self.pending[k] = (i, x)
+        return
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
 def get_extremes(
-    values: np.ndarray, sig_width: float = 1 / math.sqrt(2)
+    values: np.ndarray,
+    sig_width: float = 1 / math.sqrt(2),
+    workers: int = 1,
+    block_size: Optional[int] = None,
 ) -> tuple[list[int], list[int]]:
-    N_values = len(values)
+    '''
+    @inputs
+    - `values` - the series.
+    - `sig_width` - minimal distance between peaks, relative to half a cycle.
+    - `workers` - number of processes over which blocks of the series are distributed.
+    - `block_size` - number of samples per block (cf. `get_extremes_in_blocks`).
+
+    @returns
+    the indices of the peaks and troughs.
+    '''
     # first make data as symmetric as possible
     values = normalised_order_statistics(values)
-    # preliminary computation of peaks
-    peaks = get_peaks_simple(abs(values))
-    # estimate cycle length
-    peaks.append(N_values)
-    N = estimate_cycle_duration(peaks) or N_values
-    width = round(sig_width * N) or 1.0
+    width = estimate_peak_width(values, sig_width=sig_width)
     # re-compute peaks
-    peaks = get_peaks_simple(values, distance=width, prominence=1)
-    troughs = get_peaks_simple(-values, distance=width, prominence=1)
+    if workers > 1 and block_size is not None and len(values) > block_size:
+        peaks, troughs = get_extremes_in_blocks(
+            values, width, workers=workers, block_size=block_size
+        )
+    else:
+        peaks = find_peaks_stable(values, distance=width, prominence=1).tolist()
+        troughs = find_peaks_stable(-values, distance=width, prominence=1).tolist()
+    # NOTE: as for `get_peaks_simple` force lists to be non-empty.
+    if len(peaks) == 0 and len(values) > 0:
+        peaks = [int(np.argmax(values))]
+    if len(troughs) == 0 and len(values) > 0:
+        troughs = [int(np.argmax(-values))]
+    return peaks, troughs
+
+
+def get_extremes_in_blocks(
+    values: np.ndarray,
+    width: int,
+    workers: int,
+    block_size: int,
+    overlap: Optional[int] = None,
+) -> tuple[list[int], list[int]]:
+    '''
+    Computes the peaks and troughs of the (normalised) values as in `get_extremes`,
+    distributing blocks of the series over a pool of processes.
+
+    @inputs
+    - `values` - the normalised series (cf. `normalised_order_statistics`).
+    - `width` - the minimal distance between peaks.
+    - `workers` - number of processes.
+    - `block_size` - number of samples per block, excluding the overlap.
+    - `overlap` - number of samples by which blocks are extended on either side
+      (default: two estimated cycles, cf. `estimate_cycle_duration_acf`).
+
+    @returns
+    the indices of the peaks and troughs (without the fallback in `get_extremes`).
+
+    NOTE: The series is placed in shared memory once, so that each worker
+    only allocates memory for its block. Each block only reports the extrema
+    in its own (disjoint) core, so that no duplicates arise at the seams.
+    The result equals that of `find_peaks_stable` on the entire series, since
+    - the selection of peaks by distance within a core only depends on the block,
+      provided the overlaps each contain a 'barrier', i.e. a peak, which takes precedence
+      over all local maxima within `width` samples. Blocks without barriers are widened
+      (by doubling their overlap) until they contain barriers or the entire series.
+    - prominences, for which the search for higher values reaches the ends of a block,
+      are recomputed on the entire series.
+    '''
+    N = len(values)
+    if overlap is None:
+        overlap = 2 * (estimate_cycle_duration_acf(values) or N)
+    overlap = max(overlap, 2 * width)
+    cores = [(i1, min(i1 + block_size, N)) for i1 in range(0, N, block_size)]
+
+    overlaps = {core: overlap for core in cores}
+    results = {}
+
+    shm = SharedMemory(create=True, size=max(N, 1) * np.dtype(float).itemsize)
+    try:
+        values_shared = np.ndarray((N,), dtype=float, buffer=shm.buf)
+        values_shared[:] = values
+        del values_shared
+        with ProcessPoolExecutor(max_workers=min(workers, len(cores))) as pool:
+            while len(overlaps) > 0:
+                futures = {
+                    (i1, i2): pool.submit(
+                        get_extremes_in_shared_block,
+                        shm.name,
+                        N,
+                        width,
+                        (max(i1 - overlap, 0), min(i2 + overlap, N)),
+                        (i1, i2),
+                    )
+                    for (i1, i2), overlap in overlaps.items()
+                }
+                # widen failed blocks
+                # NOTE: a block covering the entire series never fails.
+                retry = {}
+                for core, future in futures.items():
+                    result = future.result()
+                    if result is None:
+                        retry[core] = 2 * overlaps[core]
+                    else:
+                        results[core] = result
+                overlaps = retry
+    finally:
+        shm.close()
+        shm.unlink()
+
+    peaks = [i for core in cores for i in results[core][0]]
+    troughs = [i for core in cores for i in results[core][1]]
     return peaks, troughs
 
 
@@ -70,13 +352,248 @@ def get_peaks_simple(values: np.ndarray, **kwargs) -> list[int]:
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
-def estimate_cycle_duration(peaks: Iterable) -> int:
-    N = 0
-    if len(peaks) > 1:
-        # compute differences between elements
-        delta = np.diff(peaks)
-        # remove outliers
-        delta = remove_outliers(delta)
-        # compute minimal difference (excl. outliers)
-        N = round(min(delta))
-    return N
+def find_peaks_stable(
+    values: np.ndarray,
+    distance: int,
+    prominence: Optional[float] = None,
+) -> np.ndarray:
+    '''
+    Computes `sps.find_peaks(values, distance=distance, prominence=prominence)`,
+    except that of peaks of equal height the leftmost takes precedence in the selection by distance.
+
+    NOTE: `sps.find_peaks` orders peaks of equal height by an unstable sort,
+    so that on quantised series the selected peaks depend on the length of the series.
+    '''
+    peaks, _ = sps.find_peaks(values)
+    # rank peaks by height and, if equal, the leftmost highest
+    priority = np.empty((len(peaks),), dtype=float)
+    priority[np.lexsort((-peaks, values[peaks]))] = np.arange(len(peaks))
+    peaks = peaks[select_by_peak_distance(peaks, priority, distance)]
+    if prominence is not None and len(peaks) > 0:
+        prominences, _, _ = sps.peak_prominences(values, peaks)
+        peaks = peaks[prominences >= prominence]
+    return peaks
+
+
+def estimate_peak_width(values: np.ndarray, sig_width: float = 1 / math.sqrt(2)) -> int:
+    '''
+    Estimates the minimal distance between peaks from the (normalised) values,
+    as `sig_width` times the half-cycle (cf. `estimate_cycle_duration_acf`).
+
+    NOTE: The half-cycle corresponds to the previous estimate
+    based on the peaks of `|values|`, i.e. of both peaks and troughs.
+    '''
+    N = estimate_cycle_duration_acf(values) or len(values)
+    return round(sig_width * N / 2) or 1
+
+
+def estimate_cycle_duration_acf(values: np.ndarray, max_samples: int = 2**14) -> int:
+    '''
+    Estimates the dominant period (in samples) of a signal
+    via its autocorrelation, computed by FFT in `O(N log N)`.
+
+    @inputs
+    - `values` - the signal.
+    - `max_samples` - the signal is decimated (via block averages)
+      to at most this many samples before computing the autocorrelation.
+      Should the period of the decimated signal be too short to be resolved,
+      it is re-estimated on the central `max_samples` samples (without decimation).
+
+    @returns
+    the period (or `0` if no periodicity is detected).
+    '''
+    values = np.asarray(values, dtype=float)
+    N = len(values)
+    q = max(math.ceil(N / max_samples), 1)
+    period = get_period_acf(decimate_by_blocks(values, q=q))
+    if q > 1 and 0 < period < MIN_PERIOD_ACF:
+        i1 = (N - max_samples) // 2
+        return round(get_period_acf(values[i1 : i1 + max_samples]))
+    return round(q * period)
+
+
+def estimate_cycle_durations_acf(
+    values: np.ndarray,
+    window: int,
+    hop: Optional[int] = None,
+    max_samples: int = 2**14,
+) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Estimates the period on sliding windows (e.g. to track changes in the heart rate),
+    cf. `estimate_cycle_duration_acf`.
+
+    @inputs
+    - `window` - the length of the windows (should contain several cycles).
+    - `hop` - the offset between consecutive windows (default: half a window).
+
+    @returns
+    the centres of the windows and the period in each (or `0`).
+    '''
+    N = len(values)
+    hop = hop or max(window // 2, 1)
+    starts = np.arange(0, max(N - window, 0) + 1, hop)
+    centres = np.minimum(starts + window // 2, N)
+    periods = np.asarray(
+        [estimate_cycle_duration_acf(values[i : i + window], max_samples) for i in starts],
+        dtype=int,
+    )
+    return centres, periods
+
+
+def decimate_by_blocks(values: np.ndarray, q: int) -> np.ndarray:
+    '''
+    Decimates by a factor of `q` via averages over blocks (dropping an incomplete last block).
+    '''
+    if q <= 1:
+        return values
+    n = len(values) // q
+    return values[: n * q].reshape((n, q)).mean(axis=1)
+
+
+def get_period_acf(values: np.ndarray) -> float:
+    '''
+    @returns
+    the lag of the dominant peak of the autocorrelation
+    beyond its first zero (or `0` if there is none),
+    refined by parabolic interpolation.
+    '''
+    n = len(values)
+    if n < 4:
+        return 0
+    x = values - np.mean(values)
+    # NOTE: zero-padding avoids circular wrap-around
+    n_fft = sp.fft.next_fast_len(2 * n, real=True)
+    spectrum = np.fft.rfft(x, n=n_fft)
+    acf = np.fft.irfft(spectrum.real**2 + spectrum.imag**2, n=n_fft)[: n // 2 + 1]
+    if acf[0] <= 0:
+        return 0
+    acf /= acf[0]
+
+    # NOTE: peaks of the (biased) autocorrelation beyond the first zero
+    (negative,) = np.where(acf < 0)
+    if len(negative) == 0:
+        return 0
+    peaks, _ = sps.find_peaks(acf[negative[0] :])
+    if len(peaks) == 0:
+        return 0
+    peaks = peaks + negative[0]
+    peaks = peaks[acf[peaks] > 0]
+    if len(peaks) == 0:
+        return 0
+    k = int(peaks[np.argmax(acf[peaks] >= SIG_PEAK_ACF * np.max(acf[peaks]))])
+
+    # parabolic interpolation
+    a, b, c = acf[k - 1 : k + 2] if k + 1 < len(acf) else (0, 0, 0)
+    denom = a - 2 * b + c
+    shift = 0.5 * (a - c) / denom if denom < 0 else 0.0
+    return k + shift
+
+
+def get_extremes_in_shared_block(
+    name: str,
+    N: int,
+    width: int,
+    block: tuple[int, int],
+    core: tuple[int, int],
+) -> Optional[tuple[list[int], list[int]]]:
+    '''
+    Worker task: computes the peaks and troughs within the `core` of a `block`
+    of the normalised series in shared memory (cf. `get_extremes_in_blocks`).
+    '''
+    shm = SharedMemory(name=name)
+    try:
+        values = np.ndarray((N,), dtype=float, buffer=shm.buf)
+        result = tuple(
+            get_peaks_in_block(values, sign=sign, width=width, block=block, core=core)
+            for sign in [1, -1]
+        )
+        del values
+    finally:
+        shm.close()
+    if any(peaks is None for peaks in result):
+        return None
+    return result
+
+
+def get_peaks_in_block(
+    values: np.ndarray,
+    sign: int,
+    width: int,
+    block: tuple[int, int],
+    core: tuple[int, int],
+) -> Optional[list[int]]:
+    '''
+    Computes `find_peaks_stable(sign * values, distance=width, prominence=1)`
+    restricted to the `core` of a `block`, or `None` if this is not possible exactly.
+    '''
+    a, b = block
+    N = len(values)
+    x = sign * values[a:b]
+    peaks = find_peaks_stable(x, distance=width)
+
+    # ensure that the selection by distance is independent of values outside the block
+    if a > 0 and not has_barrier(x, peaks, width=width, window=(0, core[0] - a)):
+        return None
+    if b < N and not has_barrier(x, peaks, width=width, window=(core[1] - a, b - a)):
+        return None
+
+    peaks = peaks[(peaks >= core[0] - a) & (peaks < core[1] - a)]
+    if len(peaks) == 0:
+        return []
+    prominences, _, _ = sps.peak_prominences(x, peaks)
+
+    # recompute prominences, for which no higher values exist within the block
+    # NOTE: peaks never lie at the ends of the block, so the neighbours exist.
+    uncertain = np.zeros((len(peaks),), dtype=bool)
+    if a > 0:
+        uncertain |= np.maximum.accumulate(x)[peaks - 1] <= x[peaks]
+    if b < N:
+        uncertain |= np.maximum.accumulate(x[::-1])[::-1][peaks + 1] <= x[peaks]
+    for k in np.flatnonzero(uncertain):
+        prominences[k] = get_prominence(values, a + int(peaks[k]), sign=sign)
+
+    return (peaks[prominences >= 1] + a).tolist()
+
+
+def has_barrier(
+    x: np.ndarray,
+    peaks: np.ndarray,
+    width: int,
+    window: tuple[int, int],
+) -> bool:
+    '''
+    Determines whether a peak within `window` takes precedence (cf. `find_peaks_stable`)
+    over all local maxima within `width` samples (which must lie within `x`),
+    i.e. no value is higher and values of equal height to the left belong to its own plateau.
+    '''
+    i1, i2 = window
+    for p in peaks[(peaks >= max(i1, width - 1)) & (peaks < min(i2, len(x) - width + 1))]:
+        if np.any(x[p - width + 1 : p + width] > x[p]):
+            continue
+        (equal,) = np.where(x[p - width + 1 : p] == x[p])
+        if len(equal) == 0 or equal[0] == width - 1 - len(equal):
+            return True
+    return False
+
+
+def get_prominence(values: np.ndarray, peak: int, sign: int = 1, chunk: int = 2**16) -> float:
+    '''
+    Computes the prominence of a peak of `sign * values` as `sps.peak_prominences`
+    (without `wlen`), scanning the values in chunks to bound the memory.
+    '''
+    N = len(values)
+    x_peak = sign * values[peak]
+    left = [(max(i - chunk, 0), i) for i in range(peak, 0, -chunk)]
+    right = [(i, min(i + chunk, N)) for i in range(peak + 1, N, chunk)]
+    mins = []
+    for windows, step in [(left, -1), (right, 1)]:
+        x_min = x_peak
+        for i1, i2 in windows:
+            # NOTE: scan away from the peak until a higher value is reached
+            x = sign * values[i1:i2][::step]
+            (above,) = np.where(x > x_peak)
+            x_min = min(x_min, np.min(x[: above[0]] if len(above) > 0 else x, initial=x_min))
+            if len(above) > 0:
+                break
+        mins.append(x_min)
+    return x_peak - max(mins)
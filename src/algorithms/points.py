@@ -6,6 +6,7 @@
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 from ..thirdparty.maths import *
+from ..thirdparty.types import *
 
 from ..core.log import *
 from ..core.constants import *
@@ -21,10 +22,34 @@ from ..models.app import *
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'SpecialPointsNotFound',
     'recognise_special_points',
+    'recognise_special_points_for_cycles',
     'sort_special_points_specs',
 ]
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# NOTE: Critical points are only sought in [0, 1]. Roots slightly outside
+# are kept, as the classification grid depends on neighbouring critical points.
+ROOTS_T_MIN = -1.0
+ROOTS_T_MAX = 2.0
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CLASSES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class SpecialPointsNotFound(Exception):
+    '''
+    Raised if the special points cannot be recognised in a fitted cycle.
+    '''
+
+    pass
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -50,33 +75,69 @@ def sort_special_points_specs(
     return [(u, points[u]) for u in nodes]
 
 
+def recognise_special_points_for_cycles(
+    infos: list[FittedInfo],
+    points: list[tuple[str, SpecialPointsConfig]],
+) -> list[dict[str, SpecialPointsConfig]]:
+    '''
+    Same as `recognise_special_points` applied to each fitted cycle,
+    but computes the real roots of all derivatives of all cycles in one batch.
+    '''
+    if len(points) == 0:
+        return [{} for _ in infos]
+
+    n_der = get_max_derivative(points)
+    dxs = [get_derivatives(info.coefficients, n=n_der + 1) for info in infos]
+    roots = get_real_polynomial_roots_batch(
+        [dx_k for dx in dxs for dx_k in dx], t_min=ROOTS_T_MIN, t_max=ROOTS_T_MAX
+    )
+    m = n_der + 2
+    return [
+        recognise_special_points(info, points=points, roots=roots[m * k : m * (k + 1)])
+        for k, info in enumerate(infos)
+    ]
+
+
 def recognise_special_points(
     info: FittedInfo,
     points: list[tuple[str, SpecialPointsConfig]],
+    roots: Optional[list[list[float]]] = None,
 ) -> dict[str, SpecialPointsConfig]:
     '''
     NOTE: The conditions 'before' / 'after' are defined purely
     in terms of the peak-to-peak cycle.
+
+    NOTE: The real roots of the derivatives of the fitted polynomial
+    can be precomputed and passed as `roots`, where `roots[k]`
+    are the roots of the `k`th derivative, for `k = 0, 1, ..., n + 1`.
+
+    NOTE: Raises `SpecialPointsNotFound` if the peak or a point cannot be found.
     '''
     if len(points) == 0:
         return {}
 
     results = {key: point for key, point in points}
     times = {}
-    n_der = max([point.spec.derivative for _, point in points if point.spec is not None])
+    n_der = get_max_derivative(points)
     # q = get_renormalised_polynomial_values_only(info)
     q = info.coefficients
 
     # Get polynomial coefficients of n-th derivatives of curve.
     # NOTE: dx[k] = coeff's of k-th derivative of polynomial x(t)
-    dx: list[list[float]] = [[]] * (n_der + 2)
-    dx[0] = q
-    for k in range(n_der + 1):
-        dx[k + 1] = get_derivative_coefficients(dx[k])
+    dx = get_derivatives(q, n=n_der + 1)
+    roots = roots or [None] * (n_der + 2)
 
     # compute and classify critical points of derivatives:
     crits = [
-        get_critical_points_bounded(p=dx[k], dp=dx[k + 1], t_min=0.0, t_max=1.0, eps=FLOAT_ERR)
+        get_critical_points_bounded(
+            p=dx[k],
+            dp=dx[k + 1],
+            t_min=0.0,
+            t_max=1.0,
+            eps=FLOAT_ERR,
+            t_crit=roots[k + 1],
+            t_zeroes=roots[k],
+        )
         for k in range(n_der + 1)
     ]
 
@@ -88,7 +149,8 @@ def recognise_special_points(
     # determine peak
     crit = filter_kinds(crits[0], kinds={EnumCriticalPoints.MAXIMUM})
     crit = filter_times(crit, t_before=1.0)
-    assert len(crit) >= 1, 'The cycle should have exactly one peak!'
+    if len(crit) == 0:
+        raise SpecialPointsNotFound('The cycle should have exactly one peak!')
     t_max = crit[0][0]
 
     # shift cycle to format peak-to-peak:
@@ -124,12 +186,11 @@ def recognise_special_points(
         )
         crit = filter_kinds(crits[n], kinds={spec.kind})
         crit = filter_times(crit, t_after=t_after, t_before=t_before)
-        try:
-            t0 = crit[0][0]
-            times[key] = t0
-            log_debug(f'({key}) found t={t0:.4f}.')
-        except:
-            log_fatal(f'Could not find ({key})!')
+        if len(crit) == 0:
+            raise SpecialPointsNotFound(f'Could not find ({key})!')
+        t0 = crit[0][0]
+        times[key] = t0
+        log_debug(f'({key}) found t={t0:.4f}.')
 
         # unshift time-values to original format of cycle and store
         results[key].time = (t0 + t_max) % 1
@@ -142,6 +203,22 @@ def recognise_special_points(
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
+def get_max_derivative(points: list[tuple[str, SpecialPointsConfig]]) -> int:
+    return max([point.spec.derivative for _, point in points if point.spec is not None])
+
+
+def get_derivatives(q: list[float], n: int) -> list[list[float]]:
+    '''
+    Computes the coefficients `dx[k]` of the k-th derivatives of a polynomial,
+    for `k = 0, 1, ..., n`.
+    '''
+    dx: list[list[float]] = [[]] * (n + 1)
+    dx[0] = q
+    for k in range(n):
+        dx[k + 1] = get_derivative_coefficients(dx[k])
+    return dx
+
+
 def filter_kinds(
     crit: list[tuple[float, float, set[EnumCriticalPoints]]], kinds: set[EnumCriticalPoints]
 ) -> list[list[tuple[float, float, set[EnumCriticalPoints]]]]:
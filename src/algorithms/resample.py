@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from ..thirdparty.maths import *
+from ..thirdparty.types import *
+
+from ..models.enums import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'get_decimation_factor',
+    'resample_uniform',
+]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# relative tolerance for time increments to be considered equal
+EPS_UNIFORM = 1e-6
+# half-length of the FIR filter of `resample_poly` in multiples of the decimation factor
+FILTER_HALF_LENGTH = 10
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def resample_uniform(
+    t: np.ndarray,
+    x: np.ndarray,
+    dt: float,
+    N: int,
+    method: EnumResampleMethod = EnumResampleMethod.LINEAR,
+) -> np.ndarray:
+    '''
+    Resamples an ordered time series `(t, x)` starting at `t = 0`
+    onto the uniform grid `k · dt` for `k = 0, 1, ..., N - 1`,
+    where the series is continued periodically with period `N · dt`.
+
+    - `LINEAR` - linear interpolation at the grid points.
+    - `POLYPHASE` - the series is interpolated onto a grid finer by an integer factor `m`
+      (at least as fine as the samples), low-pass filtered + decimated via `resample_poly`.
+    - `BLOCK-AVERAGE` - as above, but with a centred moving average of width `dt`.
+
+    NOTE: If the samples are uniform with time increment `dt / m` for an integer `m`,
+    no interpolation takes place, i.e. the samples are used directly.
+    '''
+    T = N * dt
+    m = get_decimation_factor(t, dt)
+    if m is not None:
+        # exact path: samples already lie on the (fine) grid
+        x_fine = extend_periodically(x, N * m)
+        if method == EnumResampleMethod.LINEAR:
+            return np.array(x_fine[::m])
+    elif method == EnumResampleMethod.LINEAR or len(t) < 2:
+        return np.interp(np.arange(N) * dt, t, x, period=T)
+    else:
+        m = max(math.ceil(dt / np.median(np.diff(t))), 1)
+        x_fine = np.interp(np.arange(N * m) * (dt / m), t, x, period=T)
+
+    match method:
+        case EnumResampleMethod.POLYPHASE:
+            return decimate_polyphase(x_fine, m)
+        case EnumResampleMethod.BLOCK_AVERAGE:
+            return decimate_block_average(x_fine, m)
+        case _:
+            raise ValueError(f'No method developed for resampling via {method}!')
+
+
+def get_decimation_factor(t: np.ndarray, dt: float) -> Optional[int]:
+    '''
+    @returns
+    the integer `m`, if the time points are `t[i] = i · dt / m` (up to rounding errors),
+    otherwise `None`.
+    '''
+    if len(t) < 2 or abs(t[0]) > EPS_UNIFORM * dt:
+        return None
+    dt_samples = (t[-1] - t[0]) / (len(t) - 1)
+    m = round(dt / dt_samples)
+    if m < 1 or abs(m * dt_samples - dt) > EPS_UNIFORM * dt:
+        return None
+    if np.any(np.abs(np.diff(t) - dt_samples) > EPS_UNIFORM * dt_samples):
+        return None
+    return m
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def extend_periodically(x: np.ndarray, n: int) -> np.ndarray:
+    '''
+    Truncates resp. extends uniform samples to `n` samples,
+    where the gap is interpolated linearly towards `x[0]` (cf. `np.interp` with `period`).
+    '''
+    if len(x) >= n:
+        return x[:n]
+    k = np.arange(len(x) - 1, n + 1)
+    tail = np.interp(k, [k[0], k[-1]], [x[-1], x[0]])
+    return np.concatenate([x, tail[1:-1]])
+
+
+def decimate_polyphase(x: np.ndarray, m: int) -> np.ndarray:
+    if m == 1:
+        return np.array(x)
+    # NOTE: pad periodically, so that the filter does not see artificial boundaries.
+    n_pad = min(FILTER_HALF_LENGTH * m, len(x))
+    x_pad = np.concatenate([x[len(x) - n_pad :], x, x[:n_pad]])
+    y = sps.resample_poly(x_pad, up=1, down=m)
+    k = n_pad // m
+    return y[k : k + math.ceil(len(x) / m)]
+
+
+def decimate_block_average(x: np.ndarray, m: int) -> np.ndarray:
+    '''
+    Averages the samples in a (periodic) window of width `m` centred at every `m`-th sample.
+    For even `m` the end points of the window of `m + 1` samples are weighted by `1/2`.
+    '''
+    h = m // 2
+    x_pad = np.concatenate([x[len(x) - h :], x, x[:h]]) if h > 0 else x
+    c = np.concatenate([[0.0], np.cumsum(x_pad)])
+    # index of every m-th sample in padded array
+    i = np.arange(0, len(x), m) + h
+    s = c[i + h + 1] - c[i - h]
+    if m % 2 == 0:
+        s -= 0.5 * (x_pad[i - h] + x_pad[i + h])
+    return s / m
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from ..thirdparty.code import *
+from ..thirdparty.data import *
+from ..thirdparty.maths import *
+from ..thirdparty.types import *
+
+from ..core.log import *
+from ..core.utils import *
+from ..models.user import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'RowFilter',
+    'get_row_filter',
+]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# bound on the number of leading rows searched for the header
+MAX_HEADER_ROW = 2**20
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CLASSES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@dataclass
+class RowFilter:
+    '''
+    Compiled specification of the rows of a file to be skipped,
+    which is evaluated on arrays of (0-based) row indexes at once.
+
+    - `rows` - explicit row indexes to be skipped.
+    - `rules` - the declarative rules (a row is skipped if it satisfies any of these)
+      together with their compiled expressions.
+    - `predicates` - further vectorised predicates on the row indexes.
+
+    NOTE: The first row not skipped is the header.
+    Conditions on columns (cf. `DataSkipRule.pattern`) only apply to rows after the header,
+    and require the (raw) values of the column.
+    '''
+
+    rows: np.ndarray = field(default_factory=lambda: np.zeros((0,), dtype=int))
+    rules: list[tuple[DataSkipRule, Optional[Callable[[np.ndarray], np.ndarray]]]] = field(
+        default_factory=list
+    )
+    predicates: list[Callable[[np.ndarray], np.ndarray]] = field(default_factory=list)
+
+    @property
+    def columns(self) -> list[str]:
+        '''
+        Columns whose raw values are needed to evaluate the filter.
+        '''
+        return unique([rule.column for rule, _ in self.rules if rule.pattern is not None])
+
+    def mask(
+        self,
+        rows: np.ndarray,
+        columns: Optional[dict[str, Iterable]] = None,
+    ) -> np.ndarray:
+        '''
+        @inputs
+        - `rows` - array of row indexes.
+        - `columns` - raw values of the columns in `self.columns` for these rows.
+          If not provided, rules which depend on columns do not apply.
+
+        @returns
+        boolean array indicating which of the rows are to be skipped.
+        '''
+        rows = np.asarray(rows, dtype=int)
+        mask = np.isin(rows, self.rows)
+        for rule, expr in self.rules:
+            mask |= get_rule_mask(rule, expr, rows, columns)
+        for predicate in self.predicates:
+            mask |= predicate(rows)
+        return mask
+
+    def split(self) -> tuple[int, int]:
+        '''
+        @returns
+        the number of rows skipped before the header (= the row index of the header)
+        and the number of rows skipped immediately after the header.
+        These can be skipped by the parsers directly.
+        '''
+        header = self.first_row_kept(0)
+        return header, self.first_row_kept(header + 1) - header - 1
+
+    def first_row_kept(self, start: int) -> int:
+        n = 64
+        while True:
+            rows = np.arange(start, start + n)
+            (kept,) = np.where(~self.mask(rows))
+            if len(kept) > 0:
+                return int(rows[kept[0]])
+            if start + n >= MAX_HEADER_ROW:
+                raise ValueError(f'No rows left after skipping rows {start}-{start + n - 1}!')
+            n *= 2
+
+    def is_trivial(self, start: int) -> bool:
+        '''
+        Determines whether no rows from `start` onwards are skipped.
+        '''
+        if np.any(self.rows >= start) or len(self.predicates) > 0:
+            return False
+        return all(rule.stop is not None and rule.stop <= start for rule, _ in self.rules)
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def get_row_filter(skip: int | list[int | DataSkipRule] | str | DataSkipRule) -> RowFilter:
+    '''
+    Compiles the configured rows to be skipped (cf. `DataTimeSeries.skip`).
+    '''
+    if isinstance(skip, int):
+        return RowFilter(rows=np.arange(max(skip, 0)))
+    if isinstance(skip, str):
+        return RowFilter(predicates=[get_bool_function(skip)])
+    if isinstance(skip, DataSkipRule):
+        skip = [skip]
+
+    rows = [i for i in skip if isinstance(i, int) and i >= 0]
+    rules = [
+        (rule, None if rule.expr is None else get_expr_function(rule.expr))
+        for rule in skip
+        if isinstance(rule, DataSkipRule)
+    ]
+    return RowFilter(rows=np.asarray(sorted(set(rows)), dtype=int), rules=rules)
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def get_rule_mask(
+    rule: DataSkipRule,
+    expr: Optional[Callable[[np.ndarray], np.ndarray]],
+    rows: np.ndarray,
+    columns: Optional[dict[str, Iterable]],
+) -> np.ndarray:
+    mask = rows >= rule.start
+    if rule.stop is not None:
+        mask &= rows < rule.stop
+    if rule.step > 1:
+        mask &= (rows - rule.start) % rule.step == 0
+    if expr is not None:
+        mask &= expr(rows)
+    if rule.pattern is not None:
+        if columns is None:
+            return np.zeros(rows.shape, dtype=bool)
+        values = pd.Series(columns[rule.column], dtype=str)
+        mask &= values.str.contains(rule.pattern, regex=True).to_numpy(dtype=bool)
+    return mask
+
+
+def get_expr_function(expr: str) -> Callable[[np.ndarray], np.ndarray]:
+    '''
+    Compiles an expression in the array `i` of row indexes to a vectorised predicate.
+    '''
+    try:
+        fct = eval(f'lambda i: {expr}', {'np': np})
+    except SyntaxError as err:
+        raise ValueError(f'Invalid expression for rows to be skipped: {expr}') from err
+    return lambda rows: np.broadcast_to(np.asarray(fct(rows), dtype=bool), rows.shape)
+
+
+def get_bool_function(text: str) -> Callable[[np.ndarray], np.ndarray]:
+    '''
+    Compiles the string of a lambda function (mapping integers to boolean values)
+    to a predicate on arrays of row indexes.
+
+    NOTE: The function is applied to the entire array at once if possible,
+    otherwise to each row index, where errors are treated as `False`.
+    '''
+    try:
+        fct = eval(text)
+    except:
+        log_warn(f'Could not interpret {text} as a function. No rows are skipped.')
+        return lambda rows: np.zeros(rows.shape, dtype=bool)
+
+    def fct_safe(i: int) -> bool:
+        try:
+            return bool(fct(i))
+        except:
+            return False
+
+    def predicate(rows: np.ndarray) -> np.ndarray:
+        try:
+            # NOTE: raise on e.g. division by zero, for which python would raise too.
+            with np.errstate(all='raise'):
+                mask = np.asarray(fct(rows))
+            if mask.dtype == bool and mask.shape == rows.shape:
+                return mask
+        except:
+            pass
+        return np.fromiter((fct_safe(int(i)) for i in rows), dtype=bool, count=len(rows))
+
+    return predicate
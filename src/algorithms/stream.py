@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from ..thirdparty.code import *
+from ..thirdparty.maths import *
+from ..thirdparty.types import *
+
+from ..core.log import *
+from ..models.app import *
+from ..models.internal import *
+from .peaks import *
+from .fit import *
+from .points import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'StreamBeat',
+    'StreamEngine',
+]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CLASSES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@dataclass
+class StreamBeat:
+    '''
+    A completed (peak-to-peak) cycle emitted by the `StreamEngine`.
+
+    - `index` - running number of the beat.
+    - `window` - absolute sample indices `(i1, i2)` of the beat.
+    - `time` - time of the first sample of the beat.
+    - `info` - fitted polynomial + normalisation of the beat.
+    - `points` - special points recognised in the beat
+      (times normalised to `[0, 1]` relative to the beat).
+    '''
+
+    index: int = field()
+    window: tuple[int, int] = field()
+    time: float = field()
+    info: FittedInfo = field()
+    points: dict[str, SpecialPointsConfig] = field()
+
+
+@dataclass
+class StreamEngine:
+    '''
+    Online engine, which ingests chunks of samples of a single quantity
+    and emits beats as soon as they are completed.
+
+    Peaks are detected as in `get_extremes`, except that
+    - the cycle duration and the normalisation of the values are estimated
+      on the first `warmup` samples (and the latter adapted after each beat);
+    - a peak is only confirmed once `sig_lookahead · N` further samples
+      (`N` = estimated cycle duration) have been observed.
+
+    Cycles are accepted as in `get_cycles`, relative to the durations of the recent cycles.
+    Each accepted cycle is fitted via `fit_poly_cycle`
+    and its special points are recognised via `recognise_special_points`.
+
+    NOTE: Only samples since the last confirmed peak are kept,
+    and the buffer is bounded by `sig_buffer · N` samples,
+    beyond which the engine resets (e.g. if the signal is lost).
+    '''
+
+    conds: list[PolyCritCondition | PolyDerCondition | PolyIntCondition] = field()
+    points: list[tuple[str, SpecialPointsConfig]] = field()
+    warmup: int = field(default=4096)
+    sig_width: float = field(default=1 / math.sqrt(2))
+    sig_lookahead: float = field(default=0.25)
+    sig_buffer: float = field(default=4.0)
+    sig_gap: float = field(default=2.0)
+    adapt: float = field(default=0.1)
+    history: int = field(default=16)
+    # internal state
+    deg: int = field(default=0, init=False, repr=False)
+    num_beats: int = field(default=0, init=False)
+    num_rejected: int = field(default=0, init=False)
+    duration: Optional[int] = field(default=None, init=False)
+    loc: float = field(default=0.0, init=False, repr=False)
+    scale: float = field(default=1.0, init=False, repr=False)
+    offset: int = field(default=0, init=False, repr=False)
+    peak: Optional[int] = field(default=None, init=False, repr=False)
+    t: np.ndarray = field(default_factory=lambda: np.zeros((0,)), init=False, repr=False)
+    x: np.ndarray = field(default_factory=lambda: np.zeros((0,)), init=False, repr=False)
+    lengths: deque = field(default_factory=deque, init=False, repr=False)
+
+    def __post_init__(self):
+        self.conds, self.deg = get_cycle_conditions(self.conds)
+        self.lengths = deque(maxlen=self.history)
+        return
+
+    @property
+    def width(self) -> int:
+        return round(self.sig_width * (self.duration or 0)) or 1
+
+    @property
+    def lookahead(self) -> int:
+        return max(round(self.sig_lookahead * (self.duration or 0)), 1)
+
+    @property
+    def capacity(self) -> int:
+        return max(round(self.sig_buffer * (self.duration or 0)), self.warmup)
+
+    def push(self, t: Iterable[float], x: Iterable[float]) -> list[StreamBeat]:
+        '''
+        Ingests a chunk of samples (ordered by time)
+        and returns the beats completed by these.
+        '''
+        self.t = np.concatenate([self.t, np.asarray(t, dtype=float)])
+        self.x = np.concatenate([self.x, np.asarray(x, dtype=float)])
+
+        if self.duration is None:
+            if len(self.x) < self.warmup:
+                return []
+            self.estimate(self.x)
+
+        beats = []
+        for peak in self.confirm_peaks():
+            if self.peak is not None:
+                beat = self.complete_cycle(self.peak, peak)
+                if beat is not None:
+                    beats.append(beat)
+            self.peak = peak
+
+        self.discard()
+        return beats
+
+    def estimate(self, x: np.ndarray):
+        '''
+        Estimates the cycle duration and the normalisation of values as in `get_extremes`.
+        '''
+        self.loc = np.median(x)
+        self.scale = np.median(np.abs(x - self.loc)) or 1.0
+        values = (x - self.loc) / self.scale
+        width = estimate_peak_width(values, sig_width=self.sig_width)
+        # NOTE: the above only serves to sift out noise, so refine the estimate.
+        peaks = get_peaks_simple(values, distance=width, prominence=1)
+        N = estimate_cycle_duration_acf(values) or len(x)
+        self.duration = round(np.median(np.diff(peaks))) if len(peaks) > 1 else N
+        return
+
+    def confirm_peaks(self) -> list[int]:
+        '''
+        @returns
+        the buffer indices of newly confirmed peaks (in order).
+        '''
+        values = (self.x - self.loc) / self.scale
+        # NOTE: use find_peaks directly, as `get_peaks_simple` falls back to the maximum.
+        peaks, _ = sps.find_peaks(values, distance=self.width, prominence=1)
+        i0 = -1 if self.peak is None else self.peak + self.width - 1
+        i1 = len(values) - self.lookahead
+        return [int(i) for i in peaks if i0 < i <= i1]
+
+    def complete_cycle(self, i1: int, i2: int) -> Optional[StreamBeat]:
+        t = self.t[i1:i2]
+        x = self.x[i1:i2]
+
+        # reject cycles which are too small or too large
+        lengths = np.asarray([*self.lengths, i2 - i1])
+        self.lengths.append(i2 - i1)
+        if abs(normalised_order_statistics(lengths)[-1]) >= self.sig_gap:
+            self.num_rejected += 1
+            return None
+
+        # adapt normalisation of values
+        loc = np.median(x)
+        scale = np.median(np.abs(x - loc)) or self.scale
+        self.loc += self.adapt * (loc - self.loc)
+        self.scale += self.adapt * (scale - self.scale)
+
+        # fit cycle + recognise points
+        params, tt, xx = normalise_cycle(t, x)
+        coeff = fit_poly_cycle(tt, xx, deg=self.deg, conds=self.conds)
+        info = FittedInfo(coefficients=np.asarray(coeff).tolist(), normalisation=params)
+        # NOTE: the point settings are modified during recognition, so use copies.
+        points = [(key, point.copy(deep=True)) for key, point in self.points]
+        try:
+            points = recognise_special_points(info, points=points)
+        except SpecialPointsNotFound:
+            log_warn(f'Could not recognise points in beat at t={t[0]}. Beat skipped.')
+            self.num_rejected += 1
+            return None
+
+        beat = StreamBeat(
+            index=self.num_beats,
+            window=(self.offset + i1, self.offset + i2),
+            time=float(t[0]),
+            info=info,
+            points=points,
+        )
+        self.num_beats += 1
+        return beat
+
+    def discard(self):
+        '''
+        Discards samples which are no longer needed.
+        '''
+        if self.peak is not None and len(self.x) - self.peak > self.capacity:
+            log_warn(f'No peak found after {self.capacity} samples. Stream engine reset.')
+            self.peak = None
+
+        if self.peak is None:
+            i = max(len(self.x) - self.capacity, 0)
+        else:
+            i = self.peak
+            self.peak = 0
+
+        self.t = self.t[i:]
+        self.x = self.x[i:]
+        self.offset += i
+        return
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from ..thirdparty.code import *
+from ..thirdparty.data import *
+from ..thirdparty.maths import *
+from ..thirdparty.sync import *
+from ..thirdparty.system import *
+from ..thirdparty.types import *
+
+from .cache import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'ArtifactCache',
+    'ColumnarCache',
+    'cached_artifact',
+    'clear_artifact_cache',
+    'configure_artifact_cache',
+    'fingerprint',
+    'fingerprint_file',
+    'fingerprint_files',
+    'get_artifact_cache',
+]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+T = TypeVar('T')
+
+ARTIFACT_CACHE_PATH = '.cache/artifacts'
+ARTIFACT_CACHE_MAX_SIZE = 1024**3
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CLASSES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@dataclass
+class ArtifactCache:
+    '''
+    A content-addressed on-disk cache of (pickled) artifacts.
+
+    Each artifact is stored under the hash of its inputs.
+    Access to an artifact updates its modification time,
+    so that eviction of the oldest files once the total size exceeds `max_size`
+    amounts to least-recently-used eviction.
+
+    NOTE: The `context` is mixed into every key and should capture everything
+    that the artifacts depend upon implicitly (e.g. the app config and the source code).
+    Files are written atomically, so that the cache can be shared between processes.
+    '''
+
+    suffix: ClassVar[str] = '.pkl'
+
+    path: str = field(default=ARTIFACT_CACHE_PATH)
+    max_size: int = field(default=ARTIFACT_CACHE_MAX_SIZE)
+    enabled: bool = field(default=True)
+    context: str = field(default='')
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    @property
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits, misses=self.misses, size=self.size(), maxsize=self.max_size
+        )
+
+    def key(self, name: str, *args: Any) -> str:
+        h = hashlib.sha256()
+        update_fingerprint(h, (name, self.context, args))
+        return h.hexdigest()
+
+    def filename(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], f'{key}{self.suffix}')
+
+    def get(self, key: str, compute: Callable[[], T]) -> T:
+        if not self.enabled:
+            return compute()
+
+        path = self.filename(key)
+        try:
+            with open(path, 'rb') as fp:
+                value = self.load(fp)
+            os.utime(path)
+            with self.lock:
+                self.hits += 1
+            return value
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # treat corrupted artifacts as misses
+            remove_file(path)
+
+        value = compute()
+        with self.lock:
+            self.misses += 1
+        self.store(path, value)
+        self.evict()
+        return value
+
+    def store(self, path: str, value: Any):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        path_tmp = f'{path}.{os.getpid()}.{get_ident()}.tmp'
+        with open(path_tmp, 'wb') as fp:
+            self.dump(fp, value)
+        os.replace(path_tmp, path)
+        return
+
+    def load(self, fp: IO[bytes]) -> Any:
+        return pickle.load(fp)
+
+    def dump(self, fp: IO[bytes], value: Any):
+        pickle.dump(value, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        return
+
+    def entries(self) -> list[tuple[float, int, str]]:
+        '''
+        @returns
+        list of `(mtime, size, path)` for all artifacts, oldest first.
+        '''
+        entries = []
+        for path in Path(self.path).glob(f'*/*{self.suffix}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, str(path)))
+        return sorted(entries)
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= max(self.max_size, 0):
+                break
+            remove_file(path)
+            total -= size
+        return
+
+    def clear(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+        return
+
+
+@dataclass
+class ColumnarCache(ArtifactCache):
+    '''
+    An `ArtifactCache` for data frames, which are stored column-wise as `.npz`-files
+    (instead of being pickled), so that they can be reused across versions of the code.
+
+    NOTE: Only the columns (not the index) of the data frames are stored.
+    '''
+
+    suffix: ClassVar[str] = '.npz'
+
+    def load(self, fp: IO[bytes]) -> pd.DataFrame:
+        with np.load(fp, allow_pickle=False) as arrs:
+            return pd.DataFrame({key: arrs[key] for key in arrs.files}, copy=False)
+
+    def dump(self, fp: IO[bytes], value: pd.DataFrame):
+        np.savez(fp, **{str(key): col.to_numpy() for key, col in value.items()})
+        return
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# NOTE: disabled until configured (cf. `setup_artifact_cache` in main).
+_artifact_cache = ArtifactCache(enabled=False)
+
+
+def get_artifact_cache() -> ArtifactCache:
+    return _artifact_cache
+
+
+def configure_artifact_cache(
+    path: Optional[str] = None,
+    max_size: Optional[int] = None,
+    enabled: Optional[bool] = None,
+    context: Any = None,
+) -> ArtifactCache:
+    '''
+    Modifies the settings of the global artifact cache.
+    Arguments left as `None` are not changed.
+    '''
+    if path is not None:
+        _artifact_cache.path = path
+    if max_size is not None:
+        _artifact_cache.max_size = max_size
+    if enabled is not None:
+        _artifact_cache.enabled = enabled
+    if context is not None:
+        _artifact_cache.context = fingerprint(context)
+    return _artifact_cache
+
+
+def clear_artifact_cache():
+    _artifact_cache.clear()
+    return
+
+
+def cached_artifact(**selectors: Callable[[Any], Any]):
+    '''
+    Decorates a method, such that its output is stored in the global artifact cache,
+    keyed by the name of the method and the hash of its (bound) arguments.
+
+    @inputs
+    - `selectors` - for named arguments, a map to the part of the argument
+      on which the output actually depends (e.g. a subtree of the config).
+
+    NOTE: The key is computed before the method is called,
+    so methods that modify their inputs in place are cached correctly.
+    On a cache-hit the inputs are however not modified.
+    '''
+
+    def dec(method: Callable[..., T]) -> Callable[..., T]:
+        sig = signature(method)
+        name = f'{method.__module__}.{method.__qualname__}'
+
+        @wraps(method)
+        def wrapped_method(*args, **kwargs) -> T:
+            cache = _artifact_cache
+            if not cache.enabled:
+                return method(*args, **kwargs)
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            parts = [
+                (key, selectors[key](value) if key in selectors else value)
+                for key, value in bound.arguments.items()
+            ]
+            key = cache.key(name, parts)
+            return cache.get(key, lambda: method(*args, **kwargs))
+
+        return wrapped_method
+
+    return dec
+
+
+def fingerprint(obj: Any) -> str:
+    '''
+    Computes a stable hash of (nested) python objects, arrays, data frames and models.
+    '''
+    h = hashlib.sha256()
+    update_fingerprint(h, obj)
+    return h.hexdigest()
+
+
+def fingerprint_file(path: str) -> tuple[str, int, int]:
+    '''
+    Cheap fingerprint of a file based on its path, size and modification time.
+    '''
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+
+def fingerprint_files(path: str, pattern: str = '**/*.py') -> str:
+    '''
+    Cheap fingerprint of all files within a folder matching a pattern.
+    '''
+    paths = sorted(str(p) for p in Path(path).glob(pattern) if p.is_file())
+    return fingerprint([fingerprint_file(p) for p in paths])
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def update_fingerprint(h: Any, obj: Any):
+    # NOTE: every branch writes a type-tag, to avoid collisions between e.g. `1` and `'1'`.
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        h.update(f'{type(obj).__name__}:{obj!r};'.encode())
+    elif isinstance(obj, bytes):
+        h.update(b'bytes:' + obj)
+    elif isinstance(obj, np.ndarray):
+        arr = np.ascontiguousarray(obj)
+        h.update(f'ndarray:{arr.dtype.str}:{arr.shape};'.encode())
+        if arr.dtype.hasobject:
+            update_fingerprint(h, arr.tolist())
+        else:
+            h.update(arr.view(np.uint8).data)
+    elif isinstance(obj, pd.DataFrame):
+        h.update(b'dataframe:')
+        update_fingerprint(h, [str(col) for col in obj.columns])
+        update_fingerprint(h, [str(dtype) for dtype in obj.dtypes])
+        update_fingerprint(h, pd.util.hash_pandas_object(obj, index=True).to_numpy())
+        # NOTE: includes implicit metadata.
+        update_fingerprint(h, dict(obj.attrs))
+    elif isinstance(obj, pd.Series):
+        h.update(f'series:{obj.name!r}:{obj.dtype};'.encode())
+        update_fingerprint(h, pd.util.hash_pandas_object(obj, index=True).to_numpy())
+    elif isinstance(obj, BaseModel):
+        h.update(f'model:{type(obj).__name__}:'.encode())
+        update_fingerprint(h, obj.json())
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        h.update(f'dataclass:{type(obj).__name__}:'.encode())
+        update_fingerprint(h, {f.name: getattr(obj, f.name) for f in dataclass_fields(obj)})
+    elif isinstance(obj, dict):
+        h.update(f'dict:{len(obj)};'.encode())
+        for key, value in obj.items():
+            update_fingerprint(h, key)
+            update_fingerprint(h, value)
+    elif isinstance(obj, (list, tuple)):
+        h.update(f'{type(obj).__name__}:{len(obj)};'.encode())
+        for value in obj:
+            update_fingerprint(h, value)
+    else:
+        h.update(f'pickle:{type(obj).__name__}:'.encode())
+        h.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    return
+
+
+def remove_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    return
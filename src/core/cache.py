@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from ..thirdparty.code import *
+from ..thirdparty.sync import *
+from ..thirdparty.types import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'CacheInfo',
+    'LRUCache',
+]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CLASSES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@dataclass
+class CacheInfo:
+    hits: int = field()
+    misses: int = field()
+    size: int = field()
+    maxsize: int = field()
+
+    def __str__(self) -> str:
+        return f'hits={self.hits}, misses={self.misses}, size={self.size}/{self.maxsize}'
+
+
+@dataclass
+class LRUCache(Generic[K, V]):
+    '''
+    A simple in-memory cache with least-recently-used eviction.
+
+    Values are only computed on a cache-miss, via the callback passed to `get`.
+    The counters `hits` and `misses` are kept until `clear` is called.
+
+    If `maxbytes` is set, the entries are furthermore bounded by their total size
+    as measured by `sizeof`. Values larger than `maxbytes` are not cached.
+
+    NOTE: Access is guarded by a lock, so that the cache can be shared between threads.
+    The value itself is computed outside of the lock.
+    '''
+
+    maxsize: int = field(default=128)
+    maxbytes: Optional[int] = field(default=None)
+    sizeof: Callable[[V], int] = field(default=lambda _: 0, repr=False, compare=False)
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    nbytes: int = field(default=0, init=False)
+    entries: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False)
+    sizes: dict = field(default_factory=dict, init=False, repr=False)
+    lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self.entries
+
+    @property
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits, misses=self.misses, size=len(self), maxsize=self.maxsize
+        )
+
+    def get(self, key: K, compute: Callable[[], V]) -> V:
+        with self.lock:
+            if key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return self.entries[key]
+
+        value = compute()
+        size = self.sizeof(value) if self.maxbytes is not None else 0
+        with self.lock:
+            self.misses += 1
+            # NOTE: values exceeding the bound are not kept (and evict no other entries).
+            if self.maxbytes is not None and size > self.maxbytes:
+                return value
+            if key in self.entries:
+                self.nbytes -= self.sizes.pop(key)
+            self.entries[key] = value
+            self.sizes[key] = size
+            self.nbytes += size
+            # evict least recently used entries
+            while len(self.entries) > max(self.maxsize, 0) or (
+                self.maxbytes is not None and self.nbytes > self.maxbytes
+            ):
+                key_, _ = self.entries.popitem(last=False)
+                self.nbytes -= self.sizes.pop(key_)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+        return
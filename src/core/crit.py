@@ -45,14 +45,23 @@ def get_critical_points(
     dp: Optional[list[float]] = None,
     t_min: float = -np.inf,
     t_max: float = np.inf,
+    t_crit: Optional[list[float]] = None,
+    t_zeroes: Optional[list[float]] = None,
 ) -> list[tuple[float, float, set[EnumCriticalPoints]]]:
+    '''
+    Computes and classifies the critical points of a polynomial.
+
+    NOTE: The real roots of `p´` and `p` can be precomputed and passed as
+    `t_crit` resp. `t_zeroes` (cf. `get_real_polynomial_roots_batch`).
+    '''
     crit = []
 
     # if not precomputed, compute 1st and 2nd derivatives:
     dp = dp or get_derivative_coefficients(p)
 
     # necessary condition: t (real-valued) is critical ONLY IF p'(t) = 0
-    t_crit = get_real_polynomial_roots(dp)
+    if t_crit is None:
+        t_crit = get_real_polynomial_roots(dp)
 
     # remove eps-close points
     t_crit = get_duplicate_times(t_crit, t_min=-np.inf, t_max=np.inf, eps=eps)
@@ -104,7 +113,8 @@ def get_critical_points(
 
     # add in zeroes
     # NOTE: increase eps-value, to prevent duplicates
-    t_zeroes = get_real_polynomial_roots(p)
+    if t_zeroes is None:
+        t_zeroes = get_real_polynomial_roots(p)
     t_zeroes = get_duplicate_times(t_zeroes, t_min=t_min, t_max=t_max, eps=eps)
     times = [t0 for t0, y0, kinds in crit]
     for t0 in t_zeroes:
@@ -135,8 +145,12 @@ def get_critical_points_bounded(
     dp: Optional[list[float]] = None,
     t_min: float = 0.0,
     t_max: float = 1.0,
+    t_crit: Optional[list[float]] = None,
+    t_zeroes: Optional[list[float]] = None,
 ) -> list[tuple[float, float, set[EnumCriticalPoints]]]:
-    crit = get_critical_points(p=p, dp=dp, t_min=t_min, t_max=t_max, eps=eps)
+    crit = get_critical_points(
+        p=p, dp=dp, t_min=t_min, t_max=t_max, eps=eps, t_crit=t_crit, t_zeroes=t_zeroes
+    )
 
     if len(crit) == 0:
         return []
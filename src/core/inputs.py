@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from ..thirdparty.code import *
+from ..thirdparty.data import *
+from ..thirdparty.types import *
+
+from .artifacts import *
+from .cache import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'InputCache',
+    'clear_input_cache',
+    'configure_input_cache',
+    'get_input_cache',
+]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+INPUT_CACHE_PATH = '.cache/inputs'
+INPUT_CACHE_MAX_SIZE = 1024**3
+INPUT_CACHE_MAX_MEMORY = 1024**3
+INPUT_CACHE_MAX_ENTRIES = 64
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CLASSES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@dataclass
+class InputCache:
+    '''
+    Two-layered cache of parsed input data:
+
+    - `memory` - shared between the cases of a run, bounded by the memory of the data frames;
+    - `disk` - (optional) columnar files reused across runs, bounded by their total size.
+
+    NOTE: Data frames are returned as shallow copies,
+    so that (in place) modifications by the caller do not affect the cached entries.
+    '''
+
+    memory: LRUCache[str, pd.DataFrame] = field(
+        default_factory=lambda: LRUCache(
+            maxsize=INPUT_CACHE_MAX_ENTRIES,
+            maxbytes=INPUT_CACHE_MAX_MEMORY,
+            sizeof=lambda data: int(data.memory_usage(index=True).sum()),
+        )
+    )
+    disk: ColumnarCache = field(
+        default_factory=lambda: ColumnarCache(
+            path=INPUT_CACHE_PATH, max_size=INPUT_CACHE_MAX_SIZE, enabled=False
+        )
+    )
+
+    def key(self, name: str, *args: Any) -> str:
+        return self.disk.key(name, *args)
+
+    def get(self, key: str, compute: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        data = self.memory.get(key, lambda: self.disk.get(key, compute))
+        return data.copy(deep=False)
+
+    def clear(self):
+        self.memory.clear()
+        self.disk.clear()
+        return
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# NOTE: on-disk layer disabled until configured (cf. `setup_artifact_cache` in main).
+_input_cache = InputCache()
+
+
+def get_input_cache() -> InputCache:
+    return _input_cache
+
+
+def configure_input_cache(
+    path: Optional[str] = None,
+    max_size: Optional[int] = None,
+    max_memory: Optional[int] = None,
+    persist: Optional[bool] = None,
+    context: Any = None,
+) -> InputCache:
+    '''
+    Modifies the settings of the global cache of parsed inputs.
+    Arguments left as `None` are not changed.
+
+    @inputs
+    - `max_size` - bound of the total size of the on-disk layer (in bytes).
+    - `max_memory` - bound of the total memory of the in-memory layer (in bytes).
+    - `persist` - whether the on-disk layer is used.
+    '''
+    if path is not None:
+        _input_cache.disk.path = path
+    if max_size is not None:
+        _input_cache.disk.max_size = max_size
+    if max_memory is not None:
+        _input_cache.memory.maxbytes = max_memory
+    if persist is not None:
+        _input_cache.disk.enabled = persist
+    if context is not None:
+        _input_cache.disk.context = fingerprint(context)
+    return _input_cache
+
+
+def clear_input_cache():
+    _input_cache.clear()
+    return
@@ -17,11 +17,14 @@ from .constants import *
 
 __all__ = [
     'poly',
+    'poly_batch',
     'poly_single',
     'print_poly',
     'get_real_polynomial_roots',
+    'get_real_polynomial_roots_batch',
     'get_recentred_coefficients',
     'get_derivative_coefficients',
+    'get_derivative_coefficients_batch',
     'get_integral_coefficients',
 ]
 
@@ -29,7 +32,10 @@ __all__ = [
 # LOCAL VARIABLES / CONSTANTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-#
+# NOTE: eigenvalues with a relative imaginary part up to this are candidates for real roots.
+ROOTS_TOL_IMAG = 1e-4
+# NOTE: maximal number of (safeguarded) Newton steps to polish candidates.
+ROOTS_NEWTON_STEPS = 8
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS - basic
@@ -47,16 +53,59 @@ def poly_single(t: float, *coeff: float) -> float:
     return x
 
 
-def poly(t: Iterable[float], *coeff: float) -> np.ndarray:
-    t = np.asarray(t)
-    N = len(t)
-    m = len(coeff)
-    x = np.zeros(shape=(N,), dtype=float)
-    monom = 1.0
-    for k, c in enumerate(coeff):
-        x += c * monom
-        if k < m - 1:
-            monom *= t
+def poly(
+    t: Iterable[float],
+    *coeff: float,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    '''
+    Evaluates the polynomial `∑ₖ coeff[k]·tᵏ` at the points `t`
+    via Horner's scheme.
+
+    NOTE: If `out` is provided, the values are written to this array (in place).
+    '''
+    t = np.asarray(t, dtype=float)
+    x = np.empty(shape=t.shape, dtype=float) if out is None else out
+    x.fill(0.0)
+    for c in coeff[::-1]:
+        x *= t
+        x += c
+    return x
+
+
+def poly_batch(
+    t: Iterable[float],
+    coeffs: np.ndarray,
+    offsets: Iterable[int],
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    '''
+    Evaluates many polynomials over a concatenated time-array in one pass.
+
+    @inputs
+    - `t` - the concatenated time-values of all segments
+    - `coeffs` - an `n x (d+1)` array, the `k`th row of which are the coefficients
+      of the polynomial to be evaluated on segment `k`.
+    - `offsets` - the `n + 1` indices, such that segment `k` is `t[offsets[k]:offsets[k+1]]`
+    - `out` - optional array to write the values to (in place).
+
+    @returns
+    An array `x` with `x[i1:i2] = poly(t[i1:i2], *coeffs[k])` for `i1, i2 = offsets[k:k+2]`.
+    '''
+    t = np.asarray(t, dtype=float)
+    coeffs = np.asarray(coeffs, dtype=float)
+    offsets = np.asarray(offsets, dtype=int)
+    n = len(offsets) - 1
+    coeffs = coeffs.reshape((n, -1))
+    segments = np.repeat(np.arange(n), np.diff(offsets))
+
+    x = np.empty(shape=t.shape, dtype=float) if out is None else out
+    x.fill(0.0)
+    c = np.empty(shape=t.shape, dtype=float)
+    for k in range(coeffs.shape[1] - 1, -1, -1):
+        x *= t
+        np.take(coeffs[:, k], segments, out=c)
+        x += c
     return x
 
 
@@ -93,7 +142,7 @@ def print_poly(coeff: list[float], var: str = 'X', unitise: bool = True) -> str:
         case 1:
             expr = coeff_pow_g(monoms[-1])
         case _:
-            (n, c_leading) = monoms[-1]
+            n, c_leading = monoms[-1]
             if unitise:
                 expr = ' + '.join([coeff_pow_f((k, c / c_leading)) for k, c in monoms])
                 match c_leading:
@@ -113,26 +162,133 @@ def print_poly(coeff: list[float], var: str = 'X', unitise: bool = True) -> str:
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
-def get_real_polynomial_roots(coeff: list[float]) -> list[float]:
+def get_real_polynomial_roots(
+    coeff: list[float],
+    t_min: float = -np.inf,
+    t_max: float = np.inf,
+) -> list[float]:
     '''
     Computes reals roots of polynomial with real coefficients,
-    sorted in ascending order.
+    sorted in ascending order, restricted to `[t_min, t_max]`
+    (cf. `get_real_polynomial_roots_batch`).
 
     For constant polynomials the empty set is returned, even for the 0-polynomial.
 
     NOTE: Roots with algebraic multiplicity = `n` > 1 occur with `n` times in list.
     '''
-    if len(coeff) <= 1:
-        return []
-
-    roots = np.roots(list(coeff)[::-1]).tolist()
-    roots = [t.real for t in roots if abs(t.imag) < MACHINE_EPS]
-    # C = sum([ abs(c) for c in coeff ]) or 1.
-    # roots = [ t for t in roots if abs(poly_single(t, *coeff)) < C*MACHINE_EPS ]
-    roots = sorted(roots)
+    return get_real_polynomial_roots_batch([coeff], t_min=t_min, t_max=t_max)[0]
+
+
+def get_real_polynomial_roots_batch(
+    coeffs: list[list[float]],
+    t_min: float = -np.inf,
+    t_max: float = np.inf,
+) -> list[list[float]]:
+    '''
+    Batched version of `get_real_polynomial_roots`,
+    restricted to roots in `[t_min, t_max]`.
+
+    The companion matrices (cf. `np.roots`)
+    of all polynomials of the same (effective) degree are stacked
+    and solved in one call of `np.linalg.eigvals`.
+    Only the (nearly) real eigenvalues in `[t_min, t_max]` are polished
+    and accepted as roots (cf. `polish_real_roots`).
+    '''
+    n = len(coeffs)
+    roots = [np.zeros((0,), dtype=float) for _ in range(n)]
+
+    # group leading-coefficient-first polynomials by size of companion matrix:
+    groups: dict[int, list[tuple[int, np.ndarray]]] = {}
+    for k, coeff in enumerate(coeffs):
+        if len(coeff) <= 1:
+            continue
+        p = np.asarray(coeff, dtype=float)[::-1]
+        indices = np.flatnonzero(p)
+        if len(indices) == 0:
+            continue
+        # NOTE: trailing zeroes ⟺ roots at t = 0
+        if t_min <= 0 <= t_max:
+            roots[k] = np.zeros((len(p) - indices[-1] - 1,), dtype=float)
+        p = p[indices[0] : indices[-1] + 1]
+        if len(p) > 1:
+            groups.setdefault(len(p) - 1, []).append((k, p))
+
+    # compute eigenvalues of companion matrices + polish candidates for real roots:
+    for d, group in groups.items():
+        P = np.asarray([p for _, p in group])
+        A = np.zeros((len(group), d, d), dtype=float)
+        A[:, range(1, d), range(d - 1)] = 1.0
+        A[:, 0, :] = -P[:, 1:] / P[:, :1]
+        eigenvalues = np.linalg.eigvals(A)
+        t = eigenvalues.real
+        r = np.abs(eigenvalues.imag)
+        mask = (
+            (r <= ROOTS_TOL_IMAG * np.maximum(np.abs(t), 1.0))
+            & (t_min - r <= t)
+            & (t <= t_max + r)
+        )
+        rows, _ = np.nonzero(mask)
+        t, accepted = polish_real_roots(P[rows], t[mask], r[mask])
+        accepted &= (t_min <= t) & (t <= t_max)
+        offsets = np.searchsorted(rows, np.arange(len(group) + 1))
+        for (k, _), i1, i2 in zip(group, offsets, offsets[1:]):
+            roots[k] = np.concatenate([t[i1:i2][accepted[i1:i2]], roots[k]])
+
+    roots = [sorted(values.tolist()) for values in roots]
     return roots
 
 
+def polish_real_roots(
+    P: np.ndarray,
+    t: np.ndarray,
+    r: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Polishes approximate real roots `t[i]` of the polynomials with
+    leading-coefficient-first coefficients `P[i]` via Newton's method,
+    where each step is safeguarded, i.e. only taken if it decreases `|p|`
+    and confined to the radius `r[i]` (e.g. the imaginary part of an eigenvalue)
+    plus `ROOTS_TOL_IMAG` around the initial approximation.
+
+    @returns
+    the polished values and a mask indicating which of these are roots,
+    i.e. at which the value of the polynomial vanishes up to rounding errors.
+
+    NOTE: Eigenvalues of conjugate pairs, which are not roots up to rounding errors,
+    are thus discarded, whereas those of (numerically split) multiple roots are accepted.
+    '''
+    eps = np.finfo(float).eps
+    d = P.shape[-1] - 1
+    t0 = t
+    radius = r + ROOTS_TOL_IMAG * np.maximum(np.abs(t0), 1.0)
+
+    def evaluate(t: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Horner's scheme for the value, the derivative and the bound for rounding errors
+        x = np.zeros_like(t)
+        dx = np.zeros_like(t)
+        bound = np.zeros_like(t)
+        for c in P.T:
+            dx = dx * t + x
+            x = x * t + c
+            bound = bound * np.abs(t) + np.abs(c)
+        return x, dx, 4 * (d + 1) * eps * bound
+
+    x, dx, bound = evaluate(t)
+    for _ in range(ROOTS_NEWTON_STEPS):
+        step = np.divide(x, dx, out=np.zeros_like(t), where=dx != 0)
+        t_new = np.clip(t - step, t0 - radius, t0 + radius)
+        x_new, dx_new, bound_new = evaluate(t_new)
+        better = np.abs(x_new) < np.abs(x)
+        if not np.any(better):
+            break
+        t = np.where(better, t_new, t)
+        x = np.where(better, x_new, x)
+        dx = np.where(better, dx_new, dx)
+        bound = np.where(better, bound_new, bound)
+
+    return t, np.abs(x) <= bound
+
+
 def get_recentred_coefficients(coeff: list[float], t0: float) -> list[float]:
     '''
     Let `p` be a `d`-degree polynomial.
@@ -187,6 +343,19 @@ def get_derivative_coefficients(coeff: list[float], n: int = 1) -> list[float]:
     return [nPr(k, n) * c for k, c in enumerate(coeff) if k >= n]
 
 
+def get_derivative_coefficients_batch(coeffs: np.ndarray, n: int = 1) -> np.ndarray:
+    '''
+    Same as `get_derivative_coefficients`, but for an array
+    the rows of which are the coefficients of polynomials.
+    '''
+    coeffs = np.asarray(coeffs, dtype=float)
+    d = coeffs.shape[-1]
+    if n == 0:
+        return coeffs.copy()
+    weights = np.asarray([nPr(k, n) for k in range(n, d)], dtype=float)
+    return coeffs[..., n:] * weights
+
+
 def get_integral_coefficients(coeff: list[float], n: int = 1) -> list[float]:
     if n == 0:
         return coeff[:]
@@ -10,12 +10,20 @@ import sys
 
 os.chdir(os.path.join(os.path.dirname(__file__), '..'))
 
+from .thirdparty.data import *
 from .thirdparty.misc import *
+from .thirdparty.sync import *
+from .thirdparty.system import *
+from .thirdparty.types import *
 
+from .paths import *
+from .core.artifacts import *
+from .core.inputs import *
 from .core.log import *
 from .core.poly import *
 from .setup import config
 from .models.internal import *
+from .models.user import *
 from .steps import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -29,99 +37,25 @@ from .steps import *
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
-def enter(path: str, *_):
+def enter(path: str, *args: str):
+    options = parse_options(*args)
+
     LP = LogProgress('''SETUP''')
     config.set_user_config(path)
+    setup_artifact_cache(cache=options.cache, clear=options.clear_cache)
     LP.next()
 
-    for case in config.CASES:
-        datas = dict()
-        fitinfos = dict()
-        points = dict()
-        LP = LogProgress(f'''RUN CASE {case.label}''', steps=5)
-
-        # process quantities separately
-        for quantity, symb, cfg_data, shift in [
-            ('pressure', 'P', case.data.pressure, 'peak'),
-            ('volume', 'V', case.data.volume, 'peak'),
-        ]:
-            LPsub = LP.subtask(f'''READ DATA {quantity}''', 2)
-            data = step_read_data(cfg_data, quantity)
-            LPsub.next()
-            data = step_normalise_data(case, data, quantity=quantity)
-            LPsub.next()
-
-            LPsub = LP.subtask(f'''INITIAL RECOGNITION OF CYCLES {quantity} ({shift} -> {shift})''', 4)  # fmt: skip
-            data = step_recognise_peaks(case, data, quantity=quantity)
-            LPsub.next()
-            data = step_shift_data_extremes(case, data, quantity=quantity, shift=shift)
-            LPsub.next()
-            data = step_recognise_cycles(case, data, quantity=quantity, shift=shift)
-            LPsub.next()
-            if case.process.cycles.remove_bad:
-                data = step_removed_marked_sections(case, data)
-            LPsub.next()
-
-            LPsub = LP.subtask(f'''INITIAL FIT CURVE {quantity}''', 1)
-            data, fits = step_fit_curve(case, data, quantity=quantity)
-            LPsub.next()
-
-            LPsub = LP.subtask(f'''INITIAL CLASSIFICATION OF POINTS {quantity}''', 1)
-            points_data, points_fit = step_recognise_points(case, data, fits, quantity=quantity)
-            LPsub.next()
-
-            LPsub = LP.subtask(f'''RE-RECOGNITION OF CYCLES {quantity} / MATCHING''', 1)
-            data = step_shift_data_custom(case, data, points_data, quantity=quantity)
-            LPsub.next()
-
-            LPsub = LP.subtask(f'''RE-FIT CURVE {quantity}''', 1)
-            data, fits = step_refit_curve(case, data, points_fit, quantity=quantity)
-            LPsub.next()
-
-            LPsub = LP.subtask(f'''RE-CLASSIFICATION OF POINTS {quantity}''', 1)
-            _, points_fit = step_recognise_points(case, data, fits, quantity=quantity)
-            LPsub.next()
-
-            datas[quantity] = data
-            fitinfos[quantity] = fits
-            points[quantity] = points_fit
-            LP.next()
-
-        # process quantities separately
-        for quantity, symb in [
-            ('pressure', 'P'),
-            ('volume', 'V'),
-        ]:
-            data = datas[quantity]
-            fits = fitinfos[quantity]
-            points_fit = points[quantity]
-
-            LPsub = LP.subtask(f'''OUTPUT TABLES {quantity}''', 1)
-            step_output_single_table(case, data, quantity=quantity)
-            LPsub.next()
-
-            LPsub = LP.subtask('''OUTPUT TIME PLOTS''', 1)
-            plt = step_output_time_plot(
-                case, data, fits, points_fit, quantity=quantity, symb=symb
-            )
-            # plt.show()
-            LPsub.next()
-            LP.next()
+    if options.workers <= 1:
+        for case in config.CASES:
+            run_case(case, concurrent=options.concurrent)
+        return
 
-        # combined output
-        LPsub = LP.subtask(f'''OUTPLOT P/V-LOOP PLOT''', 0)
-        plt = step_output_loop_plot(
-            case,
-            data_p=datas['pressure'],
-            fitinfos_p=fitinfos['pressure'],
-            points_p=points['pressure'],
-            data_v=datas['volume'],
-            fitinfos_v=fitinfos['volume'],
-            points_v=points['volume'],
-        )
-        # plt.show()
-        LPsub.next()
-        LP.next()
+    failures = run_cases_in_pool(
+        path, workers=options.workers, concurrent=options.concurrent, cache=options.cache
+    )
+    if len(failures) > 0:
+        # NOTE: as in serial mode, failures result in a non-zero exit code.
+        log_fatal(f'{len(failures)}/{len(config.CASES)} cases failed: {", ".join(failures)}.')
     return
 
 
@@ -129,7 +63,242 @@ def enter(path: str, *_):
 # SECONDARY
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-#
+
+def parse_options(*args: str):
+    parser = ArgumentParser(prog='src.main', description='Runs the cases of a user config.')
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='number of processes over which the cases are distributed (default: 1).',
+    )
+    parser.add_argument(
+        '--concurrent',
+        action='store_true',
+        help='run the pressure and volume chains of each case concurrently (threads).',
+    )
+    parser.add_argument(
+        '--no-cache',
+        dest='cache',
+        action='store_false',
+        help='do not read or write intermediate results of the processing steps.',
+    )
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help='clear stored intermediate results of the processing steps before running.',
+    )
+    options, _ = parser.parse_known_args(args)
+    return options
+
+
+def setup_artifact_cache(cache: bool = True, clear: bool = False):
+    '''
+    Sets up the on-disk caches of parsed inputs
+    and of intermediate results of the processing steps.
+
+    NOTE: The keys of the artifacts depend on the version, the app config and
+    the source code, so that changes to any of these invalidate previous results.
+    Parsed inputs only depend on the version (and the files + their settings),
+    so that these are reused, even if the code or the app config change.
+    '''
+    if clear:
+        clear_artifact_cache()
+        clear_input_cache()
+    configure_input_cache(persist=cache, context=config.VERSION)
+    configure_artifact_cache(
+        enabled=cache,
+        context=(
+            config.VERSION,
+            config.API_CONFIG.json(),
+            fingerprint_files(get_source_path()),
+        ),
+    )
+    return
+
+
+def run_case(case: UserCase, auto: bool = True, concurrent: bool = False):
+    LP = LogProgress(f'''RUN CASE {case.label}''', steps=5, auto=auto)
+    chains = [
+        ('pressure', 'P', case.data.pressure, 'peak'),
+        ('volume', 'V', case.data.volume, 'peak'),
+    ]
+
+    # process quantities separately
+    if concurrent:
+        # NOTE: the chains are independent, only the loop plot requires both.
+        with ThreadPoolExecutor(max_workers=len(chains)) as pool:
+            futures = [
+                pool.submit(
+                    run_chain,
+                    case,
+                    quantity=quantity,
+                    symb=symb,
+                    cfg_data=cfg_data,
+                    shift=shift,
+                    LP=LogProgress(f'''RUN CASE {case.label} {quantity}''', 2, auto=auto),
+                )
+                for quantity, symb, cfg_data, shift in chains
+            ]
+            results = [future.result() for future in futures]
+        for _ in results:
+            LP.next()
+            LP.next()
+    else:
+        results = [
+            run_chain(case, quantity=quantity, symb=symb, cfg_data=cfg_data, shift=shift, LP=LP)
+            for quantity, symb, cfg_data, shift in chains
+        ]
+
+    (data_p, fitinfos_p, points_p), (data_v, fitinfos_v, points_v) = results
+
+    # combined output
+    LPsub = LP.subtask(f'''OUTPLOT P/V-LOOP PLOT''', 0)
+    plt = step_output_loop_plot(
+        case,
+        data_p=data_p,
+        fitinfos_p=fitinfos_p,
+        points_p=points_p,
+        data_v=data_v,
+        fitinfos_v=fitinfos_v,
+        points_v=points_v,
+    )
+    # plt.show()
+    LPsub.next()
+    LP.next()
+    return
+
+
+def run_chain(
+    case: UserCase,
+    quantity: str,
+    symb: str,
+    cfg_data: DataTimeSeries,
+    shift: str,
+    LP: LogProgress,
+) -> tuple[
+    CycleSeries, list[tuple[tuple[int, int], FittedInfo]], dict[str, SpecialPointsConfig]
+]:
+    '''
+    Runs the processing chain of a single quantity of a case including its outputs.
+    '''
+    LPsub = LP.subtask(f'''READ DATA {quantity}''', 2)
+    if cfg_data.chunksize is None:
+        data = step_read_data(cfg_data, quantity)
+        LPsub.next()
+        data = step_normalise_data(case, data, quantity=quantity)
+    else:
+        # NOTE: chunks are resampled as they are read
+        chunks = step_read_data_chunks(cfg_data, quantity)
+        LPsub.next()
+        data = step_normalise_data_chunks(case, chunks, quantity=quantity)
+    LPsub.next()
+
+    LPsub = LP.subtask(f'''INITIAL RECOGNITION OF CYCLES {quantity} ({shift} -> {shift})''', 4)  # fmt: skip
+    data = step_recognise_peaks(case, data, quantity=quantity)
+    LPsub.next()
+    data = step_shift_data_extremes(case, data, quantity=quantity, shift=shift)
+    LPsub.next()
+    data = step_recognise_cycles(case, data, quantity=quantity, shift=shift)
+    LPsub.next()
+    if case.process.cycles.remove_bad:
+        data = step_removed_marked_sections(case, data)
+    LPsub.next()
+
+    LPsub = LP.subtask(f'''INITIAL FIT CURVE {quantity}''', 1)
+    data, fits = step_fit_curve(case, data, quantity=quantity)
+    LPsub.next()
+
+    LPsub = LP.subtask(f'''INITIAL CLASSIFICATION OF POINTS {quantity}''', 1)
+    points_data, points_fit = step_recognise_points(case, data, fits, quantity=quantity)
+    LPsub.next()
+
+    LPsub = LP.subtask(f'''RE-RECOGNITION OF CYCLES {quantity} / MATCHING''', 1)
+    data = step_shift_data_custom(case, data, points_data, quantity=quantity)
+    LPsub.next()
+
+    LPsub = LP.subtask(f'''RE-FIT CURVE {quantity}''', 1)
+    data, fits = step_refit_curve(case, data, points_fit, quantity=quantity)
+    LPsub.next()
+
+    LPsub = LP.subtask(f'''RE-CLASSIFICATION OF POINTS {quantity}''', 1)
+    _, points_fit = step_recognise_points(case, data, fits, quantity=quantity)
+    LPsub.next()
+    LP.next()
+
+    LPsub = LP.subtask(f'''OUTPUT TABLES {quantity}''', 1)
+    step_output_single_table(case, data, quantity=quantity)
+    LPsub.next()
+
+    LPsub = LP.subtask('''OUTPUT TIME PLOTS''', 1)
+    plt = step_output_time_plot(case, data, fits, points_fit, quantity=quantity, symb=symb)
+    # plt.show()
+    LPsub.next()
+    LP.next()
+
+    return data, fits, points_fit
+
+
+def run_cases_in_pool(
+    path: str,
+    workers: int,
+    concurrent: bool = False,
+    cache: bool = True,
+) -> list[str]:
+    '''
+    Distributes the cases over a pool of processes.
+
+    NOTE: Failures are collected per case and do not interrupt the other cases.
+    Progress is only reported per completed case.
+
+    @returns
+    the labels of the failed cases.
+    '''
+    labels = [case.label for case in config.CASES]
+    LP = LogProgress(f'''RUN CASES ({workers} workers)''', steps=len(labels))
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(run_case_in_worker, path, index, concurrent, cache): label
+            for index, label in enumerate(labels)
+        }
+        for future in as_completed(futures):
+            label = futures[future]
+            err = future.result()
+            if err is not None:
+                failures.append(label)
+                log_error(f'Case {label} failed: {err}')
+            LP.next()
+
+    if len(failures) == 0:
+        log_info(f'All {len(labels)} cases completed.')
+    return failures
+
+
+def run_case_in_worker(
+    path: str,
+    index: int,
+    concurrent: bool = False,
+    cache: bool = True,
+) -> Optional[str]:
+    '''
+    Runs a single case within a worker process.
+
+    NOTE: The global state in `setup.config` is not shared between processes
+    and is thus re-established in each worker.
+
+    @returns
+    `None` on success, otherwise a description of the error.
+    '''
+    try:
+        config.set_user_config(path)
+        setup_artifact_cache(cache=cache)
+        case = config.CASES[index]
+        run_case(case, auto=False, concurrent=concurrent)
+    except (Exception, SystemExit) as err:
+        return f'{type(err).__name__}: {err}'
+    return None
+
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXCEUTION
@@ -9,7 +9,10 @@
 from ..generated.app import EnumCriticalPoints
 from ..generated.internal import EnumExtremePoints
 from ..generated.user import EnumFittingMode
+from ..generated.user import EnumInputFormat
 from ..generated.user import EnumLogLevel
+from ..generated.user import EnumRawType
+from ..generated.user import EnumResampleMethod
 from ..generated.user import EnumType
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -20,6 +23,9 @@ __all__ = [
     'EnumCriticalPoints',
     'EnumExtremePoints',
     'EnumFittingMode',
+    'EnumInputFormat',
     'EnumLogLevel',
+    'EnumRawType',
+    'EnumResampleMethod',
     'EnumType',
 ]
@@ -9,6 +9,9 @@ from ..generated.internal import *
 from .poly import *
 from .points import *
 from .conditions import *
+from .cycles import *
+from .time import *
+from .series import *
 
 # NOTE: foreign import
 from ..generated.app import TimeInterval
@@ -25,6 +28,8 @@ from ..generated.app import SpecialPointsSpec
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'CycleIndex',
+    'CycleSeries',
     'FittedInfo',
     'FittedInfoNormalisation',
     'MarkerSettings',
@@ -34,6 +39,8 @@ __all__ = [
     'SpecialPointsConfig',
     'SpecialPointsConfigs',
     'SpecialPointsSpec',
+    'TIME_KEYS',
+    'TimeAxis',
     'TimeInterval',
     'get_normalisation_params',
     'get_renormalised_data',
@@ -45,6 +52,10 @@ __all__ = [
     'shift_condition',
     'shift_der_condition',
     'shift_int_condition',
+    'clear_onb_cache',
+    'get_onb_cache_info',
     'onb_conditions',
+    'onb_conditions_cached',
     'onb_spectrum',
+    'onb_spectrum_batch',
 ]
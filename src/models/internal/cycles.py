@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from ...thirdparty.code import *
+from ...thirdparty.maths import *
+from ...thirdparty.types import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'CycleIndex',
+]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CLASSES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@dataclass(eq=False)
+class CycleIndex:
+    '''
+    Compressed (CSR-style) index of the cycles partitioning a series:
+    cycle `k` has id `ids[k]` and consists of the rows `offsets[k], ..., offsets[k + 1] - 1`.
+
+    E.g. the per-row cycle ids `[0, 0, 0, 1, 1, 2, 2, 2]`
+    are represented by `offsets = [0, 3, 5, 8]` and `ids = [0, 1, 2]`.
+    '''
+
+    offsets: np.ndarray = field(default_factory=lambda: np.zeros((1,), dtype=int))
+    ids: np.ndarray = field(default_factory=lambda: np.zeros((0,), dtype=int))
+
+    @classmethod
+    def from_labels(cls, labels: list[int] | np.ndarray) -> 'CycleIndex':
+        '''
+        Builds the index from the cycle ids of each row,
+        where every run of equal ids constitutes a cycle.
+        '''
+        labels = np.asarray(labels, dtype=int)
+        starts = np.flatnonzero(np.diff(labels)) + 1
+        offsets = np.concatenate([[0], starts, [len(labels)]]) if len(labels) > 0 else [0]
+        offsets = np.asarray(offsets, dtype=int)
+        return cls(offsets=offsets, ids=labels[offsets[:-1]])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def N(self) -> int:
+        '''
+        Number of rows covered by the index.
+        '''
+        return int(self.offsets[-1])
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def window(self, k: int) -> tuple[int, int]:
+        return int(self.offsets[k]), int(self.offsets[k + 1])
+
+    def windows(self) -> list[tuple[int, int]]:
+        return list(zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist()))
+
+    def labels(self) -> np.ndarray:
+        '''
+        @returns
+        the cycle id of each row.
+        '''
+        return np.repeat(self.ids, self.lengths)
+
+    def locate(self, rows: int | np.ndarray) -> int | np.ndarray:
+        '''
+        @returns
+        the (positional) index `k` of the cycles containing the rows.
+        '''
+        return np.searchsorted(self.offsets, rows, side='right') - 1
+
+    def locate_time(self, t: np.ndarray, times: float | np.ndarray) -> int | np.ndarray:
+        '''
+        @inputs
+        - `t` - the (ordered) times of the rows.
+        - `times` - times to be looked up.
+
+        @returns
+        the (positional) index `k` of the cycles containing the times
+        (`-1` for times before the first cycle).
+        '''
+        return np.searchsorted(t[self.offsets[:-1]], times, side='right') - 1
+
+    def view(self, i1: int, i2: int) -> 'CycleIndex':
+        '''
+        @returns
+        the index restricted to the rows `i1, ..., i2 - 1` (renumbered from `0`).
+        '''
+        offsets = np.clip(self.offsets, i1, i2) - i1
+        return self.from_offsets(offsets, self.ids)
+
+    def select(self, keep: np.ndarray) -> 'CycleIndex':
+        '''
+        @returns
+        the index of the rows indicated by a boolean mask (renumbered from `0`).
+        '''
+        counts = np.concatenate([[0], np.cumsum(np.asarray(keep, dtype=int))])
+        return self.from_offsets(counts[self.offsets], self.ids)
+
+    @classmethod
+    def from_offsets(cls, offsets: np.ndarray, ids: np.ndarray) -> 'CycleIndex':
+        '''
+        Builds the index from (non-decreasing) offsets, dropping empty cycles.
+        '''
+        nonempty = np.flatnonzero(np.diff(offsets) > 0)
+        offsets = np.concatenate([offsets[nonempty], offsets[-1:]])
+        return cls(offsets=np.asarray(offsets, dtype=int), ids=np.asarray(ids)[nonempty])
@@ -10,6 +10,7 @@ from ...thirdparty.maths import *
 from ...thirdparty.types import *
 
 from ...core.poly import *
+from .series import *
 from ..generated.internal import *
 
 # NOTE: foreign import
@@ -107,15 +108,15 @@ def get_renormalised_polynomial_values_only(
 
 
 def get_renormalised_data(
-    data: pd.DataFrame,
+    data: CycleSeries,
     fitinfos: list[tuple[tuple[int, int], FittedInfo]],
     quantity: str,
     t_split: float = 0.0,
-) -> pd.DataFrame:
+) -> CycleSeries:
     t_new = []
     x_new = []
-    t = data['time'].to_numpy(copy=True)
-    x = data[quantity].to_numpy(copy=True)
+    t = data.time()
+    x = data[quantity]
 
     # get common parameters
     _, info0 = fitinfos[-1]
@@ -141,9 +142,10 @@ def get_renormalised_data(
     t = t_new + T * (t_new < t_split) - t_split
 
     # store in new data structure
-    data = pd.DataFrame({'time[orig]': t_new, 'time': t, quantity: x_new}).astype(
-        {'time[orig]': 'float', 'time': 'float', quantity: 'float'}
-    )
+    data = CycleSeries(N=len(t))
+    data['time[orig]'] = np.asarray(t_new, dtype=float)
+    data['time'] = np.asarray(t, dtype=float)
+    data[quantity] = np.asarray(x_new, dtype=float)
     return data
 
 
@@ -8,6 +8,7 @@
 from ...thirdparty.maths import *
 from ...thirdparty.types import *
 
+from ...core.cache import *
 from ...core.poly import *
 
 # NOTE: foreign import
@@ -19,15 +20,26 @@ from ..generated.app import PolyIntCondition
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'clear_onb_cache',
+    'get_onb_cache_info',
     'onb_conditions',
+    'onb_conditions_cached',
     'onb_spectrum',
+    'onb_spectrum_batch',
 ]
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # LOCAL VARIABLES / CONSTANTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-#
+# NOTE: the conditions only vary between quantities and between fit/refit,
+# so a handful of entries suffices.
+ONB_CACHE_SIZE = 32
+_onb_cache: LRUCache[tuple, np.ndarray] = LRUCache(maxsize=ONB_CACHE_SIZE)
+
+# Gram-matrices of the standard basis {tᵏ}ₖ, keyed by degrees and interval.
+IP_MATRIX_CACHE_SIZE = 32
+_ip_matrix_cache: LRUCache[tuple, np.ndarray] = LRUCache(maxsize=IP_MATRIX_CACHE_SIZE)
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS - ONB
@@ -100,11 +112,41 @@ def onb_conditions(
     D, U = np.linalg.eigh(S)
     Q = B @ U.conj()  # orthogonal family
     Q = Q * 1 / np.sqrt(D)  # normalise each columns
-    S = ip_basis_basis(Q, t1=t1, t2=t2)
 
     return Q
 
 
+def onb_conditions_cached(
+    deg: int,
+    conds: list[PolyDerCondition | PolyIntCondition],
+    t1: float = 0.0,
+    t2: float = 1.0,
+) -> np.ndarray:
+    '''
+    Same as `onb_conditions`, but looks up the ONB in an LRU-cache
+    keyed by the degree, the (normalised) set of conditions and the interval.
+
+    NOTE: The returned array is shared between calls and is thus read-only.
+    '''
+    key = onb_conditions_key(deg=deg, conds=conds, t1=t1, t2=t2)
+
+    def compute() -> np.ndarray:
+        Q = onb_conditions(deg=deg, conds=conds, t1=t1, t2=t2)
+        Q.flags.writeable = False
+        return Q
+
+    return _onb_cache.get(key, compute)
+
+
+def get_onb_cache_info() -> CacheInfo:
+    return _onb_cache.info
+
+
+def clear_onb_cache():
+    _onb_cache.clear()
+    return
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS - SPECTRUM
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -180,19 +222,8 @@ def onb_spectrum(
     C1 = dx / dt
     C0 = np.asarray(x[:-1]) - C1 * np.asarray(t[:-1])
 
-    # --------------------------------
     # Determine coefficients of integrals of polynomials:
-    # NOTE:
-    # Q[:, j] = coeff of polynomial qⱼ
-    # Q1[:, j] = coeff of polynomial q1ⱼ, a stemfunction of qⱼ
-    # Q2[:, j] = coeff of polynomial q2ⱼ, a stemfunction of q1ⱼ
-    # R[:, j] = coeff of polynomial rⱼ = t·q1ⱼ - q2ⱼ
-    # --------------------------------
-    Q1 = np.asarray([get_integral_coefficients(Q[:, j].tolist()) for j in range(m)]).T
-    Q2 = np.asarray([get_integral_coefficients(Q1[:, j].tolist()) for j in range(m)]).T
-    zeros = np.zeros((1, m))
-    R = np.concatenate([zeros, Q1]) - Q2
-    Q1 = np.concatenate([Q1, zeros])  # pad
+    Q1, R = onb_integral_coefficients(Q)
 
     # --------------------------------
     # NOTE:
@@ -254,6 +285,68 @@ def onb_spectrum(
     return coeff.tolist()
 
 
+def onb_spectrum_batch(
+    Q: np.ndarray,
+    t: np.ndarray,
+    x: np.ndarray,
+    offsets: Iterable[int],
+    T: float | np.ndarray = 1.0,
+    periodic: bool = False,
+    in_standard_basis: bool = True,
+    chunk_size: int = 2**20,
+) -> np.ndarray:
+    '''
+    Batched version of `onb_spectrum` for a concatenation of (time-normalised) cycles.
+
+    @inputs
+    - `Q` - a `d x m` array, where `Q[:,j]` denote the coefficients of a polynomial qⱼ
+      and {qⱼ}ⱼ is an ONB
+    - (`t`, `x`) - the concatenated discrete time-series of all cycles
+    - `offsets` - the `n + 1` indices, such that cycle `k` is `(t, x)[offsets[k]:offsets[k+1]]`
+      (each cycle must be non-empty)
+    - `T` - the total time-duration of each cycle (scalar or one value per cycle)
+    - `periodic` - whether the series of each cycle is periodic
+    - `in_standard_basis` - whether to convert the computed innerproducts
+       to coefficients wrt the standard basis {tʲ}ⱼ.
+    - `chunk_size` - (approximate) maximal number of points processed at once,
+      in order to bound memory usage.
+
+    @returns
+    An `n x d` (resp. `n x m`) array, the `k`th row of which coincides with
+    `onb_spectrum(Q=Q, t=t[i1:i2], x=x[i1:i2], T=T[k], ...)` for `i1, i2 = offsets[k:k+2]`.
+    '''
+    t = np.asarray(t, dtype=float)
+    x = np.asarray(x, dtype=float)
+    offsets = np.asarray(offsets, dtype=int)
+    n = len(offsets) - 1
+    T = np.broadcast_to(np.asarray(T, dtype=float), (n,))
+    Q1, R = onb_integral_coefficients(Q)
+    coeffs = np.zeros((n, Q.shape[1]), dtype=float)
+
+    # process cycles in chunks to bound the size of the matrix of monomes
+    k1 = 0
+    while k1 < n:
+        k2 = int(np.searchsorted(offsets, offsets[k1] + chunk_size, side='right')) - 1
+        k2 = min(max(k2, k1 + 1), n)
+        i1 = offsets[k1]
+        i2 = offsets[k2]
+        coeffs[k1:k2, :] = onb_spectrum_segments(
+            Q1=Q1,
+            R=R,
+            t=t[i1:i2],
+            x=x[i1:i2],
+            offsets=offsets[k1 : k2 + 1] - i1,
+            T=T[k1:k2],
+            periodic=periodic,
+        )
+        k1 = k2
+
+    if in_standard_basis:
+        coeffs = coeffs @ Q.T
+
+    return coeffs
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # AUXILIARY METHODS - CONDITIONS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -304,6 +397,106 @@ def force_poly_condition(
     return row.tolist()
 
 
+def onb_conditions_key(
+    deg: int,
+    conds: list[PolyDerCondition | PolyIntCondition],
+    t1: float = 0.0,
+    t2: float = 1.0,
+) -> tuple:
+    '''
+    Hashable representation of the inputs of `onb_conditions`.
+
+    NOTE: The null-space of the condition-matrix does not depend
+    on the order or repetition of its rows, so the conditions are sorted and made unique.
+    '''
+    keys = set()
+    for cond in conds:
+        if isinstance(cond, PolyDerCondition):
+            keys.add(('der', cond.derivative, float(cond.time)))
+        # elif isinstance(cond, PolyIntCondition):
+        else:
+            keys.add(('int', tuple((float(I.a), float(I.b)) for I in cond.times)))
+    return (deg, tuple(sorted(keys)), float(t1), float(t2))
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS - SPECTRUM
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def onb_integral_coefficients(Q: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Determine coefficients of integrals of polynomials:
+
+    - `Q[:, j]` = coeff of polynomial qⱼ
+    - `Q1[:, j]` = coeff of polynomial q1ⱼ, a stemfunction of qⱼ
+    - `Q2[:, j]` = coeff of polynomial q2ⱼ, a stemfunction of q1ⱼ
+    - `R[:, j]` = coeff of polynomial rⱼ = t·q1ⱼ - q2ⱼ
+
+    @returns
+    `Q1` (padded to the size of `R`) and `R`.
+    '''
+    m = Q.shape[1]
+    Q1 = np.asarray([get_integral_coefficients(Q[:, j].tolist()) for j in range(m)]).T
+    Q2 = np.asarray([get_integral_coefficients(Q1[:, j].tolist()) for j in range(m)]).T
+    zeros = np.zeros((1, m))
+    R = np.concatenate([zeros, Q1]) - Q2
+    Q1 = np.concatenate([Q1, zeros])  # pad
+    return Q1, R
+
+
+def onb_spectrum_segments(
+    Q1: np.ndarray,
+    R: np.ndarray,
+    t: np.ndarray,
+    x: np.ndarray,
+    offsets: np.ndarray,
+    T: np.ndarray,
+    periodic: bool,
+) -> np.ndarray:
+    '''
+    Computes `I0^* · C0 + I1^* · C1` (cf. `onb_spectrum`) for each cycle
+    of a concatenated time-series, using one matrix product for all subintervals
+    and segment-wise sums.
+    '''
+    n = len(offsets) - 1
+    starts = offsets[:-1]
+    ends = offsets[1:]
+    lengths = ends - starts
+
+    # --------------------------------
+    # NOTE:
+    # Each cycle of length `n` is extended by an end point to `n + 1` points
+    # (cf. `onb_spectrum`). In the extended arrays, cycle k starts at offsets[k] + k.
+    # --------------------------------
+    t0 = np.repeat(t[starts], lengths)
+    t_ext = np.insert(t - t0, ends, T)
+    if periodic:
+        x_ext = np.insert(x, ends, x[starts])
+    else:
+        # [x₀, (x₀ + x₁)/2, ..., (xₙ₋₂ + xₙ₋₁)/2, xₙ₋₁]
+        x_ext = (np.insert(x, ends, x[ends - 1]) + np.insert(x, starts, x[starts])) / 2
+
+    dt = np.diff(t_ext)
+    dx = np.diff(x_ext)
+    dt[dt == 0.0] = 1.0
+    C1 = dx / dt
+    C0 = x_ext[:-1] - C1 * t_ext[:-1]
+
+    # NOTE: differences across the boundary of two cycles must not contribute
+    starts_ext = starts + np.arange(n)
+    C0[starts_ext[1:] - 1] = 0.0
+    C1[starts_ext[1:] - 1] = 0.0
+
+    monomes = np.vander(t_ext, N=Q1.shape[0], increasing=True)
+    dmonomes = monomes[1:, :] - monomes[:-1, :]
+    I0 = dmonomes @ Q1
+    I1 = dmonomes @ R
+    terms = C0[:, np.newaxis] * I0.conj() + C1[:, np.newaxis] * I1.conj()
+    coeffs = np.add.reduceat(terms, starts_ext, axis=0)
+    return coeffs
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # AUXILIARY METHODS - INNER PROD
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -314,14 +507,13 @@ def ip_poly_poly(
     coeff2: list[float],
     t1: float = 0,
     t2: float = 1,
-    ip: list[np.ndarray] = [],
 ) -> float:
+    coeff1 = np.asarray(coeff1)
+    coeff2 = np.asarray(coeff2)
     d1 = len(coeff1) - 1
     d2 = len(coeff2) - 1
-    if len(ip) == 0:
-        ip[:] = [ip_poly_generate_matrix(d1, d2, t1, t2)]
-    coeffs = coeff1[:, np.newaxis] * coeff2[np.newaxis, :].conj()
-    s = np.sum(ip[0] * coeffs)
+    G = ip_poly_generate_matrix_cached(d1, d2, t1=t1, t2=t2)
+    s = coeff1 @ G @ coeff2.conj()
     return s
 
 
@@ -329,22 +521,43 @@ def ip_basis_basis(
     B: np.ndarray,
     t1: float = 0.0,
     t2: float = 1.0,
-) -> float:
-    d = B.shape[0] - 1
-    m = B.shape[1]
-    ip = []
-    S = np.zeros((m, m))
+) -> np.ndarray:
+    '''
+    Computes the Gram-matrix
 
-    for j1 in range(m):
-        for j2 in range(j1 + 1):
-            S[j1, j2] = ip_poly_poly(B[:, j1], B[:, j2], t1=t1, t2=t2, ip=ip)
+        S[j1, j2] = ⟨p_j1, p_j2⟩ = ∑ₖ₁, ₖ₂ B[k1, j1] · G[k1, k2] · B[k2, j2]^*
 
-    for j2 in range(m):
-        for j1 in range(j2):
-            S[j1, j2] = S[j2, j1]
+    i.e. S = Bᵀ · G · B^*, where G[k1, k2] = ⟨tᵏ¹, tᵏ²⟩ on [t1, t2].
+    '''
+    d = B.shape[0] - 1
+    G = ip_poly_generate_matrix_cached(d, d, t1=t1, t2=t2)
+    S = B.T @ G @ B.conj()
+    # NOTE: S is hermitian in exact arithmetic, so remove rounding asymmetries
+    S = (S + S.T.conj()) / 2
     return S
 
 
+def ip_poly_generate_matrix_cached(
+    d1: int,
+    d2: int,
+    t2: float = 1.0,
+    t1: float = 0.0,
+) -> np.ndarray:
+    '''
+    Same as `ip_poly_generate_matrix`, but looks up the matrix in an LRU-cache.
+
+    NOTE: The returned array is shared between calls and is thus read-only.
+    '''
+    key = (d1, d2, float(t1), float(t2))
+
+    def compute() -> np.ndarray:
+        G = ip_poly_generate_matrix(d1, d2, t2=t2, t1=t1)
+        G.flags.writeable = False
+        return G
+
+    return _ip_matrix_cache.get(key, compute)
+
+
 def ip_poly_generate_matrix(
     d1: int,
     d2: int,
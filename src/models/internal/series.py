@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from ...thirdparty.code import *
+from ...thirdparty.data import *
+from ...thirdparty.maths import *
+from ...thirdparty.types import *
+
+from .cycles import *
+from .time import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'CycleSeries',
+]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CLASSES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@dataclass
+class CycleSeries:
+    '''
+    Struct-of-arrays container of a (resampled) time series
+    and the quantities derived from it during processing.
+
+    - `N` - number of points.
+    - `columns` - arrays of length `N`, keyed as the columns of the outputs,
+      e.g. `pressure`, `pressure[peak]`, `marked`.
+    - `axes` - implicit time axes (cf. `TimeAxis`), e.g. `time` and `time[orig]`.
+    - `cycles` - index of the cycles (cf. `CycleIndex`), once recognised,
+      which replaces a column of cycle ids.
+
+    NOTE: Columns may be views onto shared buffers (cf. `allocate`)
+    and selections of contiguous rows (e.g. of a cycle) are zero-copy views (cf. `view`).
+    Columns are hence replaced rather than modified in place, unless the series owns them.
+    Conversion to data frames only takes place for outputs (cf. `to_frame`).
+    '''
+
+    N: int = field()
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+    axes: dict[str, TimeAxis] = field(default_factory=dict)
+    cycles: Optional[CycleIndex] = field(default=None)
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> 'CycleSeries':
+        series = cls(N=len(data))
+        for key in data.columns:
+            series[key] = data[key].to_numpy()
+        return series
+
+    def to_frame(self) -> pd.DataFrame:
+        '''
+        @returns
+        the series as a data frame, in which the time axes are materialised as (first) columns,
+        and the cycle index as the column `cycle`.
+        '''
+        times = {key: self.time(key=key) for key in TIME_KEYS if key in self.axes}
+        cycles = {} if self.cycles is None else {'cycle': self.cycles.labels()}
+        return pd.DataFrame({**times, **self.columns, **cycles}, copy=False)
+
+    def __len__(self) -> int:
+        return self.N
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.columns[key]
+
+    def __setitem__(self, key: str, values: np.ndarray | list):
+        values = np.asarray(values)
+        if values.shape != (self.N,):
+            raise ValueError(f'Column {key} of shape {values.shape} does not fit series of length {self.N}.')  # fmt: skip
+        self.axes.pop(key, None)
+        self.columns[key] = values
+        return
+
+    def keys(self) -> list[str]:
+        return list(self.columns.keys())
+
+    def copy(self) -> 'CycleSeries':
+        '''
+        @returns
+        a copy of the series, which owns its columns.
+        '''
+        return CycleSeries(
+            N=self.N,
+            columns={key: values.copy() for key, values in self.columns.items()},
+            axes=dict(self.axes),
+            cycles=self.cycles,
+        )
+
+    def allocate(
+        self,
+        keys: list[str],
+        dtype: type = float,
+        fill_value: Any = None,
+    ) -> np.ndarray:
+        '''
+        Preallocates one contiguous `len(keys) x N` buffer for the columns `keys`,
+        so that they can be computed in place.
+
+        @returns
+        the buffer, whose rows are the columns.
+        '''
+        if fill_value is None:
+            buffer = np.empty((len(keys), self.N), dtype=dtype)
+        else:
+            buffer = np.full((len(keys), self.N), fill_value, dtype=dtype)
+        for key, values in zip(keys, buffer):
+            self[key] = values
+        return buffer
+
+    def time_axis(self, key: str = 'time') -> Optional[TimeAxis]:
+        return self.axes.get(key)
+
+    def set_time_axis(self, axis: Optional[TimeAxis], key: str = 'time'):
+        '''
+        Stores an implicit time axis (replacing materialised times).
+        If `axis` is `None` the key is removed.
+        '''
+        self.columns.pop(key, None)
+        self.axes.pop(key, None)
+        if axis is None:
+            return
+        if len(axis) != self.N:
+            raise ValueError(f'Time axis {key} does not fit series of length {self.N}.')
+        self.axes[key] = axis
+        return
+
+    def time(self, key: str = 'time') -> np.ndarray:
+        '''
+        @returns
+        the times as a float array, expanding an implicit time axis if necessary.
+        '''
+        if key in self.columns:
+            return self.columns[key]
+        if key not in self.axes:
+            raise KeyError(f'No times {key} stored with series.')
+        return self.axes[key].to_numpy()
+
+    def view(self, i1: int, i2: int) -> 'CycleSeries':
+        '''
+        @returns
+        the rows `i1, ..., i2 - 1` (e.g. a cycle) as a series of zero-copy views.
+        '''
+        i1, i2 = max(i1, 0), min(i2, self.N)
+        i2 = max(i1, i2)
+        return CycleSeries(
+            N=i2 - i1,
+            columns={key: values[i1:i2] for key, values in self.columns.items()},
+            axes={key: axis.select(i1, i2) for key, axis in self.axes.items()},
+            cycles=None if self.cycles is None else self.cycles.view(i1, i2),
+        )
+
+    def select(self, keep: np.ndarray) -> 'CycleSeries':
+        '''
+        Selects the rows indicated by a boolean mask.
+
+        NOTE: Contiguous selections are zero-copy views,
+        otherwise the columns are copied and the time axes materialised.
+        '''
+        keep = np.asarray(keep, dtype=bool)
+        (indices,) = np.where(keep)
+        if len(indices) == 0:
+            return self.view(0, 0)
+        i1, i2 = int(indices[0]), int(indices[-1]) + 1
+        if i2 - i1 == len(indices):
+            return self.view(i1, i2)
+        return CycleSeries(
+            N=len(indices),
+            columns={
+                **{key: axis.to_numpy()[indices] for key, axis in self.axes.items()},
+                **{key: values[indices] for key, values in self.columns.items()},
+            },
+            cycles=None if self.cycles is None else self.cycles.select(keep),
+        )
+
+    def rotate(self, k: int) -> 'CycleSeries':
+        '''
+        @returns
+        the series with rows rotated, so that row `k` becomes the first.
+        '''
+        columns = {key: np.roll(values, -k) for key, values in self.columns.items()}
+        axes = {}
+        for key, axis in self.axes.items():
+            axis_rotated = axis.rotate(k)
+            if axis_rotated is None:
+                columns[key] = np.roll(axis.to_numpy(), -k)
+            else:
+                axes[key] = axis_rotated
+        cycles = None
+        if self.cycles is not None:
+            cycles = CycleIndex.from_labels(np.roll(self.cycles.labels(), -k))
+        return CycleSeries(N=self.N, columns=columns, axes=axes, cycles=cycles)
+
+    def take(self, indices: np.ndarray, fixed: list[str] = ['time']) -> 'CycleSeries':
+        '''
+        Gathers the rows by `indices` (via one gather per column).
+
+        @inputs
+        - `indices` - a permutation of the rows within the cycles (so the cycle index is kept).
+        - `fixed` - times, which are not permuted (i.e. the values move along these times).
+          All other implicit time axes are materialised.
+        '''
+        columns = {}
+        axes = {}
+        for key, axis in self.axes.items():
+            if key in fixed:
+                axes[key] = axis
+            else:
+                columns[key] = axis.to_numpy()[indices]
+        for key, values in self.columns.items():
+            columns[key] = values if key in fixed else values[indices]
+        return CycleSeries(N=self.N, columns=columns, axes=axes, cycles=self.cycles)
+
+    def materialise_time(self, key: str = 'time'):
+        '''
+        Stores an implicit time axis as a column.
+        '''
+        if key in self.axes:
+            self.columns[key] = self.axes.pop(key).to_numpy()
+        return
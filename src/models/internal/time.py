@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from ...thirdparty.code import *
+from ...thirdparty.data import *
+from ...thirdparty.maths import *
+from ...thirdparty.types import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'TimeAxis',
+    'TIME_KEYS',
+]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+TIME_KEYS = ['time', 'time[orig]']
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CLASSES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@dataclass(frozen=True)
+class TimeAxis:
+    '''
+    Compact representation of a uniform time axis
+
+    ```
+    t[i] = dt · ((offset + i) mod period)    (i = 0, 1, ..., N - 1)
+    ```
+
+    where the modulus only applies if `period` is set.
+    This covers the axis after resampling (`offset = 0`),
+    contiguous selections of it (`offset > 0`)
+    and rotations of periodic series (`period` = length of the original axis).
+
+    NOTE: Expanded via `np.linspace`, so that the values coincide
+    with previously materialised time columns.
+    '''
+
+    dt: float = field()
+    N: int = field()
+    offset: int = field(default=0)
+    period: Optional[int] = field(default=None)
+
+    def __len__(self) -> int:
+        return self.N
+
+    @property
+    def T(self) -> float:
+        '''
+        Total duration of the axis.
+        '''
+        return self.N * self.dt
+
+    def indices(self) -> np.ndarray:
+        '''
+        @returns
+        the indices of the time points relative to the original axis.
+        '''
+        i = self.offset + np.arange(self.N)
+        if self.period is not None:
+            i %= self.period
+        return i
+
+    def to_numpy(self) -> np.ndarray:
+        M = self.period or (self.offset + self.N)
+        t = np.linspace(start=0.0, stop=M * self.dt, num=M, endpoint=False)
+        if self.offset == 0 and M == self.N:
+            return t
+        return t[self.indices()]
+
+    def select(self, start: int, stop: int) -> 'TimeAxis':
+        '''
+        @returns
+        the axis restricted to the (contiguous) rows `start, ..., stop - 1`.
+        '''
+        return dataclass_replace(self, N=int(stop - start), offset=int(self.offset + start))
+
+    def rotate(self, k: int) -> Optional['TimeAxis']:
+        '''
+        @returns
+        the axis of the rows rotated by `k` (row `i` ⟼ row `(i + k) mod N`),
+        or `None` if this is not representable (rotation of a proper selection).
+        '''
+        M = self.period or (self.offset + self.N)
+        if self.N != M:
+            return None
+        return dataclass_replace(self, offset=int((self.offset + k) % M), period=M)
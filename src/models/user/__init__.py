@@ -12,6 +12,8 @@ from ..generated.user import *
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'DataRawHeader',
+    'DataSkipRule',
     'DataTypeColumn',
     'DataTimeSeries',
     'DataTypeQuantity',
@@ -13,6 +13,7 @@ from .step_recognise_cycles import *
 from .step_fit_curve import *
 from .step_recognise_points import *
 from .step_align_cycles import *
+from .step_stream import *
 from .step_output_tables import *
 from .step_output_plots import *
 
@@ -22,7 +23,9 @@ from .step_output_plots import *
 
 __all__ = [
     'step_read_data',
+    'step_read_data_chunks',
     'step_normalise_data',
+    'step_normalise_data_chunks',
     'step_combine_data',
     'step_recognise_peaks',
     'step_shift_data_extremes',
@@ -33,6 +36,7 @@ __all__ = [
     'step_refit_curve',
     'step_recognise_points',
     'step_align_cycles',
+    'step_stream_engine',
     'step_output_single_table',
     'step_output_combined_table',
     'step_output_time_plot',
@@ -10,8 +10,10 @@ from ..thirdparty.maths import *
 from ..thirdparty.types import *
 
 from ..setup import config
+from ..core.artifacts import *
 from ..core.utils import *
 from ..models.user import *
+from ..models.internal import *
 from ..algorithms.peaks import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -19,7 +21,9 @@ from ..algorithms.peaks import *
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'cached_step',
     'get_time_aspects',
+    'get_time_increment',
     'recocompute_time_axis',
 ]
 
@@ -27,6 +31,9 @@ __all__ = [
 # METHODS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+# NOTE: processing steps only depend on the processing options of a case.
+cached_step = cached_artifact(case=lambda case: case.process)
+
 
 def get_time_aspects(
     t: Iterable[float],
@@ -59,12 +66,34 @@ def get_time_aspects(
     return N, dt, T_max
 
 
+def get_time_increment(data: CycleSeries) -> float:
+    '''
+    @returns
+    the time increment of (homogenised) data,
+    read off the implicit time axis if available.
+    '''
+    axis = data.time_axis()
+    if axis is not None:
+        return axis.dt
+    _, dt, _ = get_time_aspects(data.time())
+    return dt
+
+
 def recocompute_time_axis(
-    data: pd.DataFrame,
+    data: CycleSeries,
     N: int,
     dt: float,
-) -> pd.DataFrame:
-    T_max = N * dt
-    data['time[orig]'] = data['time']
-    data['time'] = np.linspace(start=0.0, stop=T_max, num=N, endpoint=False)
+) -> CycleSeries:
+    '''
+    Replaces the time axis of the data by the uniform axis of `N` points with increment `dt`
+    and keeps the previous times as `time[orig]`.
+
+    NOTE: The axes are stored implicitly (cf. `TimeAxis`).
+    '''
+    axis = data.time_axis()
+    if axis is None:
+        data['time[orig]'] = data.time()
+    else:
+        data.set_time_axis(axis, key='time[orig]')
+    data.set_time_axis(TimeAxis(dt=dt, N=N))
     return data
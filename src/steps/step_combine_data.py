@@ -8,9 +8,14 @@
 from ..thirdparty.data import *
 from ..thirdparty.maths import *
 from ..thirdparty.physics import *
+from ..thirdparty.types import *
 
 from ..setup import config
+from ..core.log import *
+from ..algorithms.resample import *
+from ..models.enums import *
 from ..models.user import *
+from ..models.internal import *
 from .methods import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -19,6 +24,7 @@ from .methods import *
 
 __all__ = [
     'step_normalise_data',
+    'step_normalise_data_chunks',
     'step_combine_data',
 ]
 
@@ -27,11 +33,12 @@ __all__ = [
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
+@cached_step
 def step_normalise_data(
     case: UserCase,
     data: pd.DataFrame,
     quantity: str,
-) -> pd.DataFrame:
+) -> CycleSeries:
     cfg = case.process
     cfg_units = config.UNITS
 
@@ -51,13 +58,78 @@ def step_normalise_data(
     N = math.ceil(T / dt)
     T = N * dt
 
-    # interpolate data
-    time_uniform = np.linspace(start=0, stop=T, num=N, endpoint=False)
-    values = interpolate_curve(time_uniform, x=time, y=values, T_max=T, periodic=True)
+    # resample data
+    values = resample_uniform(time, values, dt=dt, N=N, method=cfg.combine.method)
 
-    data = pd.DataFrame({'time': time_uniform, quantity: values}).astype(
-        {'time': float, quantity: float}
-    )
+    data = CycleSeries(N=N)
+    data[quantity] = np.asarray(values, dtype=float)
+    data.set_time_axis(TimeAxis(dt=dt, N=N))
+
+    return data
+
+
+def step_normalise_data_chunks(
+    case: UserCase,
+    chunks: Iterable[tuple[np.ndarray, np.ndarray]],
+    quantity: str,
+) -> CycleSeries:
+    '''
+    Same as `step_normalise_data`, but resamples the (ordered) chunks `(t, x)`
+    of a time series as they arrive, so that only the resampled data is held in memory.
+
+    NOTE: The median time increment (used to determine the total duration)
+    is estimated on the first chunk.
+    In this mode the values are always interpolated linearly.
+    '''
+    cfg = case.process
+    cfg_units = config.UNITS
+
+    if cfg.combine.method != EnumResampleMethod.LINEAR:
+        log_warn(f'Resampling via {cfg.combine.method.value} not available for chunks. Linear interpolation used instead.')  # fmt: skip
+
+    unit = cfg.combine.unit
+    cv_t = convert_units(unitFrom=unit, unitTo=cfg_units.get('time', unit))
+
+    dt = cv_t * cfg.combine.dt
+    dt_median = None
+    t0, x0 = None, None
+    t_prev, x_prev = np.zeros((0,)), np.zeros((0,))
+    k = 0
+    values = []
+    for t, x in chunks:
+        if t0 is None:
+            t0, x0 = t[0], x[0]
+            dt_median = np.median(np.diff(t))
+        t = np.concatenate([t_prev, t - t0])
+        x = np.concatenate([x_prev, x])
+        # interpolate at all grid points up to the last sample
+        k_next = math.floor(t[-1] / dt) + 1
+        values.append(np.interp(dt * np.arange(k, k_next), t, x))
+        k = k_next
+        t_prev, x_prev = t[-1:], x[-1:]
+
+    if t0 is None:
+        data = CycleSeries(N=0)
+        data[quantity] = np.zeros((0,), dtype=float)
+        data.set_time_axis(TimeAxis(dt=dt, N=0))
+        return data
+
+    # get total duration
+    T = t_prev[-1] + dt_median
+    T = max(T, cv_t * (cfg.combine.t_max or 0.0))
+
+    # compute num points and update T (ensure dt is as set)
+    N = math.ceil(T / dt)
+    T = N * dt
+
+    # interpolate at the remaining grid points (periodic continuation)
+    t_tail = dt * np.arange(k, N)
+    values.append(np.interp(t_tail, [t_prev[-1], T], [x_prev[-1], x0]))
+    values = np.concatenate(values)[:N]
+
+    data = CycleSeries(N=N)
+    data[quantity] = np.asarray(values, dtype=float)
+    data.set_time_axis(TimeAxis(dt=dt, N=N))
 
     return data
 
@@ -66,7 +138,7 @@ def step_combine_data(
     case: UserCase,
     data_pressure: pd.DataFrame,
     data_volume: pd.DataFrame,
-) -> pd.DataFrame:
+) -> CycleSeries:
     cfg = case.process
     cfg_units = config.UNITS
 
@@ -89,45 +161,13 @@ def step_combine_data(
     N = math.ceil(T_max / dt)
     T_max = N * dt
 
-    # interpolate data
-    time = np.linspace(start=0, stop=T_max, num=N, endpoint=False)
-    pressure = interpolate_curve(time, x=time_pressure, y=pressure, T_max=T_max, periodic=True)
-    volume = interpolate_curve(time, x=time_volume, y=volume, T_max=T_max, periodic=True)
-
-    data = pd.DataFrame(
-        {
-            'time': time,
-            'pressure': pressure,
-            'volume': volume,
-        }
-    ).astype(
-        {
-            'time': float,
-            'pressure': float,
-            'volume': float,
-        }
-    )
-
-    return data
+    # resample data
+    pressure = resample_uniform(time_pressure, pressure, dt=dt, N=N, method=cfg.combine.method)
+    volume = resample_uniform(time_volume, volume, dt=dt, N=N, method=cfg.combine.method)
 
+    data = CycleSeries(N=N)
+    data['pressure'] = np.asarray(pressure, dtype=float)
+    data['volume'] = np.asarray(volume, dtype=float)
+    data.set_time_axis(TimeAxis(dt=dt, N=N))
 
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-# AUXILIARY METHODS
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-
-
-def interpolate_curve(
-    t: np.ndarray,
-    x: np.ndarray,
-    y: np.ndarray,
-    T_max: float,
-    periodic: bool,
-) -> np.ndarray:
-    return np.interp(
-        t,
-        x,
-        y,
-        left=None,
-        right=None,
-        period=T_max if periodic else None,
-    )
+    return data
@@ -17,6 +17,7 @@ from ..models.user import *
 from ..models.internal import *
 from ..algorithms.cycles import *
 from ..algorithms.fit import *
+from .methods import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
@@ -32,13 +33,14 @@ __all__ = [
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
+@cached_step
 def step_fit_curve(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
     quantity: str,
     conds: Optional[list[PolyCritCondition | PolyDerCondition | PolyIntCondition]] = None,
     n_der: int = 2,
-) -> tuple[pd.DataFrame, list[tuple[tuple[int, int], FittedInfo]]]:
+) -> tuple[CycleSeries, list[tuple[tuple[int, int], FittedInfo]]]:
     '''
     Fits polynomial to cycles in time-series, forcing certain conditions
     on the `n`th-derivatives at certain time points,
@@ -50,10 +52,9 @@ def step_fit_curve(
     conds = conds or get_polynomial_condition(quantity)
 
     # fit polynomial
-    t = data['time'].to_numpy(copy=True)
-    x = data[quantity].to_numpy(copy=True)
-    cycles = data['cycle'].tolist()
-    fitinfos = fit_poly_cycles(t=t, x=x, cycles=cycles, conds=conds)
+    t = data.time()
+    x = data[quantity]
+    fitinfos = fit_poly_cycles(t=t, x=x, cycles=data.cycles, conds=conds)
 
     # compute n'th derivatives
     data = compute_nth_derivatives_for_cycles(
@@ -65,11 +66,11 @@ def step_fit_curve(
 
 def step_refit_curve(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
     points: dict[str, SpecialPointsConfig],
     quantity: str,
     n_der: int = 2,
-) -> tuple[pd.DataFrame, list[tuple[tuple[int, int], FittedInfo]]]:
+) -> tuple[CycleSeries, list[tuple[tuple[int, int], FittedInfo]]]:
     align = get_alignment_point(quantity)
     conds = get_polynomial_condition(quantity)
 
@@ -102,17 +103,19 @@ def step_refit_curve(
 
 def compute_nth_derivatives_for_cycles(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
     fitinfos: list[tuple[tuple[int, int], FittedInfo]],
     quantity: str,
     n_der: int,
-) -> pd.DataFrame:
+) -> CycleSeries:
     '''
     Computes the n'th derivatives of the fitted curve for each cycle.
+
+    NOTE: All derivative orders are evaluated for all cycles at once,
+    writing into the preallocated `(n_der + 1) x N` columns of the series.
     '''
     cfg = case.process
-    N = len(data)
-    t = data['time'].to_numpy(copy=True)
+    t = data.time()
 
     match cfg.fit.mode:
         case EnumFittingMode.AVERAGE:
@@ -121,36 +124,37 @@ def compute_nth_derivatives_for_cycles(
         case _:
             coeffs = [info.coefficients[:] for _, info in fitinfos[:-1]]
 
-    # compute each n'th derivative
+    # NOTE: the cycles partition the time-series
+    offsets = data.cycles.offsets
+    lengths = data.cycles.lengths
+    n_cycles = len(data.cycles)
+    coeffs = np.asarray(coeffs, dtype=float).reshape((n_cycles, -1))
+
+    # get drift-values for each point:
+    params = np.asarray([get_normalisation_params(info) for _, info in fitinfos[:-1]])
+    params = params.reshape((n_cycles, 4))
+    T, c, m, s = [np.repeat(params[:, j], lengths) for j in range(4)]
+
+    # scale time
+    tt = t - np.repeat(t[offsets[:-1]], lengths)
+    tt /= T
+
+    # compute nth-derivative of fitted polynom to normalise cycle
+    keys = [f'{quantity}[fit]'] + [f'd[{n},t]{quantity}[fit]' for n in range(1, n_der + 1)]
+    x = data.allocate(keys, dtype=float)
     for n in range(n_der + 1):
-        x = np.zeros((N,), dtype=float)
-        # loop over all time-subintervals:
-        for k, ((i1, i2), info) in enumerate(fitinfos[:-1]):
-            # get coefficients for (n-1)th derivative polynomial for cycle k:
-            coeff = coeffs[k]
-            # get drift-values:
-            T, c, m, s = get_normalisation_params(info)
-            # scale time
-            tt = (t[i1:i2] - t[i1]) / T
-            # compute nth-derivative of fitted polynom to normalise cycle
-            if n > 0:
-                coeff = get_derivative_coefficients(coeff)
-                coeffs[k] = coeff
-            xx = poly(tt, *coeff)
-            # undo effects of time-scaling and drift-removal
-            # NOTE: from 2nd derivative onwards, drift-removal has no effect)
-            match n:
-                case 0:
-                    x[i1:i2] = c + m * tt + s * xx
-                case 1:
-                    x[i1:i2] = (m + s * xx) / T
-                case _:
-                    x[i1:i2] = s * xx / T
-        # store fitted results
+        coeffs_n = get_derivative_coefficients_batch(coeffs, n=n)
+        poly_batch(tt, coeffs_n, offsets=offsets, out=x[n])
+        # undo effects of time-scaling and drift-removal
+        # NOTE: from 2nd derivative onwards, drift-removal has no effect)
+        x[n] *= s
         match n:
             case 0:
-                data[f'{quantity}[fit]'] = x
+                x[n] += c + m * tt
+            case 1:
+                x[n] += m
+                x[n] /= T
             case _:
-                data[f'd[{n},t]{quantity}[fit]'] = x
+                x[n] /= T
 
     return data
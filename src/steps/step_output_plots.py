@@ -39,7 +39,7 @@ __all__ = [
 
 def step_output_time_plot(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
     fitinfos: list[tuple[tuple[int, int], FittedInfo]],
     points: dict[str, SpecialPointsConfig],
     quantity: str,
@@ -210,10 +210,10 @@ def step_output_time_plot(
 
 def step_output_loop_plot(
     case: UserCase,
-    data_p: pd.DataFrame,
+    data_p: CycleSeries,
     fitinfos_p: list[tuple[tuple[int, int], FittedInfo]],
     points_p: dict[str, SpecialPointsConfig],
-    data_v: pd.DataFrame,
+    data_v: CycleSeries,
     fitinfos_v: list[tuple[tuple[int, int], FittedInfo]],
     points_v: dict[str, SpecialPointsConfig],
     N: int = 1000,
@@ -411,7 +411,7 @@ def step_output_loop_plot(
 
 
 def quick_plot(
-    data: pd.DataFrame,
+    data: CycleSeries,
     fitinfos: list[tuple[tuple[int, int], FittedInfo]],
     quantity: str,
     renormalised: bool = True,
@@ -425,6 +425,7 @@ def quick_plot(
     else:
         T = 1.0
         q = info.coefficients
+        data = data.to_frame()
 
     dq = get_derivative_coefficients(q)
     ddq = get_derivative_coefficients(dq)
@@ -14,6 +14,7 @@ from ..thirdparty.types import *
 from ..setup import config
 from ..setup.conversion import *
 from ..models.user import *
+from ..models.internal import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
@@ -31,7 +32,7 @@ __all__ = [
 
 def step_output_single_table(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
     quantity: str,
     original_time: bool = True,
 ):
@@ -43,6 +44,7 @@ def step_output_single_table(
         return
 
     cv = output_conversions(cfg.quantities)
+    data = data.to_frame()
 
     if original_time:
         data = data.sort_values(by=['time[orig]']).reset_index(drop=True)
@@ -84,7 +86,7 @@ def step_output_single_table(
 
 def step_output_combined_table(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
 ):
     cfg = case.output
 
@@ -94,6 +96,7 @@ def step_output_combined_table(
         return
 
     cv = output_conversions(cfg.quantities)
+    data = data.to_frame()
 
     table = pd.DataFrame(
         {col.key: cv[col.key] * data[col.key] for col in cfg.quantities}
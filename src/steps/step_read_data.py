@@ -6,14 +6,20 @@
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 from ..thirdparty.code import *
+from ..thirdparty.config import *
 from ..thirdparty.data import *
 from ..thirdparty.maths import *
 from ..thirdparty.physics import *
+from ..thirdparty.system import *
 from ..thirdparty.types import *
 
 from ..setup import config
+from ..core.artifacts import *
+from ..core.inputs import *
 from ..core.utils import *
+from ..algorithms.rows import *
 from ..models.app import *
+from ..models.enums import *
 from ..models.user import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -22,8 +28,17 @@ from ..models.user import *
 
 __all__ = [
     'step_read_data',
+    'step_read_data_chunks',
 ]
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+CHUNKSIZE = 2**20
+BLOCKSIZE = 2**22
+WHITESPACE = np.frombuffer(b' \t\r\n\x0b\x0c', dtype=np.uint8)
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -33,71 +48,428 @@ def step_read_data(
     cfg: DataTimeSeries,
     quantity: str,
 ) -> pd.DataFrame:
+    '''
+    Reads the time series of a quantity from a file in the format `cfg.format`.
+
+    NOTE: Only the configured columns are parsed.
+    For csv-files the multithreaded parser of `pyarrow` is used, if available
+    (and the options permit it).
+    Parsed csv-files are cached (in memory and optionally on disk).
+    The binary formats `npy`, `raw` and `arrow` are memory-mapped, so that the columns
+    are not copied (unless their units need to be converted or an arrow column is chunked),
+    whereas `parquet` files are decompressed into memory.
+    The data is only sorted, if the time values are not already monotone.
+    '''
+    match cfg.format:
+        case EnumInputFormat.CSV:
+            return read_data_csv(cfg, quantity)
+        case _:
+            columns = read_columns_binary(cfg)
+            return to_data_frame(cfg, quantity, *columns)
+
+
+def step_read_data_chunks(
+    cfg: DataTimeSeries,
+    quantity: str,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    '''
+    Reads the time series of a quantity from a file in chunks of `cfg.chunksize` rows.
+
+    @returns
+    an iterator over the chunks `(t, x)` of time and values (in the app units).
+
+    NOTE: In this mode the time values must be monotone.
+    '''
+    t_last = -np.inf
+    chunksize = cfg.chunksize or CHUNKSIZE
+    match cfg.format:
+        case EnumInputFormat.CSV:
+            chunks = read_columns_chunked(cfg, chunksize=chunksize)
+        case _:
+            T, X = read_columns_binary(cfg)
+            chunks = ((T[i : i + chunksize], X[i : i + chunksize]) for i in range(0, len(T), chunksize))  # fmt: skip
+    for columns in chunks:
+        t, x = convert_columns(cfg, quantity, *columns)
+        if len(t) == 0:
+            continue
+        if t[0] < t_last or not is_monotone(t):
+            raise ValueError(f'Time values in {cfg.path.__root__} must be ordered to be read in chunks!')  # fmt: skip
+        t_last = t[-1]
+        yield t, x
+    return
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def read_data_csv(
+    cfg: DataTimeSeries,
+    quantity: str,
+) -> pd.DataFrame:
+    '''
+    Parses a csv-file, unless the same file has already been parsed
+    with the same settings (cf. `get_input_cache`).
+    '''
+    cache = get_input_cache()
+    key = cache.key('read_data_csv', *get_input_identity(cfg, quantity))
+    return cache.get(key, lambda: to_data_frame(cfg, quantity, *read_columns(cfg)))
+
+
+def get_input_identity(cfg: DataTimeSeries, quantity: str) -> tuple:
+    '''
+    @returns
+    everything the parsed data depends upon,
+    viz. the identity of the file (path, size, modification time),
+    the settings of the columns and the units of the app.
+    '''
     cfg_units = config.UNITS
+    return (
+        fingerprint_file(cfg.path.__root__),
+        cfg.json(exclude={'path', 'chunksize'}),
+        quantity,
+        cfg_units.get('time', 's'),
+        cfg_units.get(quantity),
+    )
 
-    unit_time: str = cfg_units.get('time', 's')
-    unit_quantity: str = cfg_units.get(quantity)
 
+def to_data_frame(
+    cfg: DataTimeSeries,
+    quantity: str,
+    t: Iterable,
+    x: Iterable,
+) -> pd.DataFrame:
+    t, x = convert_columns(cfg, quantity, t, x)
+    data = pd.DataFrame({'time': t, quantity: x}, copy=False)
+    if not is_monotone(t):
+        data.sort_values(inplace=True, by=['time'])
+        data.reset_index(inplace=True, drop=True)
+    return data
+
+
+def read_columns(cfg: DataTimeSeries) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Parses only the columns for time and value.
+
+    NOTE: Rows before and immediately after the header are skipped by the parser,
+    any further rows to be skipped are removed after parsing via a vectorised mask.
+    Should these rows not be numeric, the columns are parsed as text and converted afterwards.
+    As the parsers drop blank lines, these are located in the file,
+    so that the mask is evaluated on the row indices in the file.
+    '''
+    rows = get_row_filter(cfg.skip)
+    header, after = rows.split()
+    check_columns(cfg, rows=rows, header=header)
+    start = header + 1 + after
+    trivial = rows.is_trivial(start)
+    try:
+        columns = parse_columns(cfg, header=header, after=after, text=rows.columns)
+    except ValueError:
+        if trivial:
+            raise
+        text = [cfg.time.name, cfg.value.name, *rows.columns]
+        columns = parse_columns(cfg, header=header, after=after, text=text)
+    blanks = None if trivial else get_blank_rows(cfg.path.__root__, start=start)
+    return apply_row_filter(cfg, rows, columns, start=start, blanks=blanks)
+
+
+def read_columns_chunked(
+    cfg: DataTimeSeries,
+    chunksize: int,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    '''
+    Parses only the columns for time and value in chunks.
+    '''
+    path = cfg.path.__root__
+    rows = get_row_filter(cfg.skip)
+    header, after = rows.split()
+    check_columns(cfg, rows=rows, header=header)
+    start = header + 1 + after
+    trivial = rows.is_trivial(start)
+    # NOTE: in this mode the columns cannot be re-parsed, so parse these as text if necessary.
+    text = rows.columns if trivial else [cfg.time.name, cfg.value.name, *rows.columns]
+    options = get_pandas_options(cfg, header=header, after=after, text=text)
+    blanks = None if trivial else get_blank_rows(path, start=start)
+
+    offset = 0
+    with pd.read_csv(path, chunksize=chunksize, **options) as reader:
+        for data in reader:
+            columns = {key: col.to_numpy() for key, col in data.items()}
+            yield apply_row_filter(
+                cfg, rows, columns, start=start, offset=offset, blanks=blanks
+            )
+            offset += len(data)
+    return
+
+
+def parse_columns(
+    cfg: DataTimeSeries,
+    header: int,
+    after: int,
+    text: list[str],
+) -> dict[str, np.ndarray]:
+    '''
+    Parses the columns for time and value (and those needed to skip rows).
+    The columns in `text` are parsed as strings.
+
+    NOTE: Files, which pyarrow cannot parse (e.g. due to lines consisting of whitespace),
+    are parsed by pandas.
+    '''
     path = cfg.path.__root__
-    data = pd.read_csv(
-        path,
+    if pa_csv is not None and len(cfg.sep) == 1:
+        try:
+            return parse_columns_pyarrow(cfg, header=header, after=after, text=text)
+        except pa.ArrowInvalid:
+            pass
+
+    data = pd.read_csv(path, **get_pandas_options(cfg, header=header, after=after, text=text))
+    return {key: col.to_numpy() for key, col in data.items()}
+
+
+def parse_columns_pyarrow(
+    cfg: DataTimeSeries,
+    header: int,
+    after: int,
+    text: list[str],
+) -> dict[str, np.ndarray]:
+    '''
+    Parses the columns as `parse_columns` via the multithreaded csv-parser of pyarrow.
+    '''
+    keys = unique([str(key) for key in [cfg.time.name, cfg.value.name, *text]])
+    types = {str(cfg.time.name): cfg.time, str(cfg.value.name): cfg.value}
+    table = pa_csv.read_csv(
+        cfg.path.__root__,
+        read_options=pa_csv.ReadOptions(
+            use_threads=True,
+            skip_rows=header,
+            skip_rows_after_names=after,
+        ),
+        parse_options=pa_csv.ParseOptions(delimiter=cfg.sep),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=keys,
+            column_types={
+                key: pa.string() if key in text else get_pyarrow_type(types[key])
+                for key in keys
+            },
+            decimal_point=cfg.decimal,
+        ),
+    )
+    return {key: table.column(key).to_numpy() for key in keys}
+
+
+def apply_row_filter(
+    cfg: DataTimeSeries,
+    rows: RowFilter,
+    columns: dict[str, np.ndarray],
+    start: int,
+    offset: int = 0,
+    blanks: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Removes the rows to be skipped from the parsed columns,
+    where `start` is the row index (in the file) of the first parsed row,
+    `offset` the number of rows parsed before these columns
+    and `blanks` the indices of the blank rows in the file dropped by the parser
+    (`None` if no rows are to be removed).
+    Columns parsed as text are prepared for the conversion to numbers.
+    '''
+    t = columns[cfg.time.name]
+    x = columns[cfg.value.name]
+    if blanks is not None:
+        index = get_file_rows(offset + np.arange(len(t)), start=start, blanks=blanks)
+        mask = ~rows.mask(index, columns=columns)
+        t = t[mask]
+        x = x[mask]
+    return get_numeric_text(t, cfg.decimal), get_numeric_text(x, cfg.decimal)
+
+
+def read_columns_binary(cfg: DataTimeSeries) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Reads the columns for time and value from a binary file (memory-mapped where possible).
+
+    NOTE: For `parquet` the schema is read first, so that only existing columns are read.
+    '''
+    path = cfg.path.__root__
+    keys = [cfg.time.name, cfg.value.name]
+
+    match cfg.format:
+        case EnumInputFormat.NPY:
+            arr = np.load(path, mmap_mode='r')
+            if arr.dtype.names is not None:
+                columns = list(arr.dtype.names)
+                get = lambda key: arr[key]
+            else:
+                # NOTE: columns of a 2d-array are referred to by their index (as a string)
+                columns = [str(i) for i in range(arr.shape[1] if arr.ndim == 2 else 0)]
+                get = lambda key: arr[:, int(key)]
+        case EnumInputFormat.RAW:
+            header = read_raw_header(path)
+            dtype = np.dtype(header.dtype.value).newbyteorder('<')
+            columns = header.columns
+            n = len(columns)
+            N = (os.path.getsize(path) - header.offset) // (n * dtype.itemsize)
+            arr = np.memmap(path, dtype=dtype, mode='r', offset=header.offset, shape=(N, n))
+            get = lambda key: arr[:, columns.index(key)]
+        case EnumInputFormat.PARQUET | EnumInputFormat.ARROW:
+            if pa is None:
+                raise ImportError(
+                    f'The format {cfg.format.value} requires the package pyarrow!'
+                )
+            if cfg.format == EnumInputFormat.PARQUET:
+                columns = pa_parquet.read_schema(path).names
+                keys_ = [key for key in keys if key in columns]
+                table = pa_parquet.read_table(path, columns=keys_, memory_map=True)
+            else:
+                table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+                columns = table.column_names
+            get = lambda key: table.column(key).to_numpy()
+        case _:
+            raise ValueError(f'No method developed for the format {cfg.format}!')
+
+    for key in keys:
+        if key not in columns:
+            raise KeyError(f'{key} not found in data set with columns {", ".join(map(str, columns))}')  # fmt: skip
+    return get(cfg.time.name), get(cfg.value.name)
+
+
+def read_raw_header(path: str) -> DataRawHeader:
+    '''
+    Reads the header `<path>.yaml` of a raw binary file.
+    '''
+    with open(f'{path}.yaml', 'r') as fp:
+        assets = yaml.load(fp, Loader=yaml.FullLoader)
+    return DataRawHeader.parse_obj(assets)
+
+
+def check_columns(cfg: DataTimeSeries, rows: RowFilter, header: int):
+    '''
+    Ensures that the configured columns exist (only parses the header).
+    '''
+    columns = list(
+        pd.read_csv(cfg.path.__root__, nrows=0, sep=cfg.sep, skiprows=header).columns
+    )
+    for key in [cfg.time.name, cfg.value.name, *rows.columns]:
+        if key not in columns:
+            raise KeyError(f'{key} not found in data set with columns {", ".join(columns)}')
+    return
+
+
+def get_pandas_options(
+    cfg: DataTimeSeries,
+    header: int = 0,
+    after: int = 0,
+    text: list[str] = [],
+) -> dict[str, Any]:
+    keys = [cfg.time.name, cfg.value.name]
+    return dict(
         sep=cfg.sep,
         decimal=cfg.decimal,
-        skiprows=get_bool_function(cfg.skip) if isinstance(cfg.skip, str) else cfg.skip,
-    )
-    t = get_column(data, unit=unit_time, cfg=cfg.time)
-    x = get_column(data, unit=unit_quantity, cfg=cfg.value)
-
-    data = pd.DataFrame(
-        {
-            'time': t,
-            quantity: x,
-        }
-    ).astype(
-        {
-            'time': float,
-            quantity: float,
-        }
+        skiprows=[*range(header), *range(header + 1, header + 1 + after)],
+        usecols=unique([*keys, *text]),
+        dtype={key: str for key in text}
+        | {
+            cfg_.name: float
+            for cfg_ in [cfg.time, cfg.value]
+            if cfg_.type == EnumType.DOUBLE and cfg_.name not in text
+        },
     )
-    data.sort_values(inplace=True, by=['time'])
-    data.reset_index(inplace=True, drop=True)
 
-    return data
 
+def get_pyarrow_type(cfg: DataTypeQuantity) -> Any:
+    match cfg.type:
+        case EnumType.DOUBLE:
+            return pa.float64()
+        case EnumType.INTEGER:
+            return pa.int64()
+        case EnumType.BOOLEAN:
+            return pa.bool_()
+        case _:
+            return pa.string()
 
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-# AUXILIARY METHODS
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def convert_columns(
+    cfg: DataTimeSeries,
+    quantity: str,
+    t: Iterable,
+    x: Iterable,
+) -> tuple[np.ndarray, np.ndarray]:
+    cfg_units = config.UNITS
+    unit_time: str = cfg_units.get('time', 's')
+    unit_quantity: str = cfg_units.get(quantity)
+    t = get_column(t, unit=unit_time, cfg=cfg.time)
+    x = get_column(x, unit=unit_quantity, cfg=cfg.value)
+    return t, x
 
 
 def get_column(
-    data: pd.DataFrame,
+    col: Iterable,
     cfg: DataTypeQuantity,
     unit: Optional[str] = None,
-) -> np.asarray:
-    key = cfg.name
-    try:
-        col = data[key][:]
-    except KeyError as e:
-        columns = list(data.columns)
-        raise KeyError(f'{key} not found in data set with columns {", ".join(columns)}')
-
+) -> np.ndarray:
+    '''
+    Casts a column to a float array and converts units (in place).
+    '''
     X = np.asarray(col, dtype=cfg.type.value)
+    if X.dtype != float:
+        X = X.astype(float)
     if cfg.unit is not None and unit is not None:
         cv = convert_units(unitFrom=cfg.unit, unitTo=unit)
-        X = cv * X
+        if cv != 1:
+            # NOTE: only copy if necessary (e.g. memory-mapped or parsed data)
+            if not X.flags.writeable:
+                X = X.copy()
+            X *= cv
     return X
 
 
-def get_bool_function(text: str) -> Callable[[int], bool]:
-    try:
-        fct_ = eval(text)
+def get_blank_rows(path: str, start: int = 0) -> np.ndarray:
+    '''
+    Determines the indices of the rows from `start` on, which are empty or consist of whitespace,
+    and which are thus dropped by the csv parsers.
+
+    NOTE: The file is scanned in blocks of bytes, so that only the line breaks are located in Python.
+    '''
+    blanks = []
+    line = 0
+    filled = False
+    with open(path, 'rb') as fp:
+        while block := fp.read(BLOCKSIZE):
+            values = np.frombuffer(block, dtype=np.uint8)
+            (ends,) = np.nonzero(values == ord('\n'))
+            counts = np.cumsum(~np.isin(values, WHITESPACE))
+            if len(ends) == 0:
+                filled = filled or bool(counts[-1] > 0)
+                continue
+            # number of non-whitespace characters per line ending in this block
+            lengths = np.diff(counts[ends], prepend=0)
+            lengths[0] += filled
+            (indices,) = np.nonzero(lengths == 0)
+            blanks.append(line + indices[line + indices >= start])
+            line += len(ends)
+            filled = bool(counts[-1] > counts[ends[-1]])
+    return np.concatenate([np.zeros(0, dtype=int), *blanks])
+
+
+def get_file_rows(positions: np.ndarray, start: int, blanks: np.ndarray) -> np.ndarray:
+    '''
+    Maps the positions of parsed rows to their row indices in the file,
+    where `start` is the row index of the first parsed row
+    and `blanks` the (sorted) row indices `>= start` of blank rows dropped by the parser.
+    '''
+    # number of parsed rows before each blank row
+    before = blanks - start - np.arange(len(blanks))
+    return start + positions + np.searchsorted(before, positions, side='right')
+
+
+def is_monotone(t: np.ndarray) -> bool:
+    return bool(np.all(t[1:] >= t[:-1]))
 
-        def fct(i: int) -> bool:
-            try:
-                return fct_(i)
-            except:
-                return False
 
-    except:
-        return lambda i: False
+def get_numeric_text(values: np.ndarray, decimal: str) -> np.ndarray:
+    '''
+    Replaces the decimal symbol in columns parsed as text.
+    '''
+    if values.dtype.kind not in 'OUST' or decimal == '.':
+        return values
+    return pd.Series(values, dtype=str).str.replace(decimal, '.', regex=False).to_numpy()
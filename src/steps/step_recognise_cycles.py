@@ -11,7 +11,9 @@ from ..thirdparty.maths import *
 from ..setup import config
 from ..core.utils import *
 from ..models.user import *
+from ..models.internal import *
 from ..algorithms.peaks import *
+from ..algorithms.bad_points import *
 from ..algorithms.cycles import *
 from .methods import *
 
@@ -29,46 +31,51 @@ __all__ = [
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
+@cached_step
 def step_recognise_cycles(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
     quantity: str,
     shift: str,
     remove_gaps: bool = True,
-) -> pd.DataFrame:
+) -> CycleSeries:
     N = len(data)
 
     # get cycles based on peaks (or troughs)
     ext = characteristic_to_where(data[f'{quantity}[{shift}]'])
     cycles = get_cycles(ext=ext, N=N, remove_gaps=remove_gaps)
-    data['cycle'] = cycles
-    data = data[data['cycle'] >= 0]
-    data.reset_index(inplace=True, drop=True)
+    keep = cycles >= 0
+    data = data.select(keep)
+    data.cycles = CycleIndex.from_labels(cycles[keep])
 
     # detect 'bad' parts of cycles
+    # NOTE: the cycles are considered as curves in phase space (value + rate of change).
     N = len(data)
-    # x = data[['pressure', 'volume']].to_numpy(copy=True)
-    # marked = mark_pinched_points_on_cycles(x=x, cycles=cycles, sig_t=0.1)
-    # data['marked'] = marked
-    data['marked'] = [False] * N
+    if case.process.cycles.remove_bad:
+        values = data[quantity]
+        x = np.column_stack([values, np.gradient(values)]) if N > 1 else values[:, np.newaxis]
+        workers = case.process.cycles.workers
+        data['marked'] = mark_pinched_points_on_cycles(
+            x=x, cycles=data.cycles, sig_t=0.1, workers=workers
+        )
+    else:
+        data['marked'] = np.zeros((N,), dtype=bool)
     return data
 
 
+@cached_step
 def step_removed_marked_sections(
     case: UserCase,
-    data: pd.DataFrame,
-):
+    data: CycleSeries,
+) -> CycleSeries:
     # compute time increment for later
-    N = len(data)
-    time = data['time'].to_numpy(copy=True)
-    _, dt, _ = get_time_aspects(time)
+    dt = get_time_increment(data)
 
     # remove marked points
-    data = data[data['marked'] == False]
+    data = data.select(~data['marked'])
 
     # recompute time axis
     N = len(data)
-    T = N * dt
     data = recocompute_time_axis(data, N=N, dt=dt)
 
     return data
@@ -10,7 +10,9 @@ from ..thirdparty.data import *
 from ..setup import config
 from ..core.utils import *
 from ..models.user import *
+from ..models.internal import *
 from ..algorithms.peaks import *
+from .methods import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
@@ -25,14 +27,23 @@ __all__ = [
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
+@cached_step
 def step_recognise_peaks(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
     quantity: str,
-) -> pd.DataFrame:
-    N = len(data)
+) -> CycleSeries:
     values = data[quantity]
-    peaks, troughs = get_extremes(values)
-    data[f'{quantity}[peak]'] = where_to_characteristic(peaks, N)
-    data[f'{quantity}[trough]'] = where_to_characteristic(troughs, N)
+    options = case.process.peaks
+    if options is None:
+        peaks, troughs = get_extremes(values)
+    else:
+        peaks, troughs = get_extremes(
+            values, workers=options.workers, block_size=options.block_size
+        )
+    ext = data.allocate(
+        [f'{quantity}[peak]', f'{quantity}[trough]'], dtype=bool, fill_value=False
+    )
+    ext[0, peaks] = True
+    ext[1, troughs] = True
     return data
@@ -9,10 +9,12 @@ from ..thirdparty.data import *
 
 from ..setup import config
 from ..setup.series import *
+from ..core.log import *
 from ..core.epsilon import *
 from ..algorithms.points import *
 from ..models.user import *
 from ..models.internal import *
+from .methods import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
@@ -27,9 +29,10 @@ __all__ = [
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
+@cached_step
 def step_recognise_points(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
     fitinfos: list[tuple[tuple[int, int], FittedInfo]],
     quantity: str,
 ) -> tuple[list[tuple[tuple[int, int], dict[str, int]]], dict[str, SpecialPointsConfig]]:
@@ -40,15 +43,15 @@ def step_recognise_points(
     points_sorted = sort_special_points_specs(points_unsorted)
 
     match quantity:
-        case 'pressure':
+        case 'pressure' | 'volume':
+            infos = [info for _, info in fitinfos]
+            try:
+                points_cycles = recognise_special_points_for_cycles(infos, points=points_sorted)
+            except SpecialPointsNotFound as err:
+                log_fatal(err)
             window_info_points = [
-                ((i1, i2), info, recognise_special_points(info, points=points_sorted))
-                for (i1, i2), info in fitinfos
-            ]
-        case 'volume':
-            window_info_points = [
-                ((i1, i2), info, recognise_special_points(info, points=points_sorted))
-                for (i1, i2), info in fitinfos
+                ((i1, i2), info, points)
+                for ((i1, i2), info), points in zip(fitinfos, points_cycles)
             ]
         case _:
             raise ValueError(f'No methods developed for quantity {quantity}!')
@@ -57,7 +60,7 @@ def step_recognise_points(
     _, _, points_fit = window_info_points[-1]
 
     # adjust classified points in each cycle:
-    t = data['time'].to_numpy(copy=True)
+    t = data.time()
     points_data = [
         (
             (i1, i2),
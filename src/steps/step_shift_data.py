@@ -12,6 +12,8 @@ from ..setup import config
 from ..setup.series import *
 from ..core.utils import *
 from ..models.user import *
+from ..models.internal import *
+from ..algorithms.cycles import *
 from .methods import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -28,26 +30,21 @@ __all__ = [
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
+@cached_step
 def step_shift_data_extremes(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
     quantity: str,
     shift: str = 'peak',
-) -> pd.DataFrame:
+) -> CycleSeries:
     # compute time increment for later
-    N = len(data)
-    time = data['time'].to_numpy(copy=True)
-    _, dt, _ = get_time_aspects(time)
+    dt = get_time_increment(data)
 
     # shift data
     ext = characteristic_to_where(data[f'{quantity}[{shift}]'])
     if len(ext) > 0:
         index_max = max(ext)
-        indices = list(range(N))
-        indices = indices[index_max:] + indices[:index_max]
-        data = data.iloc[indices, :]
-        data.reset_index(inplace=True, drop=True)
-        ext = characteristic_to_where(data[f'{quantity}[{shift}]'])
+        data = data.rotate(index_max)
 
     # recompute time axis.
     # NOTE: We assume that time has already been homogenised.
@@ -56,25 +53,21 @@ def step_shift_data_extremes(
     return data
 
 
+@cached_step
 def step_shift_data_custom(
     case: UserCase,
-    data: pd.DataFrame,
+    data: CycleSeries,
     points: list[tuple[tuple[int, int], dict[str, int]]],
     quantity: str,
-) -> pd.DataFrame:
+) -> CycleSeries:
     align = get_alignment_point(quantity)
 
-    t = data['time'].to_numpy(copy=True)
-
     # shift times in each cycle
-    for k, ((i1, i2), pts) in enumerate(points):
-        i0 = pts.get(align, -1)
-        if i0 == -1:
-            continue
-        indices = list(range(i1, i2))
-        indices = indices[i0:] + indices[:i0]
-        data[i1:i2] = data.iloc[indices, :].reset_index(drop=True)
-
-    data['time'] = t
+    # NOTE: the rotations of all cycles are combined into one gather index,
+    # applied once to every column (incl. the original times) but not the time axis.
+    windows = [window for window, _ in points]
+    shifts = [max(pts.get(align, -1), 0) for _, pts in points]
+    indices = get_rotation_indices(len(data), windows=windows, shifts=shifts)
+    data = data.take(indices, fixed=['time'])
 
     return data
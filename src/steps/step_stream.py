@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from ..thirdparty.types import *
+
+from ..setup.series import *
+from ..algorithms.points import *
+from ..algorithms.stream import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'step_stream_engine',
+]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def step_stream_engine(quantity: str, **kwargs: Any) -> StreamEngine:
+    '''
+    Creates an online engine for a quantity, using the polynomial conditions
+    and the special points of the app config.
+    Samples are ingested via `engine.push(t, x)`, which returns the completed beats.
+
+    NOTE: Keyword arguments are passed on to `StreamEngine` (e.g. `warmup`).
+    '''
+    conds = get_polynomial_condition(quantity)
+    points = sort_special_points_specs(get_point_settings(quantity))
+    return StreamEngine(conds=conds, points=points, **kwargs)
@@ -6,18 +6,26 @@
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 from pydantic import BaseModel
+from collections import OrderedDict
+from collections import deque
 from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import fields as dataclass_fields
 from dataclasses import Field
+from dataclasses import is_dataclass
 from dataclasses import MISSING
+from dataclasses import replace as dataclass_replace
+import hashlib
 from functools import partial
 from functools import reduce
 from functools import wraps
+from inspect import signature
 from itertools import chain as itertools_chain
 from itertools import product as itertools_product
 from lazy_load import lazy
 from operator import itemgetter
+import pickle
 
 # cf. https://github.com/mplanchard/safetywrap
 from typing import Callable
@@ -76,19 +84,28 @@ def value_of_model(m: MODEL):
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'BaseModel',
     'Field',
     'MISSING',
+    'OrderedDict',
     'asdict',
     'dataclass',
+    'dataclass_fields',
+    'dataclass_replace',
+    'deque',
     'echo_function',
     'field',
+    'hashlib',
+    'is_dataclass',
     'itemgetter',
     'itertools_chain',
     'itertools_product',
     'lazy',
     'make_lazy',
     'partial',
+    'pickle',
     'reduce',
+    'signature',
     'value_of_model',
     'wraps',
 ]
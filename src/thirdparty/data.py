@@ -8,11 +8,24 @@
 import csv
 import pandas as pd
 
+# NOTE: optional dependency (multithreaded csv-parser)
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pa_parquet
+except ImportError:  # pragma: no cover
+    pa = None
+    pa_csv = None
+    pa_parquet = None
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
     'csv',
+    'pa',
+    'pa_csv',
+    'pa_parquet',
     'pd',
 ]
@@ -13,6 +13,7 @@ import scipy as sp
 from scipy import linalg as spla
 from scipy import optimize as spo
 from scipy import signal as sps
+from scipy.signal._peak_finding_utils import _select_by_peak_distance
 from findpeaks import findpeaks
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -102,6 +103,23 @@ def remove_outliers(X: np.ndarray, sig: float = 2.0) -> np.ndarray:
     return X
 
 
+def select_by_peak_distance(
+    peaks: np.ndarray, priority: np.ndarray, distance: float
+) -> np.ndarray:
+    '''
+    Selects peaks by their minimal distance as `sps.find_peaks`,
+    where peaks of higher `priority` take precedence.
+
+    @returns
+    a boolean mask of the peaks to be kept.
+
+    NOTE: Wraps the (private) routine used by `sps.find_peaks`.
+    '''
+    peaks = np.asarray(peaks, dtype=np.intp)
+    priority = np.asarray(priority, dtype=float)
+    return _select_by_peak_distance(peaks, priority, float(distance)).astype(bool)
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -117,6 +135,7 @@ __all__ = [
     'random',
     'indices_non_outliers',
     'remove_outliers',
+    'select_by_peak_distance',
     'sp',
     'spla',
     'spo',
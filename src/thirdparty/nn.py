@@ -27,10 +27,24 @@ def nearest_neighbours(
     return indices
 
 
+def radius_neighbours(
+    X: np.ndarray,
+    r: float,
+) -> list[np.ndarray]:
+    '''
+    @returns
+    for each point in `X` the indices of the points within distance `r` (incl. itself).
+    '''
+    kdt = KDTree(X, leaf_size=30, metric='euclidean')
+    indices = kdt.query_radius(X, r=r, return_distance=False)
+    return list(indices)
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
     'nearest_neighbours',
+    'radius_neighbours',
 ]
@@ -7,6 +7,12 @@
 
 import anyio
 import asyncio
+from concurrent.futures import as_completed
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from threading import get_ident
+from threading import Lock
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -15,5 +21,11 @@ import asyncio
 
 __all__ = [
     'anyio',
+    'as_completed',
     'asyncio',
+    'get_ident',
+    'Lock',
+    'ProcessPoolExecutor',
+    'SharedMemory',
+    'ThreadPoolExecutor',
 ]
@@ -5,7 +5,9 @@
 # IMPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+from argparse import ArgumentParser
 import os
+import shutil
 import sys
 import traceback
 import warnings
@@ -17,8 +19,10 @@ import pathspec
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'ArgumentParser',
     'Path',
     'pathspec',
+    'shutil',
     'os',
     'sys',
     'traceback',
@@ -7,12 +7,14 @@
 
 from enum import Enum
 from collections.abc import Iterable
+from collections.abc import Iterator
 from typing import Any
 from typing import Callable
 from typing import ClassVar
 from typing import Concatenate
 from typing import Generator
 from typing import Generic
+from typing import IO
 from typing import Literal
 from typing import Optional
 from typing import ParamSpec
@@ -35,7 +37,9 @@ __all__ = [
     'Enum',
     'Generator',
     'Generic',
+    'IO',
     'Iterable',
+    'Iterator',
     'Literal',
     'Optional',
     'ParamSpec',
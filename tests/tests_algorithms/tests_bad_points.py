@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.maths import *
+from src.thirdparty.types import *
+from tests.thirdparty.unit import *
+
+from src.algorithms.bad_points import *
+from src.models.internal import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# FIXTURES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def loop(N: int, revolutions: float) -> np.ndarray:
+    '''
+    A (slightly drifting) circle traversed the given number of times,
+    i.e. for `revolutions > 1` the start and end of the curve overlap (a 'pinch').
+    '''
+    t = np.arange(N) / N
+    theta = 2 * np.pi * revolutions * t
+    return np.column_stack([(1 + 0.02 * t) * np.cos(theta), np.sin(theta)])
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@mark.parametrize('N', [200, 2000])
+def test_mark_pinched_points_on_cycle(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    N: int,
+):
+    marked = np.asarray(mark_pinched_points_on_cycle(loop(N, 1.0), sig_t=0.1))
+    test.assertFalse(np.any(marked), 'A simple loop contains no pinch.')
+
+    # the overlap of 1/5 revolution covers the first + last 1/6 of the curve
+    x = loop(N, 1.2)
+    marked = np.asarray(mark_pinched_points_on_cycle(x.copy(), sig_t=0.1))
+    (indices,) = np.where(~marked)
+    n1, n2 = indices[0], N - 1 - indices[-1]
+    test.assertAlmostEqual(n1 / N, 1 / 6, delta=0.03)
+    test.assertAlmostEqual(n2 / N, 1 / 6, delta=0.03)
+    test.assertTrue(np.all(marked[:n1]) and np.all(marked[N - n2 :]))
+    assert_arrays_equal(x, loop(N, 1.2), 'Inputs are not modified.')
+    return
+
+
+def test_mark_pinched_points_on_cycles(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    x = np.concatenate([loop(300, 1.0), loop(200, 1.2), loop(400, 1.0)])
+    cycles = CycleIndex(offsets=np.asarray([0, 300, 500, 900]), ids=np.arange(3))
+    marked = np.asarray(mark_pinched_points_on_cycles(x, cycles=cycles, sig_t=0.1))
+    test.assertEqual(len(marked), 900)
+    test.assertFalse(np.any(marked[:300]) or np.any(marked[500:]))
+    assert_arrays_equal(
+        marked[300:500], mark_pinched_points_on_cycle(loop(200, 1.2), sig_t=0.1)
+    )
+    test.assertEqual(len(mark_pinched_points_on_cycles(np.zeros((0, 2)), cycles=[])), 0)
+
+    # parallel mode (shared memory) agrees with serial mode
+    marked_parallel = mark_pinched_points_on_cycles(x, cycles=cycles, sig_t=0.1, workers=2)
+    test.assertEqual(marked_parallel.dtype, bool)
+    assert_arrays_equal(marked_parallel, marked)
+    return
@@ -6,22 +6,33 @@
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 from src.thirdparty.log import *
+from src.thirdparty.maths import *
 from src.thirdparty.types import *
 from tests.thirdparty.unit import *
 
 from src.algorithms.peaks import *
+from src.algorithms.peaks import find_peaks_stable
+from src.algorithms.peaks import get_peaks_in_block
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # LOCAL VARIABLES / CONSTANTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-#
+PERIOD = 800
+N = 40 * PERIOD
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # FIXTURES
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-#
+
+@fixture(scope='module')
+def signal() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    theta = 2 * np.pi * np.arange(N) / PERIOD
+    x = np.sin(theta) + 0.3 * np.sin(2 * theta + 1) + 0.05 * rng.standard_normal(N)
+    return 80 + 40 * x
+
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # TESTS
@@ -33,3 +44,179 @@ def test_hello(
 ):
     test.assertEqual(1 + 1, 2)
     return
+
+
+@mark.parametrize('chunk', [1, 333, N])
+def test_extrema_detector(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    signal: np.ndarray,
+    chunk: int,
+):
+    peaks, troughs = get_extremes(signal)
+    test.assertEqual(len(peaks), N // PERIOD)
+
+    detector = ExtremaDetector(warmup=4 * PERIOD)
+    peaks_online, troughs_online = [], []
+    for i in range(0, N, chunk):
+        peaks_, troughs_ = detector.push(signal[i : i + chunk])
+        peaks_online.extend(peaks_)
+        troughs_online.extend(troughs_)
+    # NOTE: extrema are emitted as samples arrive, only the last ones are pending
+    test.assertGreaterEqual(len(peaks_online), len(peaks) - 1)
+    peaks_, troughs_ = detector.flush()
+    peaks_online.extend(peaks_)
+    troughs_online.extend(troughs_)
+
+    test.assertEqual(peaks_online, peaks)
+    test.assertEqual(troughs_online, troughs)
+    return
+
+
+@mark.parametrize('shape', ['harmonic', 'pulse'])
+def test_extrema_detector_noise(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    shape: str,
+):
+    theta = 2 * np.pi * np.arange(N) / PERIOD
+    match shape:
+        case 'harmonic':
+            x = np.sin(theta) + 0.3 * np.sin(2 * theta + 1)
+        case _:
+            x = np.maximum(np.sin(theta), 0) ** 1.5 + 0.13 * np.sin(2 * theta + 0.3)
+    scale = np.median(np.abs(x - np.median(x)))
+
+    # documented bound: noise of 5% of the scale
+    for seed in range(3):
+        signal = x + 0.05 * scale * np.random.default_rng(seed).standard_normal(N)
+        detector = ExtremaDetector(warmup=4 * PERIOD)
+        peaks_online, troughs_online = detector.push(signal)
+        peaks_, troughs_ = detector.flush()
+        peaks, troughs = get_extremes(signal)
+        end = N - detector.width
+        test.assertEqual(
+            [i for i in peaks_online + peaks_ if i < end], [i for i in peaks if i < end]
+        )
+        test.assertEqual(
+            [i for i in troughs_online + troughs_ if i < end], [i for i in troughs if i < end]
+        )
+    return
+
+
+def test_extrema_detector_short(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    signal: np.ndarray,
+):
+    # signals shorter than the warmup are processed on flush
+    detector = ExtremaDetector()
+    test.assertEqual(detector.push(signal[: 3 * PERIOD]), ([], []))
+    test.assertEqual(detector.flush(), get_extremes(signal[: 3 * PERIOD]))
+    test.assertEqual(ExtremaDetector().flush(), ([], []))
+    return
+
+
+def test_estimate_cycle_duration_acf(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    signal: np.ndarray,
+):
+    test.assertAlmostEqual(estimate_cycle_duration_acf(signal), PERIOD, delta=2)
+    # decimated signal
+    test.assertAlmostEqual(
+        estimate_cycle_duration_acf(signal, max_samples=4096), PERIOD, delta=8
+    )
+    # period too short to be resolved after decimation
+    x = np.sin(2 * np.pi * np.arange(N) / 25.5)
+    test.assertAlmostEqual(estimate_cycle_duration_acf(x, max_samples=1024), 25.5, delta=1)
+    # no periodicity
+    test.assertEqual(estimate_cycle_duration_acf(np.ones((N,))), 0)
+    test.assertEqual(estimate_cycle_duration_acf(np.arange(N, dtype=float)), 0)
+    return
+
+
+def test_estimate_cycle_durations_acf(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    # heart rate increasing over time
+    t = np.arange(N)
+    duration = PERIOD * (1 - 0.4 * t / N)
+    x = np.sin(np.cumsum(2 * np.pi / duration))
+    centres, durations = estimate_cycle_durations_acf(x, window=10 * PERIOD)
+    test.assertEqual(len(centres), len(durations))
+    assert_arrays_close(durations, duration[centres], eps=0.02 * PERIOD)
+    return
+
+
+@mark.parametrize('block_size', [3 * PERIOD, 5000])
+def test_get_extremes_in_blocks(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    signal: np.ndarray,
+    block_size: int,
+):
+    values = normalised_order_statistics(signal)
+    width = estimate_peak_width(values)
+    peaks, troughs = get_extremes_in_blocks(values, width, workers=2, block_size=block_size)
+    test.assertEqual((peaks, troughs), get_extremes(signal))
+    test.assertEqual(get_extremes(signal, workers=2, block_size=block_size), (peaks, troughs))
+
+    # no barriers within the overlap: blocks are widened
+    test.assertEqual(get_extremes_in_blocks(values, width, workers=2, block_size=block_size, overlap=1), (peaks, troughs))  # fmt: skip
+    return
+
+
+@mark.parametrize('resolution', [1, 8])
+def test_get_extremes_in_blocks_ties(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    signal: np.ndarray,
+    resolution: int,
+):
+    # quantised recordings contain peaks of equal height close together
+    signal = np.round(signal / resolution) * resolution
+    values = normalised_order_statistics(signal)
+    width = estimate_peak_width(values)
+    block_size = 5000
+    overlap = 2 * estimate_cycle_duration_acf(values)
+
+    # every block is exact without being widened
+    for i1 in range(0, N, block_size):
+        core = (i1, min(i1 + block_size, N))
+        block = (max(i1 - overlap, 0), min(i1 + block_size + overlap, N))
+        for sign in [1, -1]:
+            peaks = get_peaks_in_block(values, sign=sign, width=width, block=block, core=core)
+            test.assertIsNotNone(peaks)
+    result = get_extremes_in_blocks(values, width, workers=2, block_size=block_size)
+    test.assertEqual(result, get_extremes(signal))
+    test.assertEqual(get_extremes(signal, workers=2, block_size=block_size), result)
+    return
+
+
+def test_find_peaks_stable(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    signal: np.ndarray,
+):
+    values = normalised_order_statistics(signal)
+    width = estimate_peak_width(values)
+    peaks, _ = sps.find_peaks(values, distance=width, prominence=1)
+    assert_arrays_equal(find_peaks_stable(values, distance=width, prominence=1), peaks)
+
+    # of peaks of equal height the leftmost is selected
+    x = np.asarray([0, 2, 1, 2, 1, 2, 0, 0, 3, 0, 2, 1, 2, 0], dtype=float)
+    assert_arrays_equal(find_peaks_stable(x, distance=4), [1, 8, 12])
+    assert_arrays_equal(find_peaks_stable(x[:7], distance=3), [1, 5])
+    assert_arrays_equal(find_peaks_stable(x, distance=4, prominence=2.5), [8])
+    assert_arrays_equal(find_peaks_stable(np.zeros((0,)), distance=4), [])
+    return
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.maths import *
+from src.thirdparty.types import *
+from tests.thirdparty.unit import *
+
+from src.models.enums import *
+from src.algorithms.resample import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# sampling at 1kHz for 4s, resampled at 100Hz
+DT_SAMPLES = 0.001
+DT = 0.01
+N = 400
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# FIXTURES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@fixture(scope='module')
+def time() -> np.ndarray:
+    return DT_SAMPLES * np.arange(round(N * DT / DT_SAMPLES))
+
+
+def tone(t: np.ndarray, freq: float) -> np.ndarray:
+    return np.sin(2 * np.pi * freq * t)
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_get_decimation_factor(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    time: np.ndarray,
+):
+    test.assertEqual(get_decimation_factor(time, DT), 10)
+    test.assertEqual(get_decimation_factor(time, DT_SAMPLES), 1)
+    test.assertIsNone(get_decimation_factor(time, 2.5 * DT_SAMPLES), 'Not an integer multiple.')
+    test.assertIsNone(get_decimation_factor(time + DT_SAMPLES, DT), 'Does not start at 0.')
+    t = time.copy()
+    t[7] += 0.3 * DT_SAMPLES
+    test.assertIsNone(get_decimation_factor(t, DT), 'Not uniform.')
+    return
+
+
+@mark.parametrize('n', [N, N + 7])
+def test_resample_linear_exact(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    time: np.ndarray,
+    n: int,
+):
+    x = tone(time, 3.0) + time
+    expected = np.interp(DT * np.arange(n), time, x, period=n * DT)
+    result = resample_uniform(time, x, dt=DT, N=n, method=EnumResampleMethod.LINEAR)
+    assert_arrays_close(result, expected, eps=1e-12)
+    return
+
+
+@mark.parametrize('jitter', [False, True])
+@mark.parametrize(
+    ('method', 'max_alias'),
+    [
+        (EnumResampleMethod.LINEAR, 1.0),
+        (EnumResampleMethod.POLYPHASE, 0.01),
+        (EnumResampleMethod.BLOCK_AVERAGE, 0.15),
+    ],
+)
+def test_resample_anti_aliasing(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    time: np.ndarray,
+    method: EnumResampleMethod,
+    max_alias: float,
+    jitter: bool,
+):
+    t = time
+    if jitter:
+        rng = np.random.default_rng(0)
+        t = t + 0.2 * DT_SAMPLES * rng.uniform(size=len(t))
+        t[0] = 0.0
+
+    # a tone below the Nyquist frequency (50Hz) is preserved
+    result = resample_uniform(t, tone(t, 2.0), dt=DT, N=N, method=method)
+    assert_arrays_close(result, tone(DT * np.arange(N), 2.0), eps=0.01)
+
+    # a tone above the Nyquist frequency would alias to 10Hz
+    result = resample_uniform(t, tone(t, 90.0), dt=DT, N=N, method=method)
+    test.assertLessEqual(np.max(np.abs(result)), max_alias)
+    if method == EnumResampleMethod.LINEAR:
+        test.assertGreater(np.max(np.abs(result)), 0.9)
+    return
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.maths import *
+from src.thirdparty.types import *
+from tests.thirdparty.unit import *
+
+from src.models.user import *
+from src.algorithms.rows import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# FIXTURES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@mark.parametrize(
+    ('skip', 'expected', 'trivial'),
+    [
+        (3, (3, 0), True),
+        ([], (0, 0), True),
+        ([0, 2], (1, 1), True),
+        ([0, 1, 3, 4], (2, 2), True),
+        ([1], (0, 1), True),
+        ([0, 3, -1], (1, 0), False),
+        ('lambda i: i == 2', (0, 0), False),
+        ('lambda i: i in [0, 2]', (1, 1), False),
+        (DataSkipRule(start=0, stop=2), (2, 0), True),
+        ([0, DataSkipRule(start=2, step=2)], (1, 1), False),
+        (DataSkipRule(column='Comment', pattern='^#'), (0, 0), False),
+    ],
+)
+def test_row_filter_split(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    skip: int | list[int | DataSkipRule] | str | DataSkipRule,
+    expected: tuple[int, int],
+    trivial: bool,
+):
+    rows = get_row_filter(skip)
+    header, after = rows.split()
+    test.assertEqual((header, after), expected)
+    test.assertEqual(rows.is_trivial(header + after + 1), trivial)
+    return
+
+
+@mark.parametrize(
+    ('skip', 'expected'),
+    [
+        ([0, 3, 5], [0, 3, 5]),
+        ('lambda i: i % 3 == 1', [1, 4, 7]),
+        # non-vectorisable functions are applied row by row, errors count as `False`
+        ('lambda i: 1 / (i - 2) > 0.2', [3, 4, 5, 6]),
+        ('not a function', []),
+        (DataSkipRule(start=2, stop=8, step=3), [2, 5]),
+        (DataSkipRule(start=1, expr='i % 4 == 1'), [1, 5]),
+        (DataSkipRule(column='Comment', pattern='^#'), [2, 6]),
+        (DataSkipRule(start=4, column='Comment', pattern='^#'), [6]),
+        ([1, DataSkipRule(expr='np.isin(i, [3, 7])')], [1, 3, 7]),
+    ],
+)
+def test_row_filter_mask(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    skip: int | list[int | DataSkipRule] | str | DataSkipRule,
+    expected: list[int],
+):
+    rows = np.arange(8)
+    comments = np.asarray(['', '', '# a', 'b', '', '', '#', 'c'], dtype=object)
+    mask = get_row_filter(skip).mask(rows, columns={'Comment': comments})
+    test.assertEqual(rows[mask].tolist(), expected)
+    return
+
+
+def test_row_filter_invalid(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    with assert_raises(ValueError):
+        get_row_filter(DataSkipRule(expr='i %'))
+    with assert_raises(ValueError):
+        get_row_filter(DataSkipRule(start=0)).split()
+    return
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.maths import *
+from src.thirdparty.types import *
+from tests.thirdparty.unit import *
+
+from src.setup import config
+from src.algorithms.cycles import *
+from src.algorithms.fit import *
+from src.algorithms.peaks import *
+from src.algorithms.points import *
+from src.algorithms.stream import *
+from src.models.internal import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# FIXTURES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@fixture(scope='module')
+def signal() -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Synthetic pressure-like signal with a period of `0.8` sampled every `0.01`.
+    '''
+    rng = np.random.default_rng(0)
+    t = np.arange(0, 48, 0.01)
+    phase = 2 * np.pi * t / 0.8
+    x = (
+        10
+        + 15 * np.maximum(np.sin(phase), 0) ** 1.5
+        + 2 * np.sin(2 * phase + 0.3)
+        + 0.2 * rng.standard_normal(len(t))
+    )
+    return t, x
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@mark.parametrize('sig_gap', [2.0, math.inf])
+@mark.parametrize(('chunk_min', 'chunk_max'), [(1, 2), (1, 40), (100, 500)])
+def test_stream_engine(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    signal: tuple[np.ndarray, np.ndarray],
+    chunk_min: int,
+    chunk_max: int,
+    sig_gap: float,
+):
+    t, x = signal
+    conds = config.POLY.pressure
+    points = sort_special_points_specs(config.POINTS.pressure)
+    engine = StreamEngine(conds=conds, points=points, warmup=400, sig_gap=sig_gap)
+
+    rng = np.random.default_rng(1)
+    beats = []
+    buffer_max = 0
+    i = 0
+    while i < len(t):
+        n = int(rng.integers(chunk_min, chunk_max + 1))
+        beats.extend(engine.push(t[i : i + n], x[i : i + n]))
+        buffer_max = max(buffer_max, len(engine.x))
+        i += n
+
+    # memory is bounded
+    test.assertLessEqual(buffer_max, engine.capacity + chunk_max)
+    test.assertEqual(engine.duration, 80)
+
+    # beats run from peak to peak, as the cycles of the offline method
+    peaks, _ = get_extremes(x)
+    cycles = CycleIndex.from_labels(get_cycles(ext=peaks, N=len(x), remove_gaps=False))
+    windows = [window for window, k in zip(cycles.windows(), cycles.ids) if k >= 0]
+    test.assertEqual(len(windows), len(peaks) - 1)
+    test.assertEqual([beat.index for beat in beats], list(range(len(beats))))
+    for beat in beats:
+        test.assertEqual(beat.time, t[beat.window[0]])
+    if sig_gap == math.inf:
+        test.assertEqual(engine.num_rejected, 0)
+        test.assertEqual([beat.window for beat in beats], windows)
+    else:
+        # NOTE: cycles are rejected relative to the recent (not all) cycles.
+        test.assertEqual(len(beats) + engine.num_rejected, len(windows))
+        test.assertTrue(set(beat.window for beat in beats) <= set(windows))
+
+    # fits agree with the offline method
+    cycles = [-1] * len(t)
+    for beat in beats:
+        i1, i2 = beat.window
+        cycles[i1:i2] = [beat.index] * (i2 - i1)
+    fitinfos = dict(fit_poly_cycles(t=t, x=x, cycles=cycles, conds=conds))
+    for beat in beats:
+        info = fitinfos[beat.window]
+        scale = max(np.abs(info.coefficients))
+        assert_arrays_close(beat.info.coefficients, info.coefficients, eps=1e-8 * scale)
+
+    # each beat has its own recognised points
+    for beat in beats:
+        test.assertEqual(set(beat.points.keys()), set(key for key, _ in points))
+    times = [beat.points['dia'].time for beat in beats]
+    test.assertGreater(len(set(times)), 1)
+    test.assertTrue(all(0 <= tt <= 1 for tt in times))
+    return
+
+
+def test_stream_engine_reset(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    signal: tuple[np.ndarray, np.ndarray],
+):
+    t, x = signal
+    conds = config.POLY.pressure
+    points = sort_special_points_specs(config.POINTS.pressure)
+    engine = StreamEngine(conds=conds, points=points, warmup=400)
+
+    engine.push(t[:800], x[:800])
+    test.assertIsNotNone(engine.peak)
+
+    # signal is lost
+    with patch('src.algorithms.stream.log_warn') as log_warn:
+        engine.push(t[800:1600], np.full((800,), x[800]))
+    log_warn.assert_called()
+    test.assertIsNone(engine.peak)
+    test.assertLessEqual(len(engine.x), engine.capacity)
+    return
+
+
+def test_stream_engine_unrecognised_beats(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    signal: tuple[np.ndarray, np.ndarray],
+):
+    t, x = signal
+    conds = config.POLY.pressure
+    points = sort_special_points_specs(config.POINTS.pressure)
+    engine = StreamEngine(conds=conds, points=points, warmup=400)
+
+    # beats without recognisable points are skipped (without exiting)
+    with (
+        patch(
+            'src.algorithms.stream.recognise_special_points',
+            side_effect=SpecialPointsNotFound('Could not find (dia)!'),
+        ),
+        patch('src.algorithms.stream.log_warn') as log_warn,
+    ):
+        beats = engine.push(t[:1600], x[:1600])
+    test.assertEqual(beats, [])
+    test.assertGreater(engine.num_rejected, 0)
+    log_warn.assert_called()
+
+    # other errors are not masked
+    with patch('src.algorithms.stream.recognise_special_points', side_effect=ValueError):
+        with assert_raises(ValueError):
+            engine.push(t[1600:3200], x[1600:3200])
+    return
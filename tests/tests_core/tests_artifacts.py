@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.data import *
+from src.thirdparty.maths import *
+from src.thirdparty.system import *
+from src.thirdparty.types import *
+from tests.thirdparty.unit import *
+
+from src.core.artifacts import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# FIXTURES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_fingerprint(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    data = pd.DataFrame({'time': [0.0, 0.5, 1.0], 'pressure': [1.0, 2.0, 3.0]})
+    test.assertEqual(fingerprint(data), fingerprint(data.copy()))
+    test.assertNotEqual(fingerprint(data), fingerprint(data.assign(pressure=[1.0, 2.0, 4.0])))
+    test.assertNotEqual(fingerprint(data), fingerprint(data.rename(columns={'pressure': 'p'})))
+    test.assertNotEqual(fingerprint(1), fingerprint('1'))
+    test.assertNotEqual(fingerprint([1, 2]), fingerprint((1, 2)))
+    test.assertNotEqual(fingerprint(np.asarray([1, 2])), fingerprint(np.asarray([1.0, 2.0])))
+    test.assertEqual(fingerprint({'a': np.arange(4)}), fingerprint({'a': np.arange(4)}))
+    return
+
+
+def test_artifact_cache_hits(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    tmp_path: Path,
+):
+    cache = ArtifactCache(path=str(tmp_path))
+    compute = MagicMock(return_value=np.arange(5))
+    key = cache.key('method', 1, 'a')
+
+    assert_arrays_equal(cache.get(key, compute), np.arange(5))
+    assert_arrays_equal(cache.get(key, compute), np.arange(5))
+    test.assertEqual(compute.call_count, 1, 'Value should only be computed on a cache-miss.')
+    test.assertEqual(cache.hits, 1)
+    test.assertEqual(cache.misses, 1)
+
+    # a fresh instance (e.g. in another process) reads the same artifact
+    other = ArtifactCache(path=str(tmp_path))
+    assert_arrays_equal(other.get(key, compute), np.arange(5))
+    test.assertEqual(compute.call_count, 1)
+
+    # keys depend on the context
+    other = ArtifactCache(path=str(tmp_path), context='other')
+    test.assertNotEqual(other.key('method', 1, 'a'), key)
+
+    cache.clear()
+    test.assertEqual(cache.size(), 0)
+    cache.get(key, compute)
+    test.assertEqual(compute.call_count, 2)
+    return
+
+
+def test_artifact_cache_eviction(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    tmp_path: Path,
+):
+    # room for 3 but not 4 artifacts
+    max_size = 3 * 2**14 + 2**10
+    cache = ArtifactCache(path=str(tmp_path), max_size=max_size)
+    keys = [cache.key('method', k) for k in range(3)]
+    for k, key in enumerate(keys):
+        cache.get(key, lambda: np.full((2**11,), k, dtype=float))
+        # ensure modification times are distinguishable
+        os.utime(cache.filename(key), (k, k))
+
+    # access first artifact, so that the second one becomes the least recently used one
+    assert_arrays_equal(cache.get(keys[0], lambda: None), np.zeros((2**11,)))
+    cache.get(cache.key('method', 3), lambda: np.full((2**11,), 3, dtype=float))
+
+    test.assertLessEqual(cache.size(), max_size)
+    test.assertTrue(os.path.exists(cache.filename(keys[0])))
+    test.assertFalse(os.path.exists(cache.filename(keys[1])), 'LRU artifact should be evicted.')
+    return
+
+
+def test_columnar_cache(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    tmp_path: Path,
+):
+    cache = ColumnarCache(path=str(tmp_path))
+    data = pd.DataFrame({'time': np.linspace(0, 1, 5), 'pressure': np.arange(5.0)})
+    compute = MagicMock(return_value=data)
+    key = cache.key('method', 1)
+
+    cache.get(key, compute)
+    test.assertTrue(cache.filename(key).endswith('.npz'))
+    result = cache.get(key, compute)
+    test.assertEqual(compute.call_count, 1)
+    test.assertEqual(list(result.columns), ['time', 'pressure'])
+    assert_arrays_equal(result['time'], data['time'])
+    assert_arrays_equal(result['pressure'], data['pressure'])
+    return
+
+
+def test_cached_artifact(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    tmp_path: Path,
+):
+    cache = get_artifact_cache()
+    path, enabled = cache.path, cache.enabled
+    configure_artifact_cache(path=str(tmp_path), enabled=True)
+    calls = MagicMock()
+
+    @cached_artifact(cfg=lambda cfg: cfg['relevant'])
+    def method(cfg: dict, x: np.ndarray, scale: float = 1.0) -> np.ndarray:
+        calls()
+        return scale * x
+
+    try:
+        x = np.arange(3.0)
+        assert_arrays_equal(method({'relevant': 1, 'other': 1}, x), x)
+        assert_arrays_equal(method({'relevant': 1, 'other': 2}, x, scale=1.0), x)
+        test.assertEqual(calls.call_count, 1, 'Irrelevant config should not affect the key.')
+        assert_arrays_equal(method({'relevant': 2, 'other': 2}, x), x)
+        assert_arrays_equal(method({'relevant': 1, 'other': 1}, x, 2.0), 2 * x)
+        test.assertEqual(calls.call_count, 3)
+
+        configure_artifact_cache(enabled=False)
+        method({'relevant': 1, 'other': 1}, x)
+        test.assertEqual(calls.call_count, 4, 'Disabled cache should always compute.')
+    finally:
+        configure_artifact_cache(path=path, enabled=enabled)
+    return
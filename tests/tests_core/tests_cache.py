@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.types import *
+from tests.thirdparty.unit import *
+
+from src.core.cache import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# FIXTURES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_lru_cache_counters(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    cache = LRUCache(maxsize=4)
+    compute = MagicMock(return_value=42)
+
+    test.assertEqual(cache.get('a', compute), 42)
+    test.assertEqual(cache.get('a', compute), 42)
+    test.assertEqual(cache.get('a', compute), 42)
+    test.assertEqual(compute.call_count, 1, 'Value should only be computed on a cache-miss.')
+    test.assertEqual(cache.hits, 2)
+    test.assertEqual(cache.misses, 1)
+
+    cache.clear()
+    test.assertEqual(len(cache), 0)
+    test.assertEqual(cache.info.hits, 0)
+    test.assertEqual(cache.info.misses, 0)
+    return
+
+
+def test_lru_cache_eviction(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    cache = LRUCache(maxsize=2)
+    cache.get('a', lambda: 1)
+    cache.get('b', lambda: 2)
+    # use 'a', so that 'b' becomes the least recently used entry
+    cache.get('a', lambda: -1)
+    cache.get('c', lambda: 3)
+
+    test.assertEqual(len(cache), 2)
+    test.assertIn('a', cache)
+    test.assertIn('c', cache)
+    test.assertNotIn('b', cache, 'Least recently used entry should be evicted.')
+    test.assertEqual(cache.get('a', lambda: -1), 1)
+    return
+
+
+def test_lru_cache_eviction_by_memory(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    cache = LRUCache(maxsize=10, maxbytes=5, sizeof=len)
+    cache.get('a', lambda: 'xx')
+    cache.get('b', lambda: 'yy')
+    test.assertEqual(cache.nbytes, 4)
+    cache.get('c', lambda: 'zz')
+
+    test.assertEqual(len(cache), 2)
+    test.assertNotIn('a', cache, 'Least recently used entry should be evicted.')
+    test.assertEqual(cache.nbytes, 4)
+
+    # entries larger than the bound are returned but not kept (nor evict other entries)
+    test.assertEqual(cache.get('d', lambda: 'x' * 6), 'x' * 6)
+    test.assertNotIn('d', cache)
+    test.assertEqual(len(cache), 2)
+    test.assertIn('b', cache)
+    test.assertIn('c', cache)
+    test.assertEqual(cache.nbytes, 4)
+    return
@@ -29,6 +29,62 @@ from src.core.poly import *
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 
+@mark.parametrize(
+    ('coeff',),
+    [
+        ([],),
+        ([2.0],),
+        ([1.0, -3.0, 0.5],),
+        ([0.1, 0.0, 2.0, -1.0, 4.0],),
+    ],
+)
+def test_poly(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    coeff: list[float],
+):
+    t = np.linspace(-1.5, 2.0, num=11)
+    expected = np.asarray([sum(c * tt**k for k, c in enumerate(coeff)) for tt in t])
+    assert_arrays_close(poly(t, *coeff), expected, eps=1e-10)
+    for tt, value in zip(t, expected):
+        test.assertAlmostEqual(poly_single(tt, *coeff), value, places=10)
+
+    # evaluation in place
+    out = np.full(shape=t.shape, fill_value=np.nan)
+    x = poly(t, *coeff, out=out)
+    test.assertIs(x, out)
+    assert_arrays_close(out, expected, eps=1e-10)
+    return
+
+
+def test_poly_batch(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    coeffs = np.asarray(
+        [
+            [1.0, 2.0, 0.0, -1.0],
+            [0.0, 0.0, 0.0, 0.0],
+            [-2.0, 0.5, 3.0, 1.0],
+        ]
+    )
+    lengths = [5, 0, 7]
+    offsets = np.cumsum([0] + lengths)
+    t = np.linspace(0.0, 1.0, num=offsets[-1])
+    x = poly_batch(t, coeffs, offsets)
+    test.assertEqual(x.shape, t.shape)
+    for k in range(len(lengths)):
+        i1, i2 = offsets[k : k + 2]
+        assert_arrays_close(x[i1:i2], poly(t[i1:i2], *coeffs[k]), eps=1e-12)
+
+    out = np.empty_like(t)
+    test.assertIs(poly_batch(t, coeffs, offsets, out=out), out)
+    assert_arrays_close(out, x, eps=1e-12)
+    return
+
+
 @mark.parametrize(
     ('coeff', 't0', 'coeff_r'),
     [
@@ -133,6 +189,72 @@ def test_get_derivative_coefficients(
     return
 
 
+def test_get_real_polynomial_roots_batch(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    coeffs = [
+        [-3, 0, 8, 1],
+        [0, 0, -4, 1],
+        [1, 0, 1],
+        [2.0],
+        [],
+        [0, 0, 0],
+        [0.25, -1.25, 1],
+        [-0.5, 1, 0, 0],
+    ]
+    roots = get_real_polynomial_roots_batch(coeffs)
+    test.assertEqual(len(roots), len(coeffs))
+    for coeff, roots_ in zip(coeffs, roots):
+        assert_arrays_close(roots_, get_real_polynomial_roots(coeff), eps=1e-12)
+
+    # restriction to interval
+    roots = get_real_polynomial_roots_batch(coeffs, t_min=0.0, t_max=1.0)
+    for coeff, roots_ in zip(coeffs, roots):
+        expected = [t for t in get_real_polynomial_roots(coeff) if 0.0 <= t <= 1.0]
+        assert_arrays_close(roots_, expected, eps=1e-12)
+    return
+
+
+@mark.parametrize(
+    ('zeroes', 'eps'),
+    [
+        ([0.2, 0.5, 1, 1], 1e-6),
+        ([-0.2, 0.4, 0.9, 1, 1], 1e-6),
+        ([0.25, 0.25, 0.75, 0.75], 1e-6),
+        ([0.5, 0.5, 0.5], 1e-4),
+        ([0.1 * k for k in range(1, 11)], 1e-9),
+    ],
+)
+def test_get_real_polynomial_roots_multiple(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    # test parameters
+    zeroes: list[float],
+    eps: float,
+):
+    # NOTE: the eigenvalues for multiple roots are typically split into conjugate pairs
+    coeff = np.poly(zeroes)[::-1].tolist()
+    roots = get_real_polynomial_roots(coeff)
+    assert_arrays_close(roots, sorted(zeroes), eps=eps)
+    return
+
+
+def test_get_real_polynomial_roots_near_real(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    # NOTE: conjugate pairs close to, but not on, the real axis are not roots
+    for b in [1e-3, 1e-5, 1e-7]:
+        coeff = np.poly([0.5 + b * 1j, 0.5 - b * 1j, 0.2]).real[::-1].tolist()
+        roots = get_real_polynomial_roots(coeff)
+        assert_arrays_close(roots, [0.2], eps=1e-12)
+    return
+
+
 @mark.parametrize(
     ('coeff', 'n', 'expected'),
     [
@@ -169,6 +291,24 @@ def test_get_integral_coefficients(
     return
 
 
+@mark.parametrize(('n',), [(0,), (1,), (2,), (3,), (5,)])
+def test_get_derivative_coefficients_batch(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    n: int,
+):
+    coeffs = np.asarray([[1.0, 2.0, -3.0, 0.5, 4.0], [0.0, -1.0, 0.0, 2.0, 1.0]])
+    coeffs_der = get_derivative_coefficients_batch(coeffs, n=n)
+    test.assertEqual(coeffs_der.shape, (2, max(5 - n, 0)))
+    for k in range(2):
+        coeff = coeffs[k].tolist()
+        for _ in range(n):
+            coeff = get_derivative_coefficients(coeff)
+        assert_arrays_close(coeffs_der[k], coeff, eps=1e-12)
+    return
+
+
 @mark.parametrize(
     ('coeff', 'n', 'expected'),
     [
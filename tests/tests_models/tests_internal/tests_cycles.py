@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.maths import *
+from src.thirdparty.types import *
+from tests.thirdparty.unit import *
+
+from src.algorithms.cycles import *
+from src.models.internal import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+LABELS = [0, 0, 0, 1, 1, 2, 2, 2]
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# FIXTURES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_cycle_index(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    index = CycleIndex.from_labels(LABELS)
+    assert_arrays_equal(index.offsets, [0, 3, 5, 8])
+    assert_arrays_equal(index.ids, [0, 1, 2])
+    test.assertEqual(len(index), 3)
+    test.assertEqual(index.N, 8)
+    test.assertEqual(index.window(1), (3, 5))
+    test.assertEqual(index.windows(), [(0, 3), (3, 5), (5, 8)])
+    test.assertEqual(cycles_to_windows(LABELS), index.windows())
+    assert_arrays_equal(index.labels(), LABELS)
+
+    # lookups
+    assert_arrays_equal(index.locate(np.arange(8)), LABELS)
+    t = 0.5 * np.arange(8)
+    assert_arrays_equal(index.locate_time(t, [-1.0, 0.0, 1.4, 1.5, 3.9]), [-1, 0, 0, 1, 2])
+
+    # empty series
+    index = CycleIndex.from_labels([])
+    test.assertEqual(len(index), 0)
+    test.assertEqual(index.windows(), [])
+    return
+
+
+def test_cycle_index_select(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    index = CycleIndex.from_labels(LABELS)
+
+    index_view = index.view(2, 6)
+    test.assertEqual(index_view.windows(), [(0, 1), (1, 3), (3, 4)])
+    assert_arrays_equal(index_view.labels(), LABELS[2:6])
+
+    # removal of rows (incl. an entire cycle)
+    keep = np.asarray([True, False, True, False, False, True, True, False])
+    index_select = index.select(keep)
+    assert_arrays_equal(index_select.labels(), np.asarray(LABELS)[keep])
+    assert_arrays_equal(index_select.ids, [0, 2])
+
+    index_rotated = CycleIndex.from_labels(np.roll(LABELS, -3))
+    assert_arrays_equal(index_rotated.ids, [1, 2, 0])
+    return
+
+
+def test_get_cycles(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    cycles = get_cycles(ext=[2, 12, 22, 32], N=40, remove_gaps=False)
+    test.assertIsInstance(cycles, np.ndarray)
+    assert_arrays_equal(cycles[:2], [-1, -1])
+    assert_arrays_equal(cycles[32:], [-1] * 8)
+    index = CycleIndex.from_labels(cycles[cycles >= 0])
+    assert_arrays_equal(index.offsets, [0, 10, 20, 30])
+    assert_arrays_equal(index.ids, [0, 1, 2])
+    return
+
+
+def test_get_rotation_indices(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    indices = get_rotation_indices(6, windows=[(0, 3), (3, 6)], shifts=[1, 0])
+    assert_arrays_equal(indices, [1, 2, 0, 3, 4, 5])
+
+    # agrees with rotating each window separately (rows outside windows are fixed)
+    x = np.arange(20)
+    windows = [(1, 5), (5, 12), (12, 18)]
+    shifts = [3, 0, 5]
+    expected = x.copy()
+    for (i1, i2), i0 in zip(windows, shifts):
+        expected[i1:i2] = np.roll(x[i1:i2], -i0)
+    assert_arrays_equal(x[get_rotation_indices(20, windows=windows, shifts=shifts)], expected)
+    assert_arrays_equal(get_rotation_indices(4, windows=[], shifts=[]), np.arange(4))
+    return
@@ -13,6 +13,8 @@ from src.core.poly import *
 from src.models.internal.poly import *
 from src.models.internal.poly import force_poly_condition
 from src.models.internal.poly import force_poly_conditions
+from src.models.internal.poly import ip_basis_basis
+from src.models.internal.poly import ip_poly_poly
 from src.models.internal import *
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -116,3 +118,125 @@ def test_force_poly_conditions(
         x = Q[:, j]
         assert_array_close_to_zero(A @ x, eps=1e-6)
     return
+
+
+@mark.parametrize(
+    ('deg', 't1', 't2'),
+    [
+        (4, 0.0, 1.0),
+        (6, 0.0, 2.5),
+        (5, -1.0, 1.0),
+    ],
+)
+def test_ip_basis_basis(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    deg: int,
+    t1: float,
+    t2: float,
+):
+    rng = np.random.default_rng(7)
+    B = rng.standard_normal((deg + 1, 3))
+    S = ip_basis_basis(B, t1=t1, t2=t2)
+    test.assertEqual(S.shape, (3, 3))
+    assert_arrays_close(S, S.T, eps=1e-12)
+    for j1 in range(3):
+        for j2 in range(3):
+            s = ip_poly_poly(B[:, j1], B[:, j2], t1=t1, t2=t2)
+            test.assertAlmostEqual(S[j1, j2], s, places=8)
+
+    # compare with (exact) Gauss-Legendre quadrature
+    nodes, weights = np.polynomial.legendre.leggauss(deg + 1)
+    tt = t1 + (t2 - t1) * (nodes + 1) / 2
+    P = np.vander(tt, N=deg + 1, increasing=True) @ B
+    S_quad = (P.T * weights) @ P / 2
+    assert_arrays_close(S, S_quad, eps=1e-8)
+    return
+
+
+def test_onb_conditions_cached(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    clear_onb_cache()
+    conds = [
+        PolyDerCondition(derivative=0, time=0.0),
+        PolyDerCondition(derivative=0, time=1.0),
+        PolyDerCondition(derivative=3, time=1.0),
+    ]
+    Q = onb_conditions(deg=6, conds=conds)
+    Q1 = onb_conditions_cached(deg=6, conds=conds)
+    assert_arrays_close(Q1, Q, eps=1e-10)
+
+    # order and repetition of conditions should not matter
+    Q2 = onb_conditions_cached(deg=6, conds=conds[::-1] + conds[:1])
+    test.assertIs(Q2, Q1)
+    info = get_onb_cache_info()
+    test.assertEqual(info.misses, 1)
+    test.assertEqual(info.hits, 1)
+
+    # different degree or interval => different ONB
+    onb_conditions_cached(deg=7, conds=conds)
+    onb_conditions_cached(deg=6, conds=conds, t1=0.0, t2=2.0)
+    info = get_onb_cache_info()
+    test.assertEqual(info.misses, 3)
+    test.assertEqual(info.size, 3)
+
+    with assert_raises(ValueError):
+        Q1[0, 0] = 1.0
+
+    clear_onb_cache()
+    return
+
+
+@mark.parametrize(
+    ('periodic', 'in_standard_basis', 'chunk_size'),
+    [
+        (False, True, 2**20),
+        (True, True, 2**20),
+        (False, False, 2**20),
+        (True, True, 8),
+        (False, True, 1),
+    ],
+)
+def test_onb_spectrum_batch(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    periodic: bool,
+    in_standard_basis: bool,
+    chunk_size: int,
+):
+    conds = [
+        PolyDerCondition(derivative=0, time=0.0),
+        PolyDerCondition(derivative=0, time=1.0),
+        PolyDerCondition(derivative=1, time=0.0),
+    ]
+    Q = onb_conditions(deg=6, conds=conds)
+    rng = np.random.default_rng(4)
+    lengths = [12, 1, 2, 30, 7]
+    t = [np.linspace(0, 1, num=n, endpoint=False) for n in lengths]
+    x = [rng.standard_normal(n) for n in lengths]
+    offsets = np.cumsum([0] + lengths)
+
+    coeffs = onb_spectrum_batch(
+        Q=Q,
+        t=np.concatenate(t),
+        x=np.concatenate(x),
+        offsets=offsets,
+        T=1.0,
+        periodic=periodic,
+        in_standard_basis=in_standard_basis,
+        chunk_size=chunk_size,
+    )
+    test.assertEqual(
+        coeffs.shape, (len(lengths), Q.shape[0] if in_standard_basis else Q.shape[1])
+    )
+    for k, (tt, xx) in enumerate(zip(t, x)):
+        coeff = onb_spectrum(
+            Q=Q, t=tt, x=xx, T=1.0, periodic=periodic, in_standard_basis=in_standard_basis
+        )
+        assert_arrays_close(coeffs[k], coeff, eps=1e-8)
+    return
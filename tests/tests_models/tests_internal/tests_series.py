@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.data import *
+from src.thirdparty.maths import *
+from src.thirdparty.types import *
+from tests.thirdparty.unit import *
+
+from src.core.artifacts import *
+from src.models.internal import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+DT = 0.01
+N = 40
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# FIXTURES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@fixture(scope='function')
+def series() -> CycleSeries:
+    series = CycleSeries(N=N)
+    series['pressure'] = np.arange(N, dtype=float)
+    series['cycle'] = np.arange(N) // 10
+    series.set_time_axis(TimeAxis(dt=DT, N=N))
+    return series
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_series_columns(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    series: CycleSeries,
+):
+    test.assertEqual(len(series), N)
+    test.assertEqual(series.keys(), ['pressure', 'cycle'])
+    test.assertIn('pressure', series)
+    test.assertNotIn('time', series, 'Time axis is implicit.')
+    assert_arrays_equal(series.time(), TimeAxis(dt=DT, N=N).to_numpy())
+    with test.assertRaises(ValueError):
+        series['volume'] = np.zeros((N + 1,))
+
+    # preallocated columns share one buffer
+    buffer = series.allocate(['pressure[fit]', 'd[1,t]pressure[fit]'], fill_value=0.0)
+    buffer[1] = 1.0
+    assert_arrays_equal(series['d[1,t]pressure[fit]'], np.ones((N,)))
+    test.assertTrue(np.shares_memory(series['pressure[fit]'], buffer))
+
+    # copies own their columns
+    series_copy = series.copy()
+    series_copy['pressure'][:] = 0.0
+    test.assertEqual(series['pressure'][1], 1.0)
+    return
+
+
+def test_series_view_select(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    series: CycleSeries,
+):
+    t = series.time()
+
+    cycle = series.view(10, 20)
+    test.assertEqual(len(cycle), 10)
+    test.assertTrue(np.shares_memory(cycle['pressure'], series['pressure']))
+    assert_arrays_equal(cycle.time(), t[10:20])
+
+    selected = series.select(series['cycle'] >= 2)
+    test.assertTrue(np.shares_memory(selected['pressure'], series['pressure']))
+    test.assertEqual(selected.time_axis(), TimeAxis(dt=DT, N=20, offset=20))
+
+    # non-contiguous selections are copied and times materialised
+    selected = series.select(series['cycle'] != 1)
+    test.assertFalse(np.shares_memory(selected['pressure'], series['pressure']))
+    test.assertIsNone(selected.time_axis())
+    assert_arrays_equal(selected.time(), np.concatenate([t[:10], t[20:]]))
+    return
+
+
+def test_series_rotate_frame(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    series: CycleSeries,
+):
+    t = series.time()
+    rotated = series.rotate(7)
+    assert_arrays_equal(rotated['pressure'], np.roll(np.arange(N), -7))
+    assert_arrays_equal(rotated.time(), np.roll(t, -7))
+
+    data = rotated.to_frame()
+    test.assertEqual(list(data.columns), ['time', 'pressure', 'cycle'])
+    assert_arrays_equal(data['time'], rotated.time())
+    assert_arrays_equal(CycleSeries.from_frame(data)['pressure'], rotated['pressure'])
+
+    # permutation of rows along the fixed time axis
+    series.set_time_axis(TimeAxis(dt=DT, N=N), key='time[orig]')
+    indices = np.roll(np.arange(N), -3)
+    permuted = series.take(indices, fixed=['time'])
+    assert_arrays_equal(permuted['pressure'], series['pressure'][indices])
+    assert_arrays_equal(permuted.time('time[orig]'), t[indices])
+    test.assertEqual(permuted.time_axis(), series.time_axis())
+
+    # implicit axes are part of fingerprints
+    other = series.copy()
+    other.set_time_axis(TimeAxis(dt=2 * DT, N=N))
+    test.assertEqual(fingerprint(series), fingerprint(series.copy()))
+    test.assertNotEqual(fingerprint(series), fingerprint(other))
+    return
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.maths import *
+from src.thirdparty.types import *
+from tests.thirdparty.unit import *
+
+from src.models.internal import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+DT = 0.01
+N = 50
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# FIXTURES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_time_axis(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+):
+    t = np.linspace(start=0.0, stop=N * DT, num=N, endpoint=False)
+    axis = TimeAxis(dt=DT, N=N)
+    test.assertEqual(len(axis), N)
+    assert_arrays_equal(axis.to_numpy(), t)
+
+    axis_select = axis.select(10, 20)
+    test.assertEqual(len(axis_select), 10)
+    assert_arrays_equal(axis_select.to_numpy(), t[10:20])
+    assert_arrays_equal(axis_select.select(2, 5).to_numpy(), t[12:15])
+
+    axis_rotated = axis.rotate(7)
+    assert_arrays_equal(axis_rotated.to_numpy(), np.roll(t, -7))
+    assert_arrays_equal(axis_rotated.rotate(N - 7).to_numpy(), t)
+    test.assertIsNone(axis_select.rotate(3), 'Rotation of a proper selection.')
+    return
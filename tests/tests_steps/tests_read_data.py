@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from types import SimpleNamespace
+
+from src.thirdparty.data import *
+from src.thirdparty.maths import *
+from src.thirdparty.system import *
+from src.thirdparty.types import *
+from tests.thirdparty.unit import *
+
+from src.core.inputs import *
+from src.models.enums import *
+from src.models.user import *
+from src.models.internal import *
+from src.steps.step_read_data import *
+from src.steps.step_read_data import read_columns
+from src.steps.step_combine_data import *
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES / CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+#
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# FIXTURES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+@fixture(
+    scope='function',
+    params=[
+        'pandas',
+        param('pyarrow', marks=mark.skipif(pa is None, reason='requires pyarrow')),
+    ],
+)
+def parser(request) -> Iterator[str]:
+    '''
+    The csv-parser used by `step_read_data`.
+    '''
+    if request.param == 'pandas':
+        with patch('src.steps.step_read_data.pa_csv', None):
+            yield request.param
+    else:
+        yield request.param
+
+
+@fixture(scope='function')
+def cfg_data(tmp_path: Path) -> DataTimeSeries:
+    '''
+    A csv-file with a meta line, a line of units and an unused column.
+    '''
+    rng = np.random.default_rng(0)
+    t = 2.0 * np.arange(4000)
+    x = 10 + 5 * np.sin(2 * np.pi * t / 800) + 0.1 * rng.standard_normal(len(t))
+    path = tmp_path / 'pressure.csv'
+    with open(path, 'w') as fp:
+        fp.write('Meta: synthetic\nrow;Time;Pressure;Other\n;ms;mmHg;-\n')
+        for i, (tt, xx) in enumerate(zip(t, x)):
+            fp.write(f'{i};{tt:.3f};{xx:.5f};{-xx:.5f}\n')
+    return DataTimeSeries(
+        path=os.path.relpath(path),
+        sep=';',
+        decimal='.',
+        skip=[0, 2],
+        time=DataTypeQuantity(name='Time', unit='ms'),
+        value=DataTypeQuantity(name='Pressure', unit='mmHg'),
+    )
+
+
+@fixture(scope='function')
+def signal() -> tuple[np.ndarray, np.ndarray]:
+    t = 0.002 * np.arange(1000)
+    x = 10 + 5 * np.sin(2 * np.pi * t / 0.8)
+    return t, x
+
+
+def write_binary(
+    path: Path,
+    fmt: EnumInputFormat,
+    t: np.ndarray,
+    x: np.ndarray,
+    structured: bool = True,
+) -> str:
+    '''
+    Writes the columns `Time` and `Pressure` (and an unused column) in a binary format.
+
+    NOTE: If not `structured`, `.npy` files contain a plain 2d-array
+    (i.e. the columns are `0`, `1`, `2`).
+    '''
+    columns = {'Other': -x, 'Time': t, 'Pressure': x}
+    match fmt:
+        case EnumInputFormat.NPY if not structured:
+            np.save(path, np.stack(list(columns.values()), axis=1))
+        case EnumInputFormat.NPY:
+            arr = np.zeros(len(t), dtype=[(key, '<f8') for key in columns])
+            for key, col in columns.items():
+                arr[key] = col
+            np.save(path, arr)
+        case EnumInputFormat.RAW:
+            with open(path, 'wb') as fp:
+                fp.write(b'\x00' * 16)
+                np.stack(list(columns.values()), axis=1).astype('<f4').tofile(fp)
+            with open(f'{path}.yaml', 'w') as fp:
+                fp.write(f'dtype: float32\ncolumns: [{", ".join(columns)}]\noffset: 16\n')
+        case EnumInputFormat.PARQUET:
+            pa_parquet.write_table(pa.table(columns), path)
+        case EnumInputFormat.ARROW:
+            table = pa.table(columns)
+            with pa.ipc.new_file(str(path), table.schema) as writer:
+                writer.write_table(table)
+    return os.path.relpath(path)
+
+
+def is_memory_mapped(arr: np.ndarray) -> bool:
+    while arr is not None:
+        if isinstance(arr, np.memmap):
+            return True
+        arr = getattr(arr, 'base', None)
+    return False
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_step_read_data(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    cfg_data: DataTimeSeries,
+):
+    data = step_read_data(cfg_data, 'pressure')
+    test.assertEqual(list(data.columns), ['time', 'pressure'])
+    test.assertEqual(len(data), 4000)
+    # ms -> s
+    assert_arrays_close(data['time'][:3], [0.0, 0.002, 0.004])
+
+    with assert_raises(KeyError):
+        step_read_data(cfg_data.copy(update={'value': DataTypeQuantity(name='P', unit='mmHg')}), 'pressure')  # fmt: skip
+    return
+
+
+@mark.parametrize('decimal', ['.', ','])
+def test_step_read_data_skip_rules(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    tmp_path: Path,
+    decimal: str,
+):
+    path = tmp_path / 'pressure.csv'
+    with open(path, 'w') as fp:
+        fp.write('Meta: synthetic\nTime;Pressure;Flag\nms;mmHg;-\n')
+        for i in range(100):
+            # rows to be skipped need not be numeric
+            if i % 10 == 5:
+                fp.write(f'{i};n/a;# invalid\n')
+            else:
+                fp.write(f'{i};{i}.5;ok\n'.replace('.', decimal))
+    cfg_data = DataTimeSeries(
+        path=os.path.relpath(path),
+        sep=';',
+        decimal=decimal,
+        skip=[0, 2, DataSkipRule(column='Flag', pattern='^#')],
+        time=DataTypeQuantity(name='Time', unit='s'),
+        value=DataTypeQuantity(name='Pressure', unit='Pa'),
+    )
+    expected = [i for i in range(100) if i % 10 != 5]
+    data = step_read_data(cfg_data, 'pressure')
+    assert_arrays_equal(data['time'], expected)
+    assert_arrays_equal(data['pressure'], np.asarray(expected) + 0.5)
+
+    # legacy + equivalent declarative specifications
+    for skip in [
+        'lambda i: i in [0, 2] or (i > 2 and i % 10 == 8)',
+        [0, 2, DataSkipRule(start=3, expr='i % 10 == 8')],
+    ]:
+        cfg = cfg_data.copy(update={'skip': skip})
+        data = step_read_data(cfg, 'pressure')
+        assert_arrays_equal(data['time'], expected)
+        chunks = list(step_read_data_chunks(cfg.copy(update={'chunksize': 7}), 'pressure'))
+        assert_arrays_equal(np.concatenate([t for t, _ in chunks]), expected)
+    return
+
+
+def test_step_read_data_skip_rules_blank_lines(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    tmp_path: Path,
+    parser: str,
+):
+    path = tmp_path / 'pressure.csv'
+    with open(path, 'w') as fp:
+        fp.write('Meta: synthetic\nTime;Pressure\nms;mmHg\n')
+        for i in range(20):
+            # blank lines are dropped by the parser, but count as rows of the file
+            if i in [2, 6]:
+                fp.write('\n' if i == 2 else '  \t\n')
+            fp.write(f'{i};{i}.5\n')
+    cfg_data = DataTimeSeries(
+        path=os.path.relpath(path),
+        sep=';',
+        skip=[0, 2, 7, 12],
+        time=DataTypeQuantity(name='Time', unit='s'),
+        value=DataTypeQuantity(name='Pressure', unit='Pa'),
+    )
+    expected = [i for i in range(20) if i not in [3, 7]]
+    data = step_read_data(cfg_data, 'pressure')
+    assert_arrays_equal(data['time'], expected)
+    assert_arrays_equal(data['pressure'], np.asarray(expected) + 0.5)
+
+    # file scanned in blocks, which split lines
+    with patch('src.steps.step_read_data.BLOCKSIZE', 5):
+        chunks = list(step_read_data_chunks(cfg_data.copy(update={'chunksize': 4}), 'pressure'))
+    assert_arrays_equal(np.concatenate([t for t, _ in chunks]).astype(float), expected)
+    return
+
+
+def test_step_read_data_whitespace_lines(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    tmp_path: Path,
+    parser: str,
+):
+    # e.g. a trailing line consisting of whitespace
+    path = tmp_path / 'pressure.csv'
+    with open(path, 'w') as fp:
+        fp.write('Time;Pressure\n')
+        fp.write(''.join(f'{i};{i}.5\n' for i in range(5)))
+        fp.write('  \n')
+    cfg_data = DataTimeSeries(
+        path=os.path.relpath(path),
+        sep=';',
+        time=DataTypeQuantity(name='Time', unit='s'),
+        value=DataTypeQuantity(name='Pressure', unit='Pa'),
+    )
+    data = step_read_data(cfg_data, 'pressure')
+    assert_arrays_equal(data['time'], range(5))
+    assert_arrays_equal(data['pressure'], np.arange(5) + 0.5)
+    return
+
+
+def test_step_read_data_cached(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    cfg_data: DataTimeSeries,
+    tmp_path: Path,
+):
+    cache = get_input_cache()
+    path, persist = cache.disk.path, cache.disk.enabled
+    configure_input_cache(path=str(tmp_path / 'cache'), persist=True)
+    try:
+        with patch('src.steps.step_read_data.read_columns', wraps=read_columns) as parse:
+            data = step_read_data(cfg_data, 'pressure')
+            data['pressure'] = 0.0
+            other = step_read_data(cfg_data, 'pressure')
+            test.assertEqual(parse.call_count, 1, 'File should only be parsed once.')
+            test.assertFalse(
+                np.all(other['pressure'] == 0), 'Cached data must not be modified.'
+            )
+
+            # different settings of the columns
+            step_read_data(cfg_data.copy(update={'time': DataTypeQuantity(name='Time', unit='s')}), 'pressure')  # fmt: skip
+            test.assertEqual(parse.call_count, 2)
+
+            # on-disk layer (e.g. in the next run)
+            cache.memory.clear()
+            assert_arrays_equal(step_read_data(cfg_data, 'pressure'), other)
+            test.assertEqual(parse.call_count, 2)
+
+            # modification of the file
+            with open(cfg_data.path.__root__, 'a') as fp:
+                fp.write('4000;8000.000;1.00000;-1.00000\n')
+            test.assertEqual(len(step_read_data(cfg_data, 'pressure')), 4001)
+            test.assertEqual(parse.call_count, 3)
+    finally:
+        clear_input_cache()
+        configure_input_cache(path=path, persist=persist)
+    return
+
+
+@mark.parametrize('chunksize', [17, 999, 10**6])
+def test_step_normalise_data_chunks(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    cfg_data: DataTimeSeries,
+    chunksize: int,
+):
+    combine = SimpleNamespace(unit='ms', dt=10.0, t_max=None, method=EnumResampleMethod.LINEAR)
+    case = SimpleNamespace(process=SimpleNamespace(combine=combine))
+    data = step_normalise_data(case, step_read_data(cfg_data, 'pressure'), quantity='pressure')
+
+    cfg_data = cfg_data.copy(update={'chunksize': chunksize})
+    chunks = step_read_data_chunks(cfg_data, 'pressure')
+    data_chunks = step_normalise_data_chunks(case, chunks, quantity='pressure')
+
+    test.assertEqual(data.keys(), data_chunks.keys())
+    test.assertEqual(data_chunks.time_axis(), data.time_axis())
+    assert_arrays_close(data_chunks.time(), data.time())
+    assert_arrays_close(data_chunks['pressure'], data['pressure'])
+    return
+
+
+def test_step_combine_data(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    cfg_data: DataTimeSeries,
+):
+    combine = SimpleNamespace(unit='ms', dt=10.0, t_max=None, method=EnumResampleMethod.LINEAR)
+    case = SimpleNamespace(process=SimpleNamespace(combine=combine))
+    data_pressure = step_read_data(cfg_data, 'pressure')
+    data_volume = data_pressure.rename(columns={'pressure': 'volume'})
+    data = step_combine_data(case, data_pressure=data_pressure, data_volume=data_volume)
+    data_p = step_normalise_data(case, data_pressure, quantity='pressure')
+
+    test.assertIsInstance(data, CycleSeries)
+    test.assertEqual(data.keys(), ['pressure', 'volume'])
+    test.assertEqual(data.time_axis(), data_p.time_axis())
+    assert_arrays_close(data['pressure'], data_p['pressure'])
+    test.assertEqual(list(data.to_frame().columns), ['time', 'pressure', 'volume'])
+    return
+
+
+@mark.parametrize(
+    'fmt',
+    [
+        EnumInputFormat.NPY,
+        EnumInputFormat.RAW,
+        param(
+            EnumInputFormat.PARQUET, marks=mark.skipif(pa is None, reason='requires pyarrow')
+        ),
+        param(EnumInputFormat.ARROW, marks=mark.skipif(pa is None, reason='requires pyarrow')),
+    ],
+)
+def test_step_read_data_binary(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    tmp_path: Path,
+    signal: tuple[np.ndarray, np.ndarray],
+    fmt: EnumInputFormat,
+):
+    t, x = signal
+    path = write_binary(tmp_path / f'pressure.{fmt.value}', fmt, t, x)
+    cfg_data = DataTimeSeries(
+        path=path,
+        format=fmt,
+        time=DataTypeQuantity(name='Time', unit='ms'),
+        value=DataTypeQuantity(name='Pressure', unit='Pa'),
+    )
+    eps = 1e-5 if fmt == EnumInputFormat.RAW else 1e-12
+    data = step_read_data(cfg_data, 'pressure')
+    test.assertEqual(list(data.columns), ['time', 'pressure'])
+    assert_arrays_close(data['time'], 0.001 * t, eps=eps)
+    assert_arrays_close(data['pressure'], x, eps=eps * 10)
+
+    chunks = list(step_read_data_chunks(cfg_data.copy(update={'chunksize': 300}), 'pressure'))
+    test.assertEqual([len(t_) for t_, _ in chunks], [300, 300, 300, 100])
+    assert_arrays_close(np.concatenate([x_ for _, x_ in chunks]), data['pressure'])
+
+    with assert_raises(KeyError):
+        step_read_data(cfg_data.copy(update={'value': DataTypeQuantity(name='P', unit='Pa')}), 'pressure')  # fmt: skip
+    return
+
+
+def test_step_read_data_npy_2d(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    tmp_path: Path,
+    signal: tuple[np.ndarray, np.ndarray],
+):
+    t, x = signal
+    path = write_binary(tmp_path / 'pressure.npy', EnumInputFormat.NPY, t, x, structured=False)
+    cfg_data = DataTimeSeries(
+        path=path,
+        format=EnumInputFormat.NPY,
+        time=DataTypeQuantity(name='1', unit='ms'),
+        value=DataTypeQuantity(name='2', unit='Pa'),
+    )
+    data = step_read_data(cfg_data, 'pressure')
+    assert_arrays_close(data['time'], 0.001 * t)
+    assert_arrays_close(data['pressure'], x)
+
+    chunks = list(step_read_data_chunks(cfg_data.copy(update={'chunksize': 300}), 'pressure'))
+    assert_arrays_close(np.concatenate([x_ for _, x_ in chunks]), x)
+
+    with assert_raises(KeyError):
+        step_read_data(cfg_data.copy(update={'value': DataTypeQuantity(name='3', unit='Pa')}), 'pressure')  # fmt: skip
+    return
+
+
+def test_step_read_data_memory_mapped(
+    test: TestCase,
+    debug: Callable[..., None],
+    module: Callable[[str], str],
+    tmp_path: Path,
+    signal: tuple[np.ndarray, np.ndarray],
+):
+    t, x = signal
+    path = write_binary(tmp_path / 'pressure.npy', EnumInputFormat.NPY, t, x)
+    cfg_data = DataTimeSeries(
+        path=path,
+        format=EnumInputFormat.NPY,
+        time=DataTypeQuantity(name='Time', unit='ms'),
+        value=DataTypeQuantity(name='Pressure', unit='Pa'),
+    )
+    data = step_read_data(cfg_data, 'pressure')
+    # NOTE: columns are only copied if their units need to be converted
+    test.assertFalse(is_memory_mapped(data['time'].to_numpy()))
+    test.assertTrue(is_memory_mapped(data['pressure'].to_numpy()))
+    return
@@ -12,6 +12,7 @@ from pytest import fixture
 from pytest_lazyfixture import lazy_fixture
 from pytest import LogCaptureFixture
 from pytest import mark
+from pytest import param
 from pytest import raises as assert_raises
 from testfixtures import LogCapture
 from unittest import TestCase
@@ -117,5 +118,6 @@ __all__ = [
     'itertools_product',
     'lazy_fixture',
     'mark',
+    'param',
     'patch',
 ]